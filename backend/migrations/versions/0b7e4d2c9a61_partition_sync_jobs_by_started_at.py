@@ -0,0 +1,156 @@
+"""partition sync_jobs by started_at: daily range partitions plus a default partition, (id, started_at) primary key, sync_jobs_create_partitions() helper
+
+Revision ID: 0b7e4d2c9a61
+Revises: f1a6d3c8b259
+Create Date: 2026-10-19 18:57:36.904412
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b7e4d2c9a61'
+down_revision: Union[str, Sequence[str], None] = 'f1a6d3c8b259'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+PARTITIONS_AHEAD = 7
+# Days of existing jobs given their own partition; older rows go to the
+# default partition, which SyncJobPartitionService purges after rollup.
+RETENTION_DAYS = 30
+
+PARTITION_FUNCTION = """
+CREATE OR REPLACE FUNCTION sync_jobs_create_partitions(first_day date, last_day date)
+RETURNS void
+LANGUAGE plpgsql AS $$
+DECLARE
+    day date;
+    partition_name text;
+    day_start timestamptz;
+    day_end timestamptz;
+BEGIN
+    FOR day IN SELECT generate_series(first_day, last_day, interval '1 day')::date LOOP
+        partition_name := 'sync_jobs_p' || to_char(day, 'YYYYMMDD');
+        CONTINUE WHEN to_regclass(partition_name) IS NOT NULL;
+        day_start := day::timestamp AT TIME ZONE 'UTC';
+        day_end := (day + 1)::timestamp AT TIME ZONE 'UTC';
+
+        CREATE TEMP TABLE sync_jobs_moving (LIKE sync_jobs);
+        WITH moved AS (
+            DELETE FROM sync_jobs_default
+            WHERE started_at >= day_start AND started_at < day_end
+            RETURNING *
+        )
+        INSERT INTO sync_jobs_moving SELECT * FROM moved;
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF sync_jobs FOR VALUES FROM (%L) TO (%L)',
+            partition_name, day_start, day_end
+        );
+        INSERT INTO sync_jobs SELECT * FROM sync_jobs_moving;
+        DROP TABLE sync_jobs_moving;
+    END LOOP;
+END
+$$
+"""
+
+COLUMNS = (
+    "id, created_at, updated_at, deleted_at, task_id, user_id, type, status, "
+    "started_at, completed_at, error, result"
+)
+
+
+def _create_indexes() -> None:
+    op.create_index('ix_sync_jobs_started_at', 'sync_jobs', ['started_at'], unique=False)
+    op.create_index(
+        'ix_sync_jobs_status_type_started_at',
+        'sync_jobs',
+        ['status', 'type', sa.text('started_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index('ix_sync_jobs_status_type_started_at', table_name='sync_jobs')
+    op.drop_index('ix_sync_jobs_started_at', table_name='sync_jobs')
+    op.rename_table('sync_jobs', 'sync_jobs_unpartitioned')
+
+    op.create_table(
+        'sync_jobs',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('task_id', sa.String(), nullable=False),
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('type', sa.String(), nullable=False),
+        sa.Column('status', sa.String(), nullable=True),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('result', sa.JSON(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id', 'started_at', name='pk_sync_jobs'),
+        postgresql_partition_by='RANGE (started_at)',
+    )
+    op.create_index(op.f('ix_sync_jobs_task_id'), 'sync_jobs', ['task_id'], unique=False)
+    _create_indexes()
+
+    op.execute("CREATE TABLE sync_jobs_default PARTITION OF sync_jobs DEFAULT")
+    op.execute(PARTITION_FUNCTION)
+    # Partitions for the retention window (or back to the oldest job, if more
+    # recent), plus the days ahead.
+    op.execute(
+        "SELECT sync_jobs_create_partitions(greatest("
+        "(coalesce((SELECT min(coalesce(started_at, created_at)) FROM sync_jobs_unpartitioned),"
+        " now()) AT TIME ZONE 'UTC')::date, "
+        f"(now() AT TIME ZONE 'UTC')::date - {RETENTION_DAYS}), "
+        f"(now() AT TIME ZONE 'UTC')::date + {PARTITIONS_AHEAD})"
+    )
+    op.execute(
+        f"INSERT INTO sync_jobs ({COLUMNS}) "
+        "SELECT id, created_at, updated_at, deleted_at, task_id, user_id, type, status, "
+        "coalesce(started_at, created_at, now()), completed_at, error, result "
+        "FROM sync_jobs_unpartitioned"
+    )
+    op.drop_table('sync_jobs_unpartitioned')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_sync_jobs_status_type_started_at', table_name='sync_jobs')
+    op.drop_index('ix_sync_jobs_started_at', table_name='sync_jobs')
+    op.drop_index(op.f('ix_sync_jobs_task_id'), table_name='sync_jobs')
+    op.rename_table('sync_jobs', 'sync_jobs_partitioned')
+
+    op.create_table(
+        'sync_jobs',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('task_id', sa.String(), nullable=False),
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('type', sa.String(), nullable=False),
+        sa.Column('status', sa.String(), nullable=True),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('result', sa.JSON(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('id'),
+        sa.UniqueConstraint('task_id'),
+    )
+    op.execute(
+        f"INSERT INTO sync_jobs ({COLUMNS}) "
+        f"SELECT DISTINCT ON (task_id) {COLUMNS} FROM sync_jobs_partitioned "
+        "ORDER BY task_id, started_at DESC"
+    )
+    _create_indexes()
+    op.drop_table('sync_jobs_partitioned')
+    op.execute("DROP FUNCTION IF EXISTS sync_jobs_create_partitions(date, date)")
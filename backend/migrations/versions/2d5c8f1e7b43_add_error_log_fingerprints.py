@@ -0,0 +1,48 @@
+"""add error_logs fingerprint, count and first_seen for deduplicated error capture, index (level, timestamp)
+
+Revision ID: 2d5c8f1e7b43
+Revises: 0b7e4d2c9a61
+Create Date: 2026-10-19 19:36:52.217640
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2d5c8f1e7b43'
+down_revision: Union[str, Sequence[str], None] = '0b7e4d2c9a61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('error_logs', sa.Column('fingerprint', sa.String(), nullable=True))
+    op.add_column(
+        'error_logs',
+        sa.Column('count', sa.Integer(), server_default='1', nullable=False),
+    )
+    op.add_column(
+        'error_logs', sa.Column('first_seen', sa.DateTime(timezone=True), nullable=True)
+    )
+    op.create_unique_constraint(
+        'error_logs_fingerprint_key', 'error_logs', ['fingerprint']
+    )
+    op.create_index(
+        'ix_error_logs_level_timestamp',
+        'error_logs',
+        ['level', sa.text('timestamp DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_error_logs_level_timestamp', table_name='error_logs')
+    op.drop_constraint('error_logs_fingerprint_key', 'error_logs', type_='unique')
+    op.drop_column('error_logs', 'first_seen')
+    op.drop_column('error_logs', 'count')
+    op.drop_column('error_logs', 'fingerprint')
@@ -0,0 +1,85 @@
+"""add bookmark_counters: per-user total/unread counts for the library, folders and tags; make bookmarks.is_read non-null
+
+Revision ID: 3b7e91c4a0f6
+Revises: 8c41e07b2d95
+Create Date: 2026-10-19 11:26:54.302117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7e91c4a0f6'
+down_revision: Union[str, Sequence[str], None] = '8c41e07b2d95'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BACKFILL_ALL = """
+INSERT INTO bookmark_counters (id, user_id, scope, scope_id, total, unread, created_at, updated_at)
+SELECT gen_random_uuid(), b.user_id, 'all', b.user_id,
+       count(*), count(*) FILTER (WHERE NOT b.is_read), now(), now()
+FROM bookmarks b
+GROUP BY b.user_id
+"""
+
+BACKFILL_MEMBERSHIP = """
+INSERT INTO bookmark_counters (id, user_id, scope, scope_id, total, unread, created_at, updated_at)
+SELECT gen_random_uuid(), b.user_id, '{scope}', m.{column},
+       count(*), count(*) FILTER (WHERE NOT b.is_read), now(), now()
+FROM {table} m
+JOIN bookmarks b ON b.id = m.bookmark_id
+GROUP BY b.user_id, m.{column}
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("UPDATE bookmarks SET is_read = false WHERE is_read IS NULL")
+    op.alter_column(
+        'bookmarks',
+        'is_read',
+        existing_type=sa.Boolean(),
+        nullable=False,
+        server_default=sa.false(),
+    )
+    op.create_table(
+        'bookmark_counters',
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('scope', sa.String(), nullable=False),
+        sa.Column('scope_id', sa.UUID(), nullable=False),
+        sa.Column('total', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('unread', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('id'),
+        sa.UniqueConstraint('user_id', 'scope', 'scope_id', name='uq_bookmark_counters_scope'),
+    )
+    op.execute(BACKFILL_ALL)
+    op.execute(
+        BACKFILL_MEMBERSHIP.format(
+            scope='folder', column='folder_id', table='bookmarks_folders'
+        )
+    )
+    op.execute(
+        BACKFILL_MEMBERSHIP.format(scope='tag', column='tag_id', table='bookmarks_tags')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('bookmark_counters')
+    op.alter_column(
+        'bookmarks',
+        'is_read',
+        existing_type=sa.Boolean(),
+        nullable=True,
+        server_default=None,
+    )
@@ -0,0 +1,71 @@
+"""add search_vector to posts: generated tsvector column with a GIN index for full-text bookmark search
+
+Revision ID: 5f2a9c1d7e34
+Revises: d96bc9b69c92
+Create Date: 2026-10-19 09:12:41.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f2a9c1d7e34'
+down_revision: Union[str, Sequence[str], None] = 'd96bc9b69c92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCH_CONFIG_FUNCTION = """
+CREATE OR REPLACE FUNCTION posts_search_config(lang text)
+RETURNS regconfig
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT CASE lang
+        WHEN 'en' THEN 'english'::regconfig
+        WHEN 'es' THEN 'spanish'::regconfig
+        WHEN 'fr' THEN 'french'::regconfig
+        WHEN 'de' THEN 'german'::regconfig
+        WHEN 'pt' THEN 'portuguese'::regconfig
+        WHEN 'it' THEN 'italian'::regconfig
+        WHEN 'nl' THEN 'dutch'::regconfig
+        WHEN 'ru' THEN 'russian'::regconfig
+        ELSE 'simple'::regconfig
+    END
+$$
+"""
+
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector(posts_search_config(lang), coalesce(text, '')), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(text, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(SEARCH_CONFIG_FUNCTION)
+    op.add_column(
+        'posts',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        'ix_posts_search_vector',
+        'posts',
+        ['search_vector'],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_posts_search_vector', table_name='posts', postgresql_using='gin')
+    op.drop_column('posts', 'search_vector')
+    op.execute("DROP FUNCTION IF EXISTS posts_search_config(text)")
@@ -0,0 +1,40 @@
+"""add reverse indexes on bookmark associations: bookmarks_tags(tag_id, bookmark_id) and bookmarks_folders(folder_id, bookmark_id)
+
+Revision ID: 7f3a2b9e5d80
+Revises: e5c07a9d3f12
+Create Date: 2026-10-19 15:22:49.603517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7f3a2b9e5d80'
+down_revision: Union[str, Sequence[str], None] = 'e5c07a9d3f12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_bookmarks_tags_tag_id_bookmark_id',
+        'bookmarks_tags',
+        ['tag_id', 'bookmark_id'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_bookmarks_folders_folder_id_bookmark_id',
+        'bookmarks_folders',
+        ['folder_id', 'bookmark_id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_bookmarks_folders_folder_id_bookmark_id', table_name='bookmarks_folders')
+    op.drop_index('ix_bookmarks_tags_tag_id_bookmark_id', table_name='bookmarks_tags')
@@ -0,0 +1,51 @@
+"""add trigram indexes on authors: enable pg_trgm, gin_trgm_ops indexes on authors.name/username, index posts.author_id and bookmarks(user_id, post_id)
+
+Revision ID: 8c41e07b2d95
+Revises: 5f2a9c1d7e34
+Create Date: 2026-10-19 10:03:17.540962
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c41e07b2d95'
+down_revision: Union[str, Sequence[str], None] = '5f2a9c1d7e34'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_authors_username_trgm',
+        'authors',
+        ['username'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'username': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_authors_name_trgm',
+        'authors',
+        ['name'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'},
+    )
+    op.create_index(op.f('ix_posts_author_id'), 'posts', ['author_id'], unique=False)
+    op.create_index(
+        'ix_bookmarks_user_id_post_id', 'bookmarks', ['user_id', 'post_id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_bookmarks_user_id_post_id', table_name='bookmarks')
+    op.drop_index(op.f('ix_posts_author_id'), table_name='posts')
+    op.drop_index('ix_authors_name_trgm', table_name='authors', postgresql_using='gin')
+    op.drop_index('ix_authors_username_trgm', table_name='authors', postgresql_using='gin')
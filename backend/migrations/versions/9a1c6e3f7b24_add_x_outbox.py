@@ -0,0 +1,68 @@
+"""add x_outbox: pending bookmark writes to X, drained by a Celery worker
+
+Revision ID: 9a1c6e3f7b24
+Revises: 7f3a2b9e5d80
+Create Date: 2026-10-19 16:04:12.874390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a1c6e3f7b24'
+down_revision: Union[str, Sequence[str], None] = '7f3a2b9e5d80'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'x_outbox',
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('operation', sa.String(), nullable=False),
+        sa.Column('tweet_id', sa.String(), nullable=False),
+        sa.Column('status', sa.String(), server_default='pending', nullable=False),
+        sa.Column('attempts', sa.Integer(), server_default='0', nullable=False),
+        sa.Column(
+            'available_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('id'),
+    )
+    op.create_index(
+        'ix_x_outbox_pending_available_at',
+        'x_outbox',
+        ['available_at'],
+        unique=False,
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+    op.create_index(
+        'ix_x_outbox_user_id_tweet_id',
+        'x_outbox',
+        ['user_id', 'tweet_id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_x_outbox_user_id_tweet_id', table_name='x_outbox')
+    op.drop_index(
+        'ix_x_outbox_pending_available_at',
+        table_name='x_outbox',
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+    op.drop_table('x_outbox')
@@ -0,0 +1,28 @@
+"""add index on medias.post_id for the per-post media lookup in the feed query
+
+Revision ID: a4d2f8e6c1b3
+Revises: 3b7e91c4a0f6
+Create Date: 2026-10-19 12:41:08.774310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d2f8e6c1b3'
+down_revision: Union[str, Sequence[str], None] = '3b7e91c4a0f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_medias_post_id'), 'medias', ['post_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_medias_post_id'), table_name='medias')
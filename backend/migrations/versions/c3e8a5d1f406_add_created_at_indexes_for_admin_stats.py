@@ -0,0 +1,30 @@
+"""add created_at/started_at indexes for the admin stats overview: bookmarks(created_at), sync_jobs(started_at)
+
+Revision ID: c3e8a5d1f406
+Revises: 9a1c6e3f7b24
+Create Date: 2026-10-19 16:48:27.219054
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e8a5d1f406'
+down_revision: Union[str, Sequence[str], None] = '9a1c6e3f7b24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_bookmarks_created_at', 'bookmarks', ['created_at'], unique=False)
+    op.create_index('ix_sync_jobs_started_at', 'sync_jobs', ['started_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_sync_jobs_started_at', table_name='sync_jobs')
+    op.drop_index('ix_bookmarks_created_at', table_name='bookmarks')
@@ -0,0 +1,42 @@
+"""add daily_stats: per-day rollups of signups, bookmarks, sync jobs and X calls for the admin dashboard
+
+Revision ID: d7f2b4e9a1c5
+Revises: c3e8a5d1f406
+Create Date: 2026-10-19 17:21:05.447316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7f2b4e9a1c5'
+down_revision: Union[str, Sequence[str], None] = 'c3e8a5d1f406'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'daily_stats',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('metric', sa.String(), nullable=False),
+        sa.Column('dimension', sa.String(), server_default='', nullable=False),
+        sa.Column('value', sa.BigInteger(), server_default='0', nullable=False),
+        sa.Column('is_final', sa.Boolean(), server_default=sa.false(), nullable=False),
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('id'),
+        sa.UniqueConstraint('metric', 'day', 'dimension', name='uq_daily_stats_metric_day'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('daily_stats')
@@ -0,0 +1,58 @@
+"""add admin user search indexes: gin_trgm_ops indexes on users.email/username/name and users(created_at, id) for keyset pagination
+
+Revision ID: e4b9c2a7f813
+Revises: d7f2b4e9a1c5
+Create Date: 2026-10-19 17:58:42.306117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b9c2a7f813'
+down_revision: Union[str, Sequence[str], None] = 'd7f2b4e9a1c5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_users_email_trgm',
+        'users',
+        ['email'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'email': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_users_username_trgm',
+        'users',
+        ['username'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'username': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_users_name_trgm',
+        'users',
+        ['name'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_users_created_at_id', 'users', ['created_at', 'id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_users_created_at_id', table_name='users')
+    op.drop_index('ix_users_name_trgm', table_name='users', postgresql_using='gin')
+    op.drop_index('ix_users_username_trgm', table_name='users', postgresql_using='gin')
+    op.drop_index('ix_users_email_trgm', table_name='users', postgresql_using='gin')
@@ -0,0 +1,63 @@
+"""add feed sort keys to bookmarks: denormalized post_created_at/sort_text with composite (user_id, ...) indexes
+
+Revision ID: e5c07a9d3f12
+Revises: a4d2f8e6c1b3
+Create Date: 2026-10-19 14:05:37.219846
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5c07a9d3f12'
+down_revision: Union[str, Sequence[str], None] = 'a4d2f8e6c1b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'bookmarks',
+        sa.Column('post_created_at', sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column('bookmarks', sa.Column('sort_text', sa.Text(), nullable=True))
+    op.execute(
+        """
+        UPDATE bookmarks b
+        SET post_created_at = p.created_at_from_twitter,
+            sort_text = left(p.text, 256)
+        FROM posts p
+        WHERE p.id = b.post_id
+        """
+    )
+    op.create_index(
+        'ix_bookmarks_user_id_post_created_at',
+        'bookmarks',
+        ['user_id', sa.text('post_created_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+    op.create_index(
+        'ix_bookmarks_user_id_is_read_post_created_at',
+        'bookmarks',
+        ['user_id', 'is_read', sa.text('post_created_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+    op.create_index(
+        'ix_bookmarks_user_id_sort_text',
+        'bookmarks',
+        ['user_id', 'sort_text', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_bookmarks_user_id_sort_text', table_name='bookmarks')
+    op.drop_index('ix_bookmarks_user_id_is_read_post_created_at', table_name='bookmarks')
+    op.drop_index('ix_bookmarks_user_id_post_created_at', table_name='bookmarks')
+    op.drop_column('bookmarks', 'sort_text')
+    op.drop_column('bookmarks', 'post_created_at')
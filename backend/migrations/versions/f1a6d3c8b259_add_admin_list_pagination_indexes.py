@@ -0,0 +1,47 @@
+"""add admin list pagination indexes: admin_audit_logs (timestamp, id) and (action, timestamp, id), sync_jobs (status, type, started_at, id)
+
+Revision ID: f1a6d3c8b259
+Revises: e4b9c2a7f813
+Create Date: 2026-10-19 18:24:11.582930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1a6d3c8b259'
+down_revision: Union[str, Sequence[str], None] = 'e4b9c2a7f813'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_admin_audit_logs_timestamp',
+        'admin_audit_logs',
+        [sa.text('timestamp DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+    op.create_index(
+        'ix_admin_audit_logs_action_timestamp',
+        'admin_audit_logs',
+        ['action', sa.text('timestamp DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+    op.create_index(
+        'ix_sync_jobs_status_type_started_at',
+        'sync_jobs',
+        ['status', 'type', sa.text('started_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_sync_jobs_status_type_started_at', table_name='sync_jobs')
+    op.drop_index('ix_admin_audit_logs_action_timestamp', table_name='admin_audit_logs')
+    op.drop_index('ix_admin_audit_logs_timestamp', table_name='admin_audit_logs')
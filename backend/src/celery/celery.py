@@ -3,11 +3,11 @@ import os
 from celery import Celery
 from .celery_config import CeleryConfig
 from celery.schedules import crontab
+from celery.signals import setup_logging
 from src.utils.config import config
 from datetime import timedelta
 
-from opentelemetry.instrumentation.celery import CeleryInstrumentor
-from src.utils.telemetry import setup_telemetry 
+from src.utils.error_sink import install_error_log_sink
 
 bg_task = Celery(
     "src",
@@ -25,8 +25,26 @@ bg_task.config_from_object(CeleryConfig)
 # Only initialize when this process IS the worker.
 # Prevents polluting the FastAPI process when celery module is imported.
 if os.getenv("CELERY_WORKER") == "true":
+    from opentelemetry.instrumentation.celery import CeleryInstrumentor
+    from src.utils.log import configure_structlog
+    from src.utils.telemetry import setup_telemetry
+
     setup_telemetry(service_name="savestack-worker") #distinct name from your API
     CeleryInstrumentor().instrument()
+
+    # A setup_logging receiver stops Celery from replacing the root handlers
+    # at worker start, so structlog's level filter, sampling and the
+    # error_logs sink stay in place (forked pool processes inherit them).
+    @setup_logging.connect
+    def _configure_worker_logging(**kwargs):
+        configure_structlog()
+        install_error_log_sink(source="celery")
+
+    # opt-in per-task memory reports (see src/celery/profiling.py)
+    if os.getenv("CELERY_MEMORY_PROFILING") == "true":
+        from .profiling import enable_memory_profiling
+
+        enable_memory_profiling()
 # ─────────────────────────────────────────────────────────────────
 
 # interval = config.celery_beat_interval
@@ -39,6 +57,23 @@ bg_task.conf.beat_schedule = {
         'task': 'src.celery.task.fetch_user_id_for_backfill_task',
         'schedule': timedelta(minutes=5)
     },
+    # safety net: writes normally kick the drain themselves
+    'drain-x-outbox': {
+        'task': 'src.celery.task.drain_x_outbox_task',
+        'schedule': timedelta(minutes=1)
+    },
+    'rollup-daily-stats': {
+        'task': 'src.celery.task.rollup_daily_stats_task',
+        'schedule': timedelta(minutes=15)
+    },
+    'maintain-sync-job-partitions': {
+        'task': 'src.celery.task.maintain_sync_job_partitions_task',
+        'schedule': timedelta(hours=1)
+    },
+    'collect-health-snapshot': {
+        'task': 'src.celery.task.collect_health_snapshot_task',
+        'schedule': timedelta(seconds=30)
+    },
 }
 
 # Schedule,Crontab Code,Description
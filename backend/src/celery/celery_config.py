@@ -42,6 +42,9 @@ class CeleryConfig:
         Queue("fetch_user_id_for_backfill_task", routing_key="fetch_user_id_for_backfill_task"), #cron job
         
         Queue("backfill_bookmark_task", routing_key="backfill_bookmark_task"),
+
+        #x outbox
+        Queue("drain_x_outbox_task", routing_key="drain_x_outbox_task"),
     )
     
     
@@ -65,6 +68,11 @@ class CeleryConfig:
         "src.celery.task.backfill_bookmark_task": {
             "queue": "backfill_bookmark_task"
         },
+
+        # x outbox
+        "src.celery.task.drain_x_outbox_task": {
+            "queue": "drain_x_outbox_task"
+        },
     }
 
 
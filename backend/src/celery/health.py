@@ -0,0 +1,81 @@
+"""
+Worker-side sampling of queue, worker and Redis health.
+
+collect_health_snapshot_task runs this on a beat interval and stores the
+result with set_health_snapshot_sync; the admin health endpoints only read
+that snapshot, so no broker or broadcast round trip happens in a request.
+"""
+from datetime import datetime, timezone
+
+from .celery import bg_task
+from src.utils.redis import get_redis_sync
+from src.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+# How long to wait for workers to answer a control broadcast.
+INSPECT_TIMEOUT = 1.0  # seconds
+
+
+def _queue_depths() -> dict[str, int]:
+    """Ready messages in each configured queue, read with passive declares."""
+    depths = {}
+    with bg_task.connection_for_read() as conn:
+        channel = conn.default_channel
+        for queue in bg_task.conf.task_queues:
+            try:
+                _, messages, _ = channel.queue_declare(queue=queue.name, passive=True)
+            except Exception as e:
+                # the queue does not exist yet; AMQP closes the channel on that
+                logger.debug(f"Queue {queue.name} unavailable: {str(e)}")
+                channel = conn.channel()
+                continue
+            depths[queue.name] = messages
+    return depths
+
+
+def _worker_state() -> dict:
+    """Live workers and their executing / prefetched task counts."""
+    inspect = bg_task.control.inspect(timeout=INSPECT_TIMEOUT)
+    replies = inspect.ping() or {}
+    active = inspect.active() or {}
+    reserved = inspect.reserved() or {}
+    return {
+        "workers": sorted(replies),
+        "active_tasks": sum(len(tasks) for tasks in active.values()),
+        "reserved_tasks": sum(len(tasks) for tasks in reserved.values()),
+    }
+
+
+def _redis_memory() -> dict:
+    info = get_redis_sync().info("memory")
+    return {
+        "redis_memory_used_mb": info.get("used_memory", 0) / 1024 / 1024,
+        "redis_memory_total_mb": info.get("maxmemory", 0) / 1024 / 1024,
+    }
+
+
+def collect_health_snapshot() -> dict:
+    """
+    Sample the broker, the workers and Redis. Each source is independent:
+    one that fails is logged and left at its empty value.
+    """
+    snapshot = {
+        "sampled_at": datetime.now(timezone.utc).isoformat(),
+        "queues": {},
+        "workers": [],
+        "active_tasks": 0,
+        "reserved_tasks": 0,
+        "redis_memory_used_mb": 0,
+        "redis_memory_total_mb": 0,
+    }
+    for name, sample in (
+        ("broker queues", lambda: {"queues": _queue_depths()}),
+        ("workers", _worker_state),
+        ("redis memory", _redis_memory),
+    ):
+        try:
+            snapshot.update(sample())
+        except Exception as e:
+            logger.error(f"Health snapshot: sampling {name} failed: {str(e)}")
+    return snapshot
@@ -0,0 +1,215 @@
+"""
+Opt-in memory profiling for Celery workers (CELERY_MEMORY_PROFILING=true).
+
+For every task run it records, per task name:
+  - RSS before/after and the memory the run left behind (retained),
+  - the process's peak RSS and the Python heap peak during the run
+    (tracemalloc), exported as OTel histograms.
+Every PROFILE_TOP_EVERY-th run of a task also diffs tracemalloc snapshots
+taken around it and writes the top allocators to LOGS_DIR/memory/. Every
+PROFILE_SNAPSHOT_INTERVAL seconds a process-wide heap snapshot (top
+allocators and growth since the previous one) and a JSON summary of the
+per-task figures are written there too. A task whose runs keep retaining
+memory is logged as a warning, so it shows up in error_logs.
+
+tracemalloc slows allocation-heavy code noticeably; leave this off unless
+sizing worker_max_tasks_per_child / concurrency or chasing a leak.
+"""
+import os
+import resource
+import time
+import tracemalloc
+from collections import defaultdict, deque
+from datetime import datetime, timezone
+
+import orjson
+from celery.signals import task_postrun, task_prerun
+
+from src.utils.log import LOGS_DIR, get_logger
+
+logger = get_logger(__name__)
+
+MEMORY_REPORT_DIR = os.path.join(LOGS_DIR, "memory")
+TRACEMALLOC_FRAMES = 10
+PROFILE_TOP_EVERY = 20  # runs per task name between allocator reports
+PROFILE_SNAPSHOT_INTERVAL = 300  # seconds between process heap snapshots
+PROFILE_TOP_LIMIT = 25  # allocators listed per report
+# A task is flagged when each of its last GROWTH_WINDOW runs retained memory
+# and together they retained more than GROWTH_THRESHOLD_MB.
+GROWTH_WINDOW = 10
+GROWTH_THRESHOLD_MB = 20
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+_MB = 1024 * 1024
+
+# OTel histograms, created by enable_memory_profiling
+_histograms = {}
+
+
+def _current_rss_mb() -> float:
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * _PAGE_SIZE / _MB
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class _TaskStats:
+    def __init__(self):
+        self.runs = 0
+        self.max_rss_peak_mb = 0.0
+        self.max_heap_peak_mb = 0.0
+        self.retained_total_mb = 0.0
+        self.recent_retained = deque(maxlen=GROWTH_WINDOW)
+
+    def as_dict(self) -> dict:
+        return {
+            "runs": self.runs,
+            "max_rss_peak_mb": round(self.max_rss_peak_mb, 2),
+            "max_heap_peak_mb": round(self.max_heap_peak_mb, 2),
+            "mean_retained_mb": round(self.retained_total_mb / self.runs, 3)
+            if self.runs
+            else 0,
+        }
+
+
+_stats = defaultdict(_TaskStats)
+_running = {}  # task_id -> (rss_before, snapshot or None)
+_last_snapshot = {"at": 0.0, "snapshot": None}
+
+
+def _write_report(name: str, payload) -> None:
+    os.makedirs(MEMORY_REPORT_DIR, exist_ok=True)
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+    path = os.path.join(MEMORY_REPORT_DIR, f"{stamp}-{os.getpid()}-{name}")
+    mode = "wb" if isinstance(payload, bytes) else "w"
+    with open(path, mode) as report:
+        report.write(payload)
+
+
+def _format_stats(title: str, stats) -> str:
+    lines = [title]
+    for stat in stats[:PROFILE_TOP_LIMIT]:
+        lines.append(str(stat))
+        lines.extend(f"    {line}" for line in stat.traceback.format()[-3:])
+    return "\n".join(lines) + "\n"
+
+
+def _on_task_prerun(task_id=None, task=None, **kwargs):
+    # started on first use, so it runs in the pool process, not the parent
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+        logger.info(f"Memory profiling enabled in worker process {os.getpid()}")
+    stats = _stats[task.name]
+    snapshot = None
+    if stats.runs % PROFILE_TOP_EVERY == 0:
+        snapshot = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    _running[task_id] = (_current_rss_mb(), snapshot)
+
+
+def _on_task_postrun(task_id=None, task=None, **kwargs):
+    started = _running.pop(task_id, None)
+    if started is None:
+        return
+    rss_before, snapshot_before = started
+    try:
+        _record(task.name, rss_before, snapshot_before)
+    except Exception as e:
+        logger.error(f"Memory profiling failed for {task.name}: {str(e)}")
+
+
+def _record(task_name: str, rss_before: float, snapshot_before) -> None:
+    heap_peak = tracemalloc.get_traced_memory()[1] / _MB
+    rss_peak = _peak_rss_mb()
+    retained = _current_rss_mb() - rss_before
+
+    attributes = {"celery.task_name": task_name}
+    _histograms["rss_peak"].record(rss_peak, attributes)
+    _histograms["heap_peak"].record(heap_peak, attributes)
+    _histograms["retained"].record(retained, attributes)
+
+    stats = _stats[task_name]
+    stats.runs += 1
+    stats.max_rss_peak_mb = max(stats.max_rss_peak_mb, rss_peak)
+    stats.max_heap_peak_mb = max(stats.max_heap_peak_mb, heap_peak)
+    stats.retained_total_mb += retained
+    stats.recent_retained.append(retained)
+
+    window = stats.recent_retained
+    if (
+        len(window) == GROWTH_WINDOW
+        and all(delta > 0 for delta in window)
+        and sum(window) > GROWTH_THRESHOLD_MB
+    ):
+        logger.warning(
+            f"Memory growth in {task_name}: last {GROWTH_WINDOW} runs retained "
+            f"{sum(window):.1f} MB (pid {os.getpid()})"
+        )
+        window.clear()
+
+    if snapshot_before is not None:
+        diff = tracemalloc.take_snapshot().compare_to(snapshot_before, "traceback")
+        _write_report(
+            f"{task_name}.txt",
+            _format_stats(
+                f"Top allocations during {task_name} "
+                f"(heap peak {heap_peak:.1f} MB, retained {retained:.1f} MB)",
+                diff,
+            ),
+        )
+
+    _maybe_snapshot_heap()
+
+
+def _maybe_snapshot_heap() -> None:
+    now = time.monotonic()
+    if now - _last_snapshot["at"] < PROFILE_SNAPSHOT_INTERVAL:
+        return
+    snapshot = tracemalloc.take_snapshot()
+    report = _format_stats(
+        f"Heap top allocators (RSS {_current_rss_mb():.1f} MB)",
+        snapshot.statistics("traceback"),
+    )
+    if _last_snapshot["snapshot"] is not None:
+        report += "\n" + _format_stats(
+            "Growth since previous snapshot",
+            snapshot.compare_to(_last_snapshot["snapshot"], "traceback"),
+        )
+    _write_report("heap.txt", report)
+    _write_report(
+        "tasks.json",
+        orjson.dumps(
+            {name: stats.as_dict() for name, stats in _stats.items()},
+            option=orjson.OPT_INDENT_2,
+        ),
+    )
+    _last_snapshot.update(at=now, snapshot=snapshot)
+
+
+def enable_memory_profiling() -> None:
+    """Connect the profiling hooks; call from the worker before it forks."""
+    from opentelemetry import metrics
+
+    meter = metrics.get_meter(__name__)
+    _histograms.update(
+        rss_peak=meter.create_histogram(
+            "celery.task.memory.rss_peak",
+            unit="MB",
+            description="Process peak RSS after a task",
+        ),
+        heap_peak=meter.create_histogram(
+            "celery.task.memory.heap_peak",
+            unit="MB",
+            description="Python heap peak during a task (tracemalloc)",
+        ),
+        retained=meter.create_histogram(
+            "celery.task.memory.retained",
+            unit="MB",
+            description="RSS left behind by a task (after - before)",
+        ),
+    )
+    task_prerun.connect(_on_task_prerun, weak=False)
+    task_postrun.connect(_on_task_postrun, weak=False)
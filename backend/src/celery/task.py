@@ -6,11 +6,30 @@ import concurrent
 from src.utils.log import get_logger
 from .celery import bg_task
 from src.v1.service.twitter import TwitterService
+from src.v1.service.outbox import (
+    outbox_service,
+    OP_CREATE_BOOKMARK,
+    OP_DELETE_BOOKMARK,
+    OUTBOX_BATCH_SIZE,
+    OUTBOX_RATE_LIMIT_BACKOFF,
+)
+from src.v1.base.exception import ExternalAPIError
+from tenacity import stop_after_attempt
 from src.v1.service.user import UserService
 from src.v1.service.utils import get_valid_tokens
 from src.utils.db import get_async_db_session
 from src.v1.service.bookmark import BookmarkService
-from src.utils.redis import get_redis_sync
+from src.v1.service.admin import (
+    HealthService,
+    StatsRollupService,
+    SyncJobPartitionService,
+)
+from src.utils.redis import (
+    get_redis_sync,
+    publish_event_sync,
+    set_health_snapshot_sync,
+)
+from .health import collect_health_snapshot
 from datetime import datetime
 import logging
 
@@ -87,6 +106,23 @@ def run_async_in_sync(coro):
         future = executor.submit(_run_in_thread)
         return future.result()
 
+
+def _run_sync_and_notify(user_id, sync_type: str, coro):
+    """
+    Run a sync coroutine and publish sync_completed / sync_failed to the
+    user's event stream (GET /client/events). Saved pages already announced
+    themselves through bump_data_version's data_changed event.
+    """
+    try:
+        result = run_async_in_sync(coro)
+    except Exception:
+        publish_event_sync(user_id, "sync_failed", {"sync_type": sync_type})
+        raise
+    publish_event_sync(
+        user_id, "sync_completed", {"sync_type": sync_type, **(result or {})}
+    )
+    return result
+
     # --------------------------
     # Front sync Task
     # --------------------------
@@ -195,7 +231,9 @@ def front_sync_bookmark_task(self, user_id):
                     max_results=2,
                 )
 
-                logger.debug(f"X API raw response (front sync first page): {response}")
+                logger.debug(
+                    "x_api.response", phase="front_first_page", user_id=user_id, payload=response
+                )
                 bookmarks = response.get("data", [])
                 meta = response.get("meta", {})
                 next_token = meta.get("next_token")
@@ -266,7 +304,10 @@ def front_sync_bookmark_task(self, user_id):
                         pagination_token=next_token,
                     )
                     logger.debug(
-                        f"X API raw response (front sync second page): {response2}"
+                        "x_api.response",
+                        phase="front_second_page",
+                        user_id=user_id,
+                        payload=response2,
                     )
                     bookmarks2 = response2.get("data", [])
                     meta2 = response2.get("meta", {})
@@ -322,7 +363,7 @@ def front_sync_bookmark_task(self, user_id):
             )
             raise
 
-    return run_async_in_sync(_front_sync_bookmarks())
+    return _run_sync_and_notify(user_id, "front_sync", _front_sync_bookmarks())
 
     # --------------------------
     # BackFill Task
@@ -405,7 +446,9 @@ def backfill_bookmark_task(self, user_id):
                     pagination_token=next_token,
                 )
 
-                logger.debug(f"X API raw response (backfill): {response}")
+                logger.debug(
+                    "x_api.response", phase="backfill", user_id=user_id, payload=response
+                )
                 bookmarks = response.get("data", [])
                 meta = response.get("meta", {})
                 response_next_token = meta.get("next_token")
@@ -448,4 +491,172 @@ def backfill_bookmark_task(self, user_id):
             )
             raise
 
-    return run_async_in_sync(_fetch_back_fill_bookmarks())
+    return _run_sync_and_notify(user_id, "backfill", _fetch_back_fill_bookmarks())
+
+
+    # --------------------------
+    # X Outbox Task
+    # --------------------------
+
+
+# Outbox operations and the TwitterService call that performs each one.
+OUTBOX_OPERATIONS = {
+    OP_CREATE_BOOKMARK: TwitterService.create_bookmark,
+    OP_DELETE_BOOKMARK: TwitterService.delete_bookmark,
+}
+
+
+@shared_task(bind=True)
+def drain_x_outbox_task(self):
+    """
+    Push queued bookmark writes (x_outbox) to X.
+
+    - Leases a batch of due entries (FOR UPDATE SKIP LOCKED), oldest first
+    - Groups them per user so tokens are fetched once per user
+    - Calls X once per entry without tenacity's in-process retries; failures
+      are rescheduled with exponential backoff in the outbox instead
+    - On HTTP 429 defers the user's remaining entries by the rate-limit window
+    - Marks entries failed straight away on other 4xx errors from X
+    - Runs a front sync for users whose bookmarks were created
+    - Re-queues itself while full batches keep coming
+    """
+
+    async def _drain_outbox():
+        async with get_async_db_session() as db:
+            entries = await outbox_service.claim_batch(db, OUTBOX_BATCH_SIZE)
+            if not entries:
+                return {"processed": 0}
+
+            by_user = {}
+            for entry in entries:
+                by_user.setdefault(entry.user_id, []).append(entry)
+
+            done = 0
+            synced_users = set()
+            for user_id, user_entries in by_user.items():
+                error = None
+                try:
+                    tokens = await get_valid_tokens(str(user_id), db)
+                except Exception as e:
+                    tokens, error = None, f"Token error: {e}"
+                access_token = (tokens or {}).get("access_token")
+                x_id = (tokens or {}).get("x_id")
+                if not access_token or not x_id:
+                    error = error or "Missing access_token/x_id"
+                    logger.warning(f"Outbox: {error} for user_id={user_id}")
+                    for entry in user_entries:
+                        await outbox_service.record_failure(
+                            db, entry.id, entry.attempts, error
+                        )
+                    continue
+
+                for index, entry in enumerate(user_entries):
+                    call = OUTBOX_OPERATIONS[entry.operation].retry_with(
+                        stop=stop_after_attempt(1)
+                    )
+                    try:
+                        await call(
+                            twitter_service,
+                            access_token=access_token,
+                            user_id=str(user_id),
+                            x_id=int(x_id),
+                            tweet_id=entry.tweet_id,
+                        )
+                    except ExternalAPIError as e:
+                        if e.is_rate_limited:
+                            remaining = [
+                                pending.id for pending in user_entries[index:]
+                            ]
+                            logger.warning(
+                                f"Outbox: rate limited for user_id={user_id}, "
+                                f"deferring {len(remaining)} entries"
+                            )
+                            await outbox_service.defer(
+                                db, remaining, OUTBOX_RATE_LIMIT_BACKOFF
+                            )
+                            break
+                        await outbox_service.record_failure(
+                            db,
+                            entry.id,
+                            entry.attempts,
+                            str(e),
+                            permanent=not e.is_transient,
+                        )
+                        continue
+                    except Exception as e:
+                        await outbox_service.record_failure(
+                            db, entry.id, entry.attempts, str(e)
+                        )
+                        continue
+
+                    await outbox_service.complete(db, entry.id)
+                    done += 1
+                    if entry.operation == OP_CREATE_BOOKMARK:
+                        synced_users.add(str(user_id))
+
+        for user_id in synced_users:
+            front_sync_bookmark_task.delay(user_id)
+
+        if len(entries) == OUTBOX_BATCH_SIZE:
+            drain_x_outbox_task.delay()
+
+        logger.info(f"Outbox: processed {len(entries)} entries, {done} done")
+        return {"processed": len(entries), "done": done}
+
+    return run_async_in_sync(_drain_outbox())
+
+
+    # --------------------------
+    # Admin Stats Rollup Task
+    # --------------------------
+
+
+@shared_task(bind=True)
+def rollup_daily_stats_task(self):
+    """
+    Celery beat job: refresh the daily_stats rollups behind the admin
+    time-series endpoints (see StatsRollupService.rollup).
+    """
+
+    async def _rollup():
+        async with get_async_db_session() as db:
+            return await StatsRollupService(db).rollup()
+
+    return run_async_in_sync(_rollup())
+
+
+@shared_task(bind=True)
+def maintain_sync_job_partitions_task(self):
+    """
+    Celery beat job: create upcoming sync_jobs partitions and drop expired
+    ones (see SyncJobPartitionService.maintain).
+    """
+
+    async def _maintain():
+        async with get_async_db_session() as db:
+            return await SyncJobPartitionService(db).maintain()
+
+    return run_async_in_sync(_maintain())
+
+
+@shared_task(bind=True)
+def collect_health_snapshot_task(self):
+    """
+    Celery beat job: sample queue depths, worker liveness, Redis memory and
+    recent job failures into the snapshot read by GET /admin/health and
+    GET /admin/queues/stats.
+    """
+    snapshot = collect_health_snapshot()
+
+    async def _failed_jobs():
+        async with get_async_db_session() as db:
+            return await HealthService(db).count_failed_jobs()
+
+    try:
+        snapshot["failed_jobs"] = run_async_in_sync(_failed_jobs())
+    except Exception as e:
+        logger.error(f"Health snapshot: counting failed jobs failed: {str(e)}")
+        snapshot["failed_jobs"] = 0
+
+    set_health_snapshot_sync(snapshot)
+    return snapshot
@@ -1,12 +1,19 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 import uvicorn
 from contextlib import asynccontextmanager
-from src.utils.db import init_db, drop_db
+from src.utils.db import check_schema_version, drop_db
 from src.utils.redis import setup_redis
 from src.utils.config import Settings, config
 from src.utils.exception import register_error_handlers
 from src.utils.telemetry import setup_telemetry
 from src.utils.log import RequestContextMiddleware, configure_structlog
+from src.utils.error_sink import install_error_log_sink
+from src.utils.latency import (
+    LatencyMiddleware,
+    start_latency_flusher,
+    stop_latency_flusher,
+)
 from fastapi.middleware.cors import CORSMiddleware
 from src.v1.auth.routes import auth_router
 from src.v1.route.twitter import twitter_router
@@ -20,7 +27,7 @@ async def life_span(app: FastAPI):
     Lifecycle event handler for the FastAPI application.
 
     This asynchronous function is called when the FastAPI application starts up
-    and shuts down. It initializes the database on startup and performs cleanup
+    and shuts down. It checks the database schema on startup and performs cleanup
     on shutdown.
 
     Args:
@@ -32,22 +39,25 @@ async def life_span(app: FastAPI):
 
     # Run once at import time, to overide uvicorn setup
     configure_structlog()
+    install_error_log_sink(source="api")
 
-    # Startup: Initialize the database
+    # Startup: check the database is migrated (never changes the schema)
     print(f"server is starting....")
-    await init_db()
+    await check_schema_version()
     print(f"server has started!!")
 
     print(f"redis is starting....")
     await setup_redis()
     print(f"redis has started!!")
+    start_latency_flusher()
     yield  # Yield control back to FastAPI
 
     # Shutdown: Perform any necessary cleanup
     print(f"server is ending.....")
+    await stop_latency_flusher()
 
 
-app = FastAPI(lifespan=life_span)
+app = FastAPI(lifespan=life_span, default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -60,6 +70,9 @@ app.add_middleware(
 # Add request context middleware for structlog
 app.add_middleware(RequestContextMiddleware)
 
+# Per-route latency histograms (outermost, so it times the whole stack)
+app.add_middleware(LatencyMiddleware)
+
 # register error handlers
 register_error_handlers(app)
 
@@ -1,8 +1,11 @@
 from pathlib import Path
+from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Config(BaseSettings):
     DATABASE_URL: str 
+    # comma-separated read replica URLs; reads stay on DATABASE_URL when unset
+    DATABASE_REPLICA_URLS: Optional[str] = None
     app_id: str
     client_id: str
     client_secret: str
@@ -21,6 +24,8 @@ class Config(BaseSettings):
     celery_broker_url:str
     celery_result_backend:str
     app_env:str
+    # per-event log sampling overrides, e.g. "cache.hit=0.01,x_api.response=0.1"
+    LOG_SAMPLE_RATES: Optional[str] = None
 
     model_config = SettingsConfigDict(
         case_sensitive=False,
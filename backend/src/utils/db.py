@@ -1,16 +1,20 @@
+import itertools
+from pathlib import Path
 from typing import AsyncGenerator
+import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from .config import config
 from src.v1.base.model import Base, BaseModel
-from src.v1 import model
-from .config import config
 from sqlalchemy.exc import SQLAlchemyError
 from src.utils.log import get_logger
+from src.utils.redis import is_pinned_to_primary
 from sqlalchemy.pool import NullPool
 from contextlib import asynccontextmanager
 
 logger = get_logger(__name__)
 
+MIGRATIONS_DIR = Path(__file__).resolve().parent.parent.parent / "migrations"
+
 # Create async engine
 engine = create_async_engine(
     url=config.DATABASE_URL,
@@ -24,6 +28,36 @@ async_session = async_sessionmaker(
     bind=engine, class_=AsyncSession, expire_on_commit=False
 )
 
+# Optional read replicas (DATABASE_REPLICA_URLS), picked round-robin.
+replica_engines = [
+    create_async_engine(url=url.strip(), poolclass=NullPool, future=True)
+    for url in (config.DATABASE_REPLICA_URLS or "").split(",")
+    if url.strip()
+]
+replica_sessions = [
+    async_sessionmaker(bind=replica, class_=AsyncSession, expire_on_commit=False)
+    for replica in replica_engines
+]
+_replica_cycle = itertools.cycle(replica_sessions) if replica_sessions else None
+
+
+async def read_session_factory(user_id=None) -> async_sessionmaker:
+    """
+    Session factory for read-only work: the next replica, or the primary
+    when no replica is configured or the user wrote within
+    READ_YOUR_WRITES_WINDOW (see bump_data_version).
+    """
+    if _replica_cycle is None:
+        return async_session
+    if user_id is not None:
+        try:
+            if await is_pinned_to_primary(user_id):
+                return async_session
+        except Exception as e:
+            logger.error(f"Read routing falling back to primary: {str(e)}")
+            return async_session
+    return next(_replica_cycle)
+
 
 @asynccontextmanager
 # this helps in a way that, each internal async function in the bg task gets a new session, which prevent event loop or connection issue, coupled with the poolclass=NullPool param when creating the engine, it opens a new connection
@@ -46,6 +80,27 @@ async def get_async_db_session():
             await session.close()
 
 
+@asynccontextmanager
+async def get_async_read_session(user_id=None):
+    """
+    Get a read-only async session, routed like read_session_factory.
+    Nothing is committed.
+
+    Yields:
+        AsyncSession: Database session
+    """
+    session_factory = await read_session_factory(user_id)
+    async with session_factory() as session:
+        try:
+            yield session
+        except Exception as e:
+            logger.error(f"Database session error: {e}")
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+
 # # Create async session factory
 # AsyncSessionLocal = async_sessionmaker(
 #     engine, class_=AsyncSession, expire_on_commit=False
@@ -82,6 +137,8 @@ async def init_db():
     The function uses a connection from the engine and runs the create_all
     method synchronously within the asynchronous context.
     """
+    from src.v1 import model  # registers every table on Base.metadata
+
     try:
         async with engine.begin() as conn:
             # Use run_sync to call the synchronous create_all method in an async context
@@ -90,6 +147,101 @@ async def init_db():
         logger.error(f"error creating the db: {e}")
 
 
+def migration_heads() -> set:
+    """Head revision(s) of the Alembic scripts shipped with the code."""
+    from alembic.script import ScriptDirectory
+
+    return set(ScriptDirectory(str(MIGRATIONS_DIR)).get_heads())
+
+
+async def _stamp(conn, heads: set) -> None:
+    await conn.execute(
+        sa.text(
+            "CREATE TABLE IF NOT EXISTS alembic_version ("
+            "version_num VARCHAR(32) NOT NULL, "
+            "CONSTRAINT alembic_version_pkc PRIMARY KEY (version_num))"
+        )
+    )
+    await conn.execute(
+        sa.text("INSERT INTO alembic_version (version_num) VALUES (:head)"),
+        [{"head": head} for head in heads],
+    )
+
+
+async def bootstrap_schema():
+    """
+    Create an empty database from the models and stamp it at the migration
+    heads. Run once per database (`python -m src.utils.db init`); the
+    migrations assume the base tables exist, so `alembic upgrade head`
+    cannot start from an empty database.
+    """
+    from src.v1 import model  # registers every table on Base.metadata
+
+    heads = migration_heads()
+    async with engine.begin() as conn:
+        if (
+            await conn.execute(sa.text("SELECT to_regclass('alembic_version')"))
+        ).scalar() is not None:
+            raise RuntimeError(
+                "Database is already versioned; run `alembic upgrade head` instead"
+            )
+        await conn.run_sync(Base.metadata.create_all)
+        await _stamp(conn, heads)
+    logger.info(f"Created database schema at {sorted(heads)}")
+
+
+async def check_schema_version():
+    """
+    Check on startup that the database is migrated to the code's heads.
+
+    Costs one query and never changes the schema. An unversioned database
+    stops the startup with the command to run; one behind (or ahead of) the
+    code is reported: run `alembic upgrade head`.
+    """
+    try:
+        heads = migration_heads()
+    except Exception as e:
+        logger.warning(f"Skipping schema version check, no migrations: {e}")
+        return
+
+    try:
+        async with engine.connect() as conn:
+            versioned = (
+                await conn.execute(sa.text("SELECT to_regclass('alembic_version')"))
+            ).scalar() is not None
+            current = set()
+            if versioned:
+                result = await conn.execute(
+                    sa.text("SELECT version_num FROM alembic_version")
+                )
+                current = set(result.scalars().all())
+            populated = (
+                await conn.execute(sa.text("SELECT to_regclass('users')"))
+            ).scalar() is not None
+    except SQLAlchemyError as e:
+        logger.error(f"Schema version check failed: {e}")
+        return
+
+    if current == heads:
+        logger.info(f"Database schema is at {sorted(heads)}")
+        return
+
+    if not versioned:
+        if populated:
+            raise RuntimeError(
+                "Database has no alembic_version. Stamp the revision it matches "
+                "(`alembic stamp <revision>`), then run `alembic upgrade head`"
+            )
+        raise RuntimeError(
+            "Database is empty. Create the schema with `python -m src.utils.db init`"
+        )
+
+    logger.error(
+        f"Database schema is at {sorted(current)} but the code expects "
+        f"{sorted(heads)}; run `alembic upgrade head`"
+    )
+
+
 async def drop_db():
     """
     Drop all tables in the database.
@@ -100,9 +252,20 @@ async def drop_db():
 
     Caution: This operation will delete all data in the tables. Use with care.
     """
+    from src.v1 import model  # registers every table on Base.metadata
+
     try:
         async with engine.begin() as conn:
             # Use run_sync to call the synchronous drop_all method in an async context
             await conn.run_sync(Base.metadata.drop_all)
     except SQLAlchemyError as e:
         logger.error(f"error dropping the db: {e}")
+
+
+if __name__ == "__main__":
+    import asyncio
+    import sys
+
+    if sys.argv[1:] != ["init"]:
+        sys.exit("usage: python -m src.utils.db init")
+    asyncio.run(bootstrap_schema())
@@ -0,0 +1,179 @@
+"""
+Logging sink that fills the error_logs table.
+
+ErrorLogHandler sits on the root logger of the API and of the Celery
+workers. emit() only folds the record into an in-memory buffer keyed by a
+fingerprint (level, logger, message with numbers/IDs masked, exception
+type), so logging never waits on the database. A daemon thread writes the
+buffer every ERROR_LOG_FLUSH_INTERVAL seconds as one upsert per batch: each
+fingerprint is one error_logs row whose count and timestamp (last seen)
+are bumped on every recurrence.
+"""
+import hashlib
+import logging
+import os
+import re
+import sys
+import threading
+import time
+import traceback
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+ERROR_LOG_FLUSH_INTERVAL = 5  # seconds
+# Distinct fingerprints held between flushes; further ones are dropped and
+# counted, so a runaway loop cannot grow the buffer without bound.
+ERROR_LOG_BUFFER_LIMIT = 1000
+ERROR_LOG_MAX_MESSAGE = 4000
+ERROR_LOG_MAX_TRACE = 16000
+
+LEVEL_NAMES = {logging.ERROR: "ERROR", logging.WARNING: "WARN"}
+
+# UUIDs, hex IDs and numbers vary between occurrences of the same error.
+_VARIABLE_PARTS = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+    r"|0x[0-9a-fA-F]+|\d+"
+)
+
+# Records from these loggers are never captured: the sink's own writes
+# would otherwise feed back into it.
+_IGNORED_LOGGERS = ("sqlalchemy", __name__)
+
+
+def fingerprint(level: str, logger_name: str, message: str, exc_type: str) -> str:
+    normalized = _VARIABLE_PARTS.sub("#", message)
+    raw = f"{level}|{logger_name}|{exc_type}|{normalized}"
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+class ErrorLogHandler(logging.Handler):
+    def __init__(self, source: str):
+        super().__init__(level=logging.WARNING)
+        self.source = source
+        self._buffer: Dict[str, dict] = {}
+        self._dropped = 0
+        self._lock = threading.Lock()
+        self._flusher_pid: Optional[int] = None
+        self._engine = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.name.startswith(_IGNORED_LOGGERS):
+            return
+        try:
+            level = LEVEL_NAMES.get(record.levelno, "ERROR")
+            if isinstance(record.msg, dict):
+                # structlog event dict: the event alone, without bound context
+                message = str(record.msg.get("event", ""))
+            else:
+                message = record.getMessage()
+            message = message[:ERROR_LOG_MAX_MESSAGE]
+            trace = None
+            exc_type = ""
+            if record.exc_info and record.exc_info[0] is not None:
+                exc_type = record.exc_info[0].__name__
+                trace = "".join(traceback.format_exception(*record.exc_info))
+                trace = trace[-ERROR_LOG_MAX_TRACE:]
+            key = fingerprint(level, record.name, message, exc_type)
+            now = datetime.fromtimestamp(record.created, timezone.utc)
+
+            with self._lock:
+                entry = self._buffer.get(key)
+                if entry is not None:
+                    entry["count"] += 1
+                    entry["timestamp"] = now
+                    entry["message"] = message
+                    entry["trace"] = trace or entry["trace"]
+                elif len(self._buffer) >= ERROR_LOG_BUFFER_LIMIT:
+                    self._dropped += 1
+                else:
+                    self._buffer[key] = {
+                        "fingerprint": key,
+                        "level": level,
+                        "message": message,
+                        "trace": trace,
+                        "source": f"{self.source}:{record.name}",
+                        "count": 1,
+                        "first_seen": now,
+                        "timestamp": now,
+                    }
+            self._ensure_flusher()
+        except Exception:
+            self.handleError(record)
+
+    def _ensure_flusher(self) -> None:
+        # Started per process, so forked Celery children get their own thread.
+        if self._flusher_pid == os.getpid():
+            return
+        with self._lock:
+            if self._flusher_pid == os.getpid():
+                return
+            self._flusher_pid = os.getpid()
+            self._engine = None
+            threading.Thread(
+                target=self._flush_forever, name="error-log-flusher", daemon=True
+            ).start()
+
+    def _flush_forever(self) -> None:
+        while True:
+            time.sleep(ERROR_LOG_FLUSH_INTERVAL)
+            self.flush()
+
+    def _get_engine(self):
+        if self._engine is None:
+            import sqlalchemy as sa
+            from src.utils.config import config
+
+            url = sa.engine.make_url(config.DATABASE_URL).set(
+                drivername="postgresql+psycopg2"
+            )
+            self._engine = sa.create_engine(
+                url, pool_size=1, max_overflow=0, pool_pre_ping=True
+            )
+        return self._engine
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._buffer:
+                return
+            rows = list(self._buffer.values())
+            self._buffer = {}
+            dropped, self._dropped = self._dropped, 0
+
+        try:
+            from sqlalchemy.dialects.postgresql import insert as pg_insert
+            from src.v1.model import ErrorLog
+
+            stmt = pg_insert(ErrorLog)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[ErrorLog.fingerprint],
+                set_={
+                    "count": ErrorLog.count + stmt.excluded.count,
+                    "timestamp": stmt.excluded.timestamp,
+                    "message": stmt.excluded.message,
+                    "trace": stmt.excluded.trace,
+                    "source": stmt.excluded.source,
+                },
+            )
+            with self._get_engine().begin() as conn:
+                conn.execute(stmt, rows)
+        except Exception as e:
+            # stderr only: logging here would come straight back to this handler
+            print(
+                f"error_logs flush failed, {len(rows)} entries lost: {e}",
+                file=sys.stderr,
+            )
+        if dropped:
+            print(
+                f"error_logs buffer full, {dropped} records dropped", file=sys.stderr
+            )
+
+
+def install_error_log_sink(source: str) -> ErrorLogHandler:
+    """Attach an ErrorLogHandler to the root logger (once per process tree)."""
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers:
+        if isinstance(handler, ErrorLogHandler):
+            return handler
+    handler = ErrorLogHandler(source)
+    root_logger.addHandler(handler)
+    return handler
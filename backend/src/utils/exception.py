@@ -2,7 +2,7 @@ from typing import Any, Callable, Dict
 from fastapi import FastAPI, Request, HTTPException, status
 from src.v1.base.schema import ErrorResponse
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import ValidationError
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from starlette.exceptions import HTTPException as StarletteHTTPException
@@ -24,6 +24,7 @@ from src.v1.base.exception import (
     NotActive,
     BaseExceptionClass,
     ExternalAPIError,
+    NotModified,
 )
 from src.utils.log import get_logger
 
@@ -288,6 +289,14 @@ def register_error_handlers(app: FastAPI):
     general exception handlers
     """
 
+    @app.exception_handler(NotModified)
+    async def not_modified_handler(request: Request, exc: NotModified):
+        # Not an error: the client's cached copy is current.
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": exc.etag, "Cache-Control": "private, no-cache"},
+        )
+
     @app.exception_handler(HTTPException)
     async def http_exception_handler(request: Request, exc: HTTPException):
         exception_logger.error(f"HTTP {exc.status_code}: {exc.detail}", exc_info=True)
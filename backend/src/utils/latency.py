@@ -0,0 +1,210 @@
+"""
+Per-route request latency histograms.
+
+LatencyMiddleware records every request's duration into fixed log-spaced
+buckets, keyed by "<METHOD> <route template>" and status class (2xx, 4xx,
+...). Each worker keeps its counts in memory and a background task adds them
+to a per-minute Redis hash every LATENCY_FLUSH_INTERVAL seconds, so the
+percentiles read back with get_route_latencies cover every uvicorn worker.
+Durations are also recorded on an OTel histogram for the metrics pipeline.
+"""
+import asyncio
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from src.utils.log import get_logger
+from src.utils.redis import get_redis
+
+logger = get_logger(__name__)
+
+# Bucket upper bounds: 1ms to ~65s, four buckets per doubling, so a
+# percentile read from the buckets is within ~19% of the true value.
+LATENCY_BUCKETS_MS: List[float] = [round(2 ** (i / 4), 3) for i in range(65)]
+
+LATENCY_FLUSH_INTERVAL = 10  # seconds
+LATENCY_KEY_TTL = 2 * 3600  # seconds
+LATENCY_WINDOW_MINUTES = 5
+
+# Requests that never matched a route share one series instead of one per path.
+UNMATCHED_ROUTE = "unmatched"
+
+# Created on first record, so importing this module does not load OTel.
+_duration_histogram = None
+
+# (route, status_class) -> counts per bucket, last slot for overflow
+_pending: Dict[Tuple[str, str], List[int]] = defaultdict(
+    lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1)
+)
+_flusher: Optional[asyncio.Task] = None
+
+
+def latency_key(minute: datetime) -> str:
+    return f"latency:{minute.strftime('%Y%m%d%H%M')}"
+
+
+def _get_duration_histogram():
+    global _duration_histogram
+    if _duration_histogram is None:
+        from opentelemetry import metrics
+
+        _duration_histogram = metrics.get_meter(__name__).create_histogram(
+            "http.server.route.duration",
+            unit="ms",
+            description="Request duration by route template and status class",
+        )
+    return _duration_histogram
+
+
+def record_latency(route: str, status_class: str, duration_ms: float) -> None:
+    """Count one request in this worker's pending histogram."""
+    bucket = bisect_left(LATENCY_BUCKETS_MS, duration_ms)
+    _pending[(route, status_class)][bucket] += 1
+    _get_duration_histogram().record(
+        duration_ms, {"http.route": route, "http.status_class": status_class}
+    )
+
+
+class LatencyMiddleware:
+    """
+    ASGI middleware timing each HTTP request until its last body chunk.
+    Event streams are skipped: their duration is the client's session length.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = {"code": 500, "streaming": False}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                for name, value in message.get("headers", []):
+                    if name == b"content-type" and value.startswith(
+                        b"text/event-stream"
+                    ):
+                        status["streaming"] = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if not status["streaming"]:
+                route = scope.get("route")
+                path = getattr(route, "path", None)
+                record_latency(
+                    f"{scope['method']} {path}" if path else UNMATCHED_ROUTE,
+                    f"{status['code'] // 100}xx",
+                    (time.perf_counter() - start) * 1000,
+                )
+
+
+async def flush_latencies() -> None:
+    """Add this worker's pending counts to the current minute's Redis hash."""
+    if not _pending:
+        return
+    pending = dict(_pending)
+    _pending.clear()
+
+    key = latency_key(datetime.now(timezone.utc))
+    try:
+        redis = await get_redis()
+        async with redis.pipeline(transaction=False) as pipe:
+            for (route, status_class), counts in pending.items():
+                for bucket, count in enumerate(counts):
+                    if count:
+                        pipe.hincrby(key, f"{route}|{status_class}|{bucket}", count)
+            pipe.expire(key, LATENCY_KEY_TTL)
+            await pipe.execute()
+    except Exception as e:
+        logger.error(f"Failed to flush latency histograms: {str(e)}")
+
+
+async def _flush_forever() -> None:
+    while True:
+        await asyncio.sleep(LATENCY_FLUSH_INTERVAL)
+        await flush_latencies()
+
+
+def start_latency_flusher() -> None:
+    global _flusher
+    if _flusher is None:
+        _flusher = asyncio.create_task(_flush_forever())
+
+
+async def stop_latency_flusher() -> None:
+    global _flusher
+    if _flusher is not None:
+        _flusher.cancel()
+        _flusher = None
+    await flush_latencies()
+
+
+def _percentile(counts: List[int], total: int, quantile: float) -> float:
+    """Upper bound of the bucket holding the quantile's rank."""
+    rank = quantile * total
+    seen = 0
+    for bucket, count in enumerate(counts):
+        seen += count
+        if seen >= rank:
+            return LATENCY_BUCKETS_MS[min(bucket, len(LATENCY_BUCKETS_MS) - 1)]
+    return LATENCY_BUCKETS_MS[-1]
+
+
+def _summary(counts: List[int]) -> dict:
+    total = sum(counts)
+    return {
+        "count": total,
+        "p50_ms": _percentile(counts, total, 0.50),
+        "p95_ms": _percentile(counts, total, 0.95),
+        "p99_ms": _percentile(counts, total, 0.99),
+    }
+
+
+async def _window_counts(minutes: int) -> Dict[Tuple[str, str], List[int]]:
+    redis = await get_redis()
+    now = datetime.now(timezone.utc)
+    async with redis.pipeline(transaction=False) as pipe:
+        for offset in range(minutes):
+            pipe.hgetall(latency_key(now - timedelta(minutes=offset)))
+        hashes = await pipe.execute()
+
+    counts: Dict[Tuple[str, str], List[int]] = defaultdict(
+        lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    )
+    for fields in hashes:
+        for field, count in fields.items():
+            route, status_class, bucket = field.rsplit("|", 2)
+            counts[(route, status_class)][int(bucket)] += int(count)
+    return counts
+
+
+async def get_route_latencies(minutes: int = LATENCY_WINDOW_MINUTES) -> List[dict]:
+    """p50/p95/p99 per route and status class over the last `minutes`."""
+    counts = await _window_counts(minutes)
+    return sorted(
+        (
+            {"route": route, "status_class": status_class, **_summary(buckets)}
+            for (route, status_class), buckets in counts.items()
+        ),
+        key=lambda item: (item["route"], item["status_class"]),
+    )
+
+
+async def get_overall_p95(minutes: int = LATENCY_WINDOW_MINUTES) -> float:
+    """p95 across every route over the last `minutes` (0 without traffic)."""
+    merged = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    for buckets in (await _window_counts(minutes)).values():
+        for bucket, count in enumerate(buckets):
+            merged[bucket] += count
+    if not sum(merged):
+        return 0
+    return _summary(merged)["p95_ms"]
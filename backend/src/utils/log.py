@@ -1,5 +1,7 @@
 import logging
 import os
+import random
+import reprlib
 import sys
 import uuid
 import structlog
@@ -7,8 +9,6 @@ from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
 from structlog.contextvars import bind_contextvars, clear_contextvars
 from .config import config
-from opentelemetry.sdk._logs import LoggingHandler
-from opentelemetry._logs import get_logger_provider
 
 # ---------------------------------------------------------------------------
 # Paths
@@ -16,6 +16,77 @@ from opentelemetry._logs import get_logger_provider
 ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 LOGS_DIR = os.path.join(ROOT_DIR, "logs")
 
+# ---------------------------------------------------------------------------
+# Hot-path event controls
+# ---------------------------------------------------------------------------
+# Longest rendering of a single event value; payloads (X API responses,
+# cached values) are cut to this instead of being rendered whole.
+LOG_MAX_VALUE_CHARS = 2000
+
+# Fraction of each named event that is kept. Overridden per event by
+# LOG_SAMPLE_RATES, e.g. "cache.hit=0.01,x_api.response=0.1".
+DEFAULT_LOG_SAMPLE_RATES = {
+    "cache.hit": 0.01,
+    "cache.miss": 0.1,
+    "x_api.response": 0.1,
+}
+
+_payload_repr = reprlib.Repr()
+_payload_repr.maxlevel = 3
+_payload_repr.maxdict = 10
+_payload_repr.maxlist = 10
+_payload_repr.maxstring = 200
+_payload_repr.maxother = 200
+
+
+def _sample_rates() -> dict:
+    # Runs at import: a bad entry is skipped with a warning rather than
+    # stopping the API and workers from booting.
+    rates = dict(DEFAULT_LOG_SAMPLE_RATES)
+    for item in (config.LOG_SAMPLE_RATES or "").split(","):
+        if not item.strip():
+            continue
+        event, _, rate = item.partition("=")
+        try:
+            if not event.strip():
+                raise ValueError("missing event name")
+            rates[event.strip()] = min(max(float(rate), 0.0), 1.0)
+        except ValueError:
+            logging.getLogger(__name__).warning(
+                f"Ignoring malformed LOG_SAMPLE_RATES entry: {item.strip()!r}"
+            )
+    return rates
+
+
+LOG_SAMPLE_RATES = _sample_rates()
+
+
+def sample_events(logger, method_name, event_dict):
+    """Keep LOG_SAMPLE_RATES[event] of a sampled event; warnings and up always pass."""
+    rate = LOG_SAMPLE_RATES.get(event_dict.get("event"))
+    if rate is None or method_name in ("warning", "error", "exception", "critical"):
+        return event_dict
+    if random.random() >= rate:
+        raise structlog.DropEvent
+    event_dict["sample_rate"] = rate
+    return event_dict
+
+
+def cap_payloads(logger, method_name, event_dict):
+    """Render containers with bounded depth/width and cut long strings."""
+    for key, value in event_dict.items():
+        if key == "event":
+            continue
+        if isinstance(value, (dict, list, tuple, set)):
+            # the repr is bounded per level, not in total, so it is cut as well
+            value = event_dict[key] = _payload_repr.repr(value)
+        if isinstance(value, str) and len(value) > LOG_MAX_VALUE_CHARS:
+            event_dict[key] = (
+                f"{value[:LOG_MAX_VALUE_CHARS]}...(+{len(value) - LOG_MAX_VALUE_CHARS} chars)"
+            )
+    return event_dict
+
+
 # ---------------------------------------------------------------------------
 # Shared pre-render processors (run before the final renderer)
 # These are format-agnostic — they add metadata to the event dict.
@@ -43,8 +114,13 @@ def configure_structlog() -> None:
 
     # structlog is configured to stop just before rendering.
     # ProcessorFormatter (attached to each handler) does the final render.
+    # filter_by_level runs first so a disabled level (DEBUG in prod) costs one
+    # level check: no context merge, timestamp or payload rendering.
     structlog.configure(
         processors=[
+            structlog.stdlib.filter_by_level,
+            sample_events,
+            cap_payloads,
             *SHARED_PROCESSORS,
             # Hand off to stdlib logging — ProcessorFormatter takes it from here
             structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
@@ -82,6 +158,9 @@ def configure_structlog() -> None:
     # Re-added explicitly after handlers.clear() to ensure the OTel LoggingHandler
     # is not wiped. setup_telemetry() runs at module level before this function,
     # so get_logger_provider() returns the already-registered OTel LoggerProvider.
+    from opentelemetry.sdk._logs import LoggingHandler
+    from opentelemetry._logs import get_logger_provider
+
     otel_handler = LoggingHandler(logger_provider=get_logger_provider())
 
     # --- Root logger: wire all three handlers ---
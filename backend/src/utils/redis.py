@@ -1,8 +1,11 @@
 # redis_client.py
-import json
+import asyncio
+import orjson
+import uuid
+from datetime import date, datetime, timezone
 import redis.asyncio as redis
 import redis as redis_sync
-from typing import Optional
+from typing import Dict, Optional
 from src.utils.config import config
 
 from src.utils.log import get_logger
@@ -56,38 +59,244 @@ def get_redis_sync() -> redis_sync.Redis:
     return _redis_sync
 
 
-async def get_or_fetch_cache(key: str, fetch_callback, ttl: int = CACHE_TTL):
+# After a write, the user's reads stay on the primary this long so replica
+# lag can neither hide the write from them nor get cached under the new
+# data version.
+READ_YOUR_WRITES_WINDOW = 10  # seconds
+
+
+def data_version_key(user_id) -> str:
+    return f"data_version:{user_id}"
+
+
+def primary_pin_key(user_id) -> str:
+    return f"primary_pin:{user_id}"
+
+
+async def is_pinned_to_primary(user_id) -> bool:
+    """True if the user wrote within READ_YOUR_WRITES_WINDOW."""
+    redis = await get_redis()
+    return bool(await redis.exists(primary_pin_key(user_id)))
+
+
+async def get_data_version(user_id) -> int:
+    """
+    Current data version of a user; 0 if nothing has been written yet.
+    Cached responses derived from the user's data are keyed by this value.
+    """
+    redis = await get_redis()
+    version = await redis.get(data_version_key(user_id))
+    return int(version) if version else 0
+
+
+async def bump_data_version(user_id) -> None:
+    """
+    Invalidate every cached response derived from a user's data, pin the
+    user's reads to the primary for READ_YOUR_WRITES_WINDOW, and tell the
+    user's open event streams (a 'data_changed' event with the new version)
+    that it is worth refetching.
+
+    Call after the write has committed. Works from the API (async client) and
+    from Celery tasks, where setup_redis() never ran and the sync client is
+    used instead. Failures are logged, not raised: cache entries still expire
+    after their TTL.
+    """
+    key = data_version_key(user_id)
+    pin_key = primary_pin_key(user_id)
     try:
-        redis = await get_redis()
-        logger.debug(f"Attempting to get cached data for key: {key}")
+        if _redis is not None:
+            version = await _redis.incr(key)
+            await _redis.set(pin_key, 1, ex=READ_YOUR_WRITES_WINDOW)
+        else:
+            redis = get_redis_sync()
+            version = redis.incr(key)
+            redis.set(pin_key, 1, ex=READ_YOUR_WRITES_WINDOW)
+    except Exception as e:
+        logger.error(f"Failed to bump data version for user {user_id}: {str(e)}")
+        return
 
-        cached = await redis.get(key)
-        if cached:
-            logger.debug(f"Cache hit for key: {key}, value {cached}")
-            return json.loads(cached)
-        # fetch fresh data
-        logger.debug("Cache miss, fetching fresh data...")
-        fresh = await fetch_callback()
-        logger.debug(f"Fetched fresh data: {fresh}")
-
-        # set cache
-        await redis.set(key, json.dumps(fresh), ex=ttl)
-
-        # verify immediately
-        verify = await redis.get(key)
-        if not verify:
-            logger.error(f"Key {key} failed to write to cache!")
-            raise RuntimeError(f"Failed to cache data for key {key}")
+    await publish_event(user_id, "data_changed", {"version": version}, event_id=version)
+
+
+def events_channel(user_id) -> str:
+    return f"events:{user_id}"
+
+
+def _event_message(event: str, data: dict, event_id=None) -> bytes:
+    return orjson.dumps({"event": event, "data": data, "id": event_id})
+
+
+def publish_event_sync(user_id, event: str, data: dict, event_id=None) -> None:
+    """
+    Publish an event to a user's event streams from synchronous code
+    (Celery task bodies). Failures are logged, not raised.
+    """
+    try:
+        get_redis_sync().publish(
+            events_channel(user_id), _event_message(event, data, event_id)
+        )
+    except Exception as e:
+        logger.error(f"Failed to publish {event} for user {user_id}: {str(e)}")
+
+
+async def publish_event(user_id, event: str, data: dict, event_id=None) -> None:
+    """
+    Publish an event to a user's event streams (GET /client/events).
+    Uses the async client when set up, the sync client otherwise.
+    Failures are logged, not raised.
+    """
+    if _redis is None:
+        publish_event_sync(user_id, event, data, event_id)
+        return
+    try:
+        await _redis.publish(
+            events_channel(user_id), _event_message(event, data, event_id)
+        )
+    except Exception as e:
+        logger.error(f"Failed to publish {event} for user {user_id}: {str(e)}")
+
+
+# Per-day hash of X API requests by endpoint; kept long enough for
+# rollup_daily_stats_task to finalize the day into daily_stats.
+X_CALLS_KEY_TTL = 8 * 24 * 3600
+
+
+def x_calls_key(day: date) -> str:
+    return f"stats:x_calls:{day.isoformat()}"
+
+
+async def record_x_call(endpoint: str) -> None:
+    """
+    Count one X API request towards today's x_calls rollup.
+    Works from the API and from Celery tasks; failures are logged, not raised.
+    """
+    key = x_calls_key(datetime.now(timezone.utc).date())
+    try:
+        if _redis is not None:
+            async with _redis.pipeline(transaction=False) as pipe:
+                pipe.hincrby(key, endpoint, 1)
+                pipe.expire(key, X_CALLS_KEY_TTL)
+                await pipe.execute()
         else:
-            logger.debug(f"Key {key} written successfully and readable: {verify}")
+            pipe = get_redis_sync().pipeline(transaction=False)
+            pipe.hincrby(key, endpoint, 1)
+            pipe.expire(key, X_CALLS_KEY_TTL)
+            pipe.execute()
+    except Exception as e:
+        logger.error(f"Failed to record X call to {endpoint}: {str(e)}")
+
+
+async def get_x_calls(day: date) -> Dict[str, int]:
+    """X API requests made on `day` (UTC), by endpoint."""
+    key = x_calls_key(day)
+    if _redis is not None:
+        counts = await _redis.hgetall(key)
+    else:
+        counts = get_redis_sync().hgetall(key)
+    return {endpoint: int(count) for endpoint, count in counts.items()}
+
+
+# Latest queue/worker/Redis sample written by collect_health_snapshot_task.
+# It expires if the collector stops, so the admin endpoints never serve a
+# stale snapshot as current.
+HEALTH_SNAPSHOT_KEY = "admin:health:snapshot"
+HEALTH_SNAPSHOT_TTL = 120  # seconds
+
+
+def set_health_snapshot_sync(snapshot: dict) -> None:
+    """Store the collector's snapshot (Celery side)."""
+    get_redis_sync().set(
+        HEALTH_SNAPSHOT_KEY, orjson.dumps(snapshot), ex=HEALTH_SNAPSHOT_TTL
+    )
+
+
+async def get_health_snapshot() -> Optional[dict]:
+    """The latest health snapshot, or None if the collector has not run lately."""
+    redis = await get_redis()
+    cached = await redis.get(HEALTH_SNAPSHOT_KEY)
+    return orjson.loads(cached) if cached else None
+
+
+# In-process single-flight: key -> future resolving to the serialized payload
+# of the request currently computing it.
+_inflight: Dict[str, asyncio.Future] = {}
+
+LOCK_TTL_MS = 10_000
+LOCK_POLL_INTERVAL = 0.05
+
 
+async def _fetch_and_store(redis, key: str, fetch_callback, ttl: int) -> str | bytes:
+    """Compute a value under a cross-process lock so only one worker hits the DB."""
+    lock_key = f"lock:{key}"
+    token = uuid.uuid4().hex
+    acquired = await redis.set(lock_key, token, nx=True, px=LOCK_TTL_MS)
+
+    if not acquired:
+        # Another process is computing it; wait for its result up to the lock TTL.
+        waited = 0.0
+        while waited < LOCK_TTL_MS / 1000:
+            await asyncio.sleep(LOCK_POLL_INTERVAL)
+            waited += LOCK_POLL_INTERVAL
+            cached = await redis.get(key)
+            if cached:
+                logger.debug("cache.hit", key=key, via="lock_wait")
+                return cached
+            if not await redis.exists(lock_key):
+                break
+        logger.debug("cache.lock_timeout", key=key)
+
+    try:
+        fresh = orjson.dumps(await fetch_callback())
+        await redis.set(key, fresh, ex=ttl)
         return fresh
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to decode JSON for key {key}: {str(e)}")
-        raise
+    finally:
+        if acquired:
+            # Release only our own lock; it may have expired and been retaken.
+            if await redis.get(lock_key) == token:
+                await redis.delete(lock_key)
+
+
+async def get_or_fetch_cache(key: str, fetch_callback, ttl: int = CACHE_TTL):
+    """
+    Return the cached JSON value for `key`, computing it with `fetch_callback` on a miss.
+
+    Concurrent misses for the same key are coalesced: callers in this process
+    share one in-flight computation, and processes coordinate through a Redis
+    lock so a single request recomputes the value. Each caller gets its own
+    deserialized copy. If Redis is unavailable the callback is used directly.
+    """
+    try:
+        redis = await get_redis()
+        cached = await redis.get(key)
+    except Exception as e:
+        logger.error(f"Cache unavailable for key {key}, fetching directly: {str(e)}")
+        return await fetch_callback()
+
+    if cached:
+        logger.debug("cache.hit", key=key)
+        return orjson.loads(cached)
+
+    inflight = _inflight.get(key)
+    if inflight is not None:
+        logger.debug("cache.join_inflight", key=key)
+        return orjson.loads(await asyncio.shield(inflight))
+
+    logger.debug("cache.miss", key=key)
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        payload = await _fetch_and_store(redis, key, fetch_callback, ttl)
+        future.set_result(payload)
     except Exception as e:
+        future.set_exception(e)
+        # Retrieve it so an unawaited future does not log a warning.
+        future.exception()
         logger.error(f"Error in get_or_fetch_cache for key {key}: {str(e)}")
         raise
+    finally:
+        _inflight.pop(key, None)
+
+    return orjson.loads(payload)
 
 
 async def set_cache(key: str, data, ttl: int = CACHE_TTL) -> bool:
@@ -97,9 +306,9 @@ async def set_cache(key: str, data, ttl: int = CACHE_TTL) -> bool:
     """
     try:
         redis_conn = await get_redis()
-        payload = json.dumps(data)
+        payload = orjson.dumps(data)
         await redis_conn.set(key, payload, ex=ttl)
-        logger.debug(f"Set cache for key={key} ttl={ttl} payload={payload}")
+        logger.debug("cache.set", key=key, ttl=ttl)
         return True
     except Exception as e:
         logger.error(f"Failed to write cache for key {key}: {e}")
@@ -110,7 +319,7 @@ async def key_exist(key: str) -> bool:
     try:
         redis = await get_redis()
         exist = await redis.exists(key)
-        logger.debug(f"Key {key} exists: {bool(exist)}")
+        logger.debug("cache.exists", key=key, exists=bool(exist))
         return bool(exist)
     except Exception as e:
         logger.error(f"Error checking if key {key} exists: {str(e)}")
@@ -124,16 +333,14 @@ async def get_from_cache(key: str):
     """
     try:
         redis = await get_redis()
-        logger.debug(f"Attempting to get cached data for key: {key}")
-
         cached = await redis.get(key)
         if cached:
-            logger.debug(f"Cache hit for key: {key}, value {cached}")
-            return json.loads(cached)
+            logger.debug("cache.hit", key=key)
+            return orjson.loads(cached)
 
-        logger.debug(f"Cache miss for key: {key}")
+        logger.debug("cache.miss", key=key)
         return None
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         logger.error(f"Failed to decode cached JSON for key {key}: {str(e)}")
         return None
     except Exception as e:
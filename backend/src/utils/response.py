@@ -1,15 +1,27 @@
 from typing import Optional, Any
-from fastapi.responses import JSONResponse
-from fastapi import HTTPException
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi import HTTPException, Response
 from fastapi.encoders import jsonable_encoder
 from src.v1.base.schema import ErrorResponse, SuccessResponse
 
 def success_response(status_code: int, message: str="success", data: Optional[Any] = None):
     '''Returns a JSON response for success responses'''
-    response_content = SuccessResponse(message=message, data=data)
-    return JSONResponse(status_code=status_code, content=jsonable_encoder(response_content.model_dump()))
+    # Same shape as SuccessResponse, built directly so it is encoded once.
+    content = {"status": "success", "message": message, "data": data, "role": None}
+    return ORJSONResponse(status_code=status_code, content=content)
+
+def json_response(content: Any, response: Optional[Response] = None, status_code: int = 200):
+    '''
+    Returns `content` serialized straight through orjson, skipping FastAPI's
+    jsonable_encoder pass. `content` must already be orjson-native (dicts,
+    lists, str, numbers, datetime, UUID). Headers set on an injected `response`
+    (e.g. ETag from ConditionalGet) are carried over, since FastAPI only merges
+    them into responses it builds itself.
+    '''
+    headers = dict(response.headers) if response is not None else None
+    return ORJSONResponse(status_code=status_code, content=content, headers=headers)
 
 def error_response(status_code: int, message: str, error_code: Optional[str] = None, resolution: Optional[str] = None, data: Optional[Any] = None):
     '''Returns a JSON response for error responses'''
     response_content = ErrorResponse(message=message, error_code=error_code, resolution=resolution, data=data)
-    return HTTPException(status_code=status_code, detail=jsonable_encoder(response_content.model_dump()))
\ No newline at end of file
+    return HTTPException(status_code=status_code, detail=jsonable_encoder(response_content.model_dump()))
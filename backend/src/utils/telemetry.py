@@ -1,19 +1,9 @@
 import logging
-from opentelemetry import trace, metrics
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-from opentelemetry.sdk.resources import Resource, SERVICE_NAME
-from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
-from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
-from opentelemetry._logs import set_logger_provider
-from opentelemetry.sdk._logs import LoggerProvider, LoggingHandler
-from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
-from opentelemetry.exporter.otlp.proto.grpc._log_exporter import OTLPLogExporter
-from opentelemetry.sdk.metrics import MeterProvider
-from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
-from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
-from opentelemetry.instrumentation.logging import LoggingInstrumentor
+import os
+
+# The SDK, exporters and instrumentors are imported inside setup_telemetry:
+# they are the heaviest part of the import graph, and only the process that
+# actually exports telemetry needs them.
 
 # The gRPC endpoint of your OpenTelemetry Collector.
 # In Docker Compose, "otel-collector" resolves to the collector container.
@@ -31,6 +21,29 @@ def setup_telemetry(app=None, service_name: str = "save-stack-api"):
     Grafana / Tempo / Loki / Prometheus.
     """
 
+    # OTEL_SDK_DISABLED is the standard OTel switch; skipping setup keeps the
+    # API's no-op providers and avoids importing the SDK at all.
+    if os.getenv("OTEL_SDK_DISABLED", "").lower() == "true":
+        return
+
+    from opentelemetry import trace, metrics
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+    from opentelemetry.sdk.resources import Resource, SERVICE_NAME
+    from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+    from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
+    from opentelemetry._logs import set_logger_provider
+    from opentelemetry.sdk._logs import LoggerProvider, LoggingHandler
+    from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
+    from opentelemetry.exporter.otlp.proto.grpc._log_exporter import OTLPLogExporter
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+    from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import (
+        OTLPMetricExporter,
+    )
+    from opentelemetry.instrumentation.logging import LoggingInstrumentor
+
     # Resource: metadata attached to every piece of telemetry emitted by this process.
     # SERVICE_NAME is what shows up as the service label in Grafana/Tempo/Loki.
     resource = Resource.create({SERVICE_NAME: service_name})
@@ -62,6 +62,14 @@ class NotActive(BaseExceptionClass):
     pass
 
 
+class NotModified(BaseExceptionClass):
+    """Raised when a conditional GET matches the current ETag (answered with 304)"""
+
+    def __init__(self, etag: str):
+        self.etag = etag
+        super().__init__("Not modified")
+
+
 class ExternalAPIError(Exception):
     """Raised when external API returns an error status"""
 
@@ -76,3 +84,8 @@ class ExternalAPIError(Exception):
     @property
     def is_server_error(self) -> bool:
         return self.status_code and 500 <= self.status_code < 600
+
+    @property
+    def is_transient(self) -> bool:
+        """Worth retrying later; any other error status will fail again."""
+        return self.is_rate_limited or bool(self.is_server_error)
@@ -1,9 +1,11 @@
 from .users import User
 from .post import Post, Media
-from .bookmark import Bookmark, bookmark_folders, Folder
+from .bookmark import Bookmark, bookmark_folders, Folder, SORT_TEXT_LENGTH
 from .author import Author
 from .tag import Tag, bookmark_tags
-from .admin import SyncJob, AdminAuditLog, ErrorLog
+from .admin import SyncJob, AdminAuditLog, ErrorLog, DailyStat
+from .counter import BookmarkCounter
+from .outbox import XOutbox
 
 __all__ = [
     "User",
@@ -17,5 +19,9 @@ __all__ = [
     "SyncJob",
     "AdminAuditLog",
     "ErrorLog",
-    "Media"
+    "DailyStat",
+    "Media",
+    "BookmarkCounter",
+    "XOutbox",
+    "SORT_TEXT_LENGTH",
 ]
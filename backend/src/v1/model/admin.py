@@ -2,26 +2,128 @@ from src.v1.base.model import BaseModel
 import sqlalchemy as sa
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
+import uuid
+
+
+# Days of sync_jobs partitions kept ready beyond today.
+SYNC_JOBS_PARTITIONS_AHEAD = 7
+
+# Rows whose day has no partition yet (e.g. maintenance stopped for longer
+# than the days created ahead) land here instead of failing the insert.
+SYNC_JOBS_DEFAULT_PARTITION = "sync_jobs_default"
+
+# Creates the missing daily partitions (sync_jobs_pYYYYMMDD, UTC days) for
+# first_day..last_day inclusive. A day's rows already in the default
+# partition are moved into its new partition, since PostgreSQL refuses to
+# attach a partition whose range the default partition still holds rows of.
+SYNC_JOBS_PARTITION_FUNCTION_DDL = """
+CREATE OR REPLACE FUNCTION sync_jobs_create_partitions(first_day date, last_day date)
+RETURNS void
+LANGUAGE plpgsql AS $$
+DECLARE
+    day date;
+    partition_name text;
+    day_start timestamptz;
+    day_end timestamptz;
+BEGIN
+    FOR day IN SELECT generate_series(first_day, last_day, interval '1 day')::date LOOP
+        partition_name := 'sync_jobs_p' || to_char(day, 'YYYYMMDD');
+        CONTINUE WHEN to_regclass(partition_name) IS NOT NULL;
+        day_start := day::timestamp AT TIME ZONE 'UTC';
+        day_end := (day + 1)::timestamp AT TIME ZONE 'UTC';
+
+        CREATE TEMP TABLE sync_jobs_moving (LIKE sync_jobs);
+        WITH moved AS (
+            DELETE FROM sync_jobs_default
+            WHERE started_at >= day_start AND started_at < day_end
+            RETURNING *
+        )
+        INSERT INTO sync_jobs_moving SELECT * FROM moved;
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF sync_jobs FOR VALUES FROM (%L) TO (%L)',
+            partition_name, day_start, day_end
+        );
+        INSERT INTO sync_jobs SELECT * FROM sync_jobs_moving;
+        DROP TABLE sync_jobs_moving;
+    END LOOP;
+END
+$$
+"""
 
 
 class SyncJob(BaseModel):
-    """Tracks Celery sync job status"""
+    """
+    Tracks Celery sync job status.
+
+    Range-partitioned by started_at into one partition per UTC day, so old
+    days are dropped whole instead of deleted and vacuumed row by row (see
+    SyncJobPartitionService); rows of a day without a partition go to the
+    default partition. Unique keys must include the partition key, hence
+    the (id, started_at) primary key and a plain index on task_id: one row
+    per task is kept by the task_started signal, which reuses the row of a
+    retried task (see setup_task_signals).
+    """
 
     __tablename__ = "sync_jobs"
 
-    task_id = sa.Column(sa.String, unique=True, nullable=False)
+    id = sa.Column(sa.UUID, primary_key=True, default=uuid.uuid4)
+    task_id = sa.Column(sa.String, nullable=False, index=True)
     user_id = sa.Column(sa.UUID, sa.ForeignKey("users.id"), nullable=False)
     type = sa.Column(sa.String, nullable=False)  # frontsync, backfill
     status = sa.Column(
         sa.String, default="queued"
     )  # queued, active, completed, failed, cancelled
-    started_at = sa.Column(sa.DateTime(timezone=True), nullable=True)
+    started_at = sa.Column(
+        sa.DateTime(timezone=True),
+        primary_key=True,
+        default=lambda: datetime.now(timezone.utc),
+    )
     completed_at = sa.Column(sa.DateTime(timezone=True), nullable=True)
     error = sa.Column(sa.Text, nullable=True)
     result = sa.Column(sa.JSON, nullable=True)
 
     user = relationship("User", backref="sync_jobs")
 
+    # (status, type, started_at, id) serves the filtered admin job list and
+    # its keyset pagination
+    __table_args__ = (
+        sa.PrimaryKeyConstraint("id", "started_at", name="pk_sync_jobs"),
+        sa.Index("ix_sync_jobs_started_at", "started_at"),
+        sa.Index(
+            "ix_sync_jobs_status_type_started_at",
+            "status",
+            "type",
+            sa.text("started_at DESC"),
+            sa.text("id DESC"),
+        ),
+        {"postgresql_partition_by": "RANGE (started_at)"},
+    )
+
+
+# create_all() needs the partition function, and partitions to insert into.
+# DDL %-formats its statement, so format()'s %I/%L placeholders are escaped.
+sa.event.listen(
+    SyncJob.__table__,
+    "before_create",
+    sa.DDL(SYNC_JOBS_PARTITION_FUNCTION_DDL.replace("%", "%%")),
+)
+sa.event.listen(
+    SyncJob.__table__,
+    "after_create",
+    sa.DDL(
+        f"CREATE TABLE {SYNC_JOBS_DEFAULT_PARTITION} PARTITION OF sync_jobs DEFAULT"
+    ),
+)
+sa.event.listen(
+    SyncJob.__table__,
+    "after_create",
+    sa.DDL(
+        "SELECT sync_jobs_create_partitions("
+        "(now() AT TIME ZONE 'UTC')::date, "
+        f"(now() AT TIME ZONE 'UTC')::date + {SYNC_JOBS_PARTITIONS_AHEAD})"
+    ),
+)
+
 
 class AdminAuditLog(BaseModel):
     """Audit trail for admin actions"""
@@ -39,9 +141,24 @@ class AdminAuditLog(BaseModel):
 
     admin = relationship("User", backref="admin_audit_logs")
 
+    # keyset pagination of the audit log, overall and per action
+    __table_args__ = (
+        sa.Index(
+            "ix_admin_audit_logs_timestamp",
+            sa.text("timestamp DESC"),
+            sa.text("id DESC"),
+        ),
+        sa.Index(
+            "ix_admin_audit_logs_action_timestamp",
+            "action",
+            sa.text("timestamp DESC"),
+            sa.text("id DESC"),
+        ),
+    )
+
 
 class ErrorLog(BaseModel):
-    """Persistent error logs"""
+    """Persistent error logs, deduplicated by fingerprint"""
 
     __tablename__ = "error_logs"
 
@@ -51,4 +168,42 @@ class ErrorLog(BaseModel):
     level = sa.Column(sa.String, nullable=False)  # ERROR, WARN
     message = sa.Column(sa.Text, nullable=False)
     trace = sa.Column(sa.Text, nullable=True)
-    source = sa.Column(sa.String, nullable=True)  # api, celery, worker
+    source = sa.Column(sa.String, nullable=True)  # "<api|celery>:<logger>"
+    # one row per distinct error (see src.utils.error_sink); timestamp is the
+    # last occurrence
+    fingerprint = sa.Column(sa.String, nullable=True, unique=True)
+    count = sa.Column(sa.Integer, nullable=False, default=1, server_default="1")
+    first_seen = sa.Column(sa.DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        sa.Index(
+            "ix_error_logs_level_timestamp", "level", sa.text("timestamp DESC")
+        ),
+    )
+
+
+class DailyStat(BaseModel):
+    """
+    Daily rollup of an admin metric, maintained by rollup_daily_stats_task.
+
+    Metrics: 'signups', 'bookmarks', 'sync_jobs' (dimension '<type>:<status>')
+    and 'x_calls' (dimension is the X endpoint). Rows of past days become
+    final once late updates (e.g. sync jobs finishing after midnight) can no
+    longer change them; today is never stored and is computed live.
+    """
+
+    __tablename__ = "daily_stats"
+
+    day = sa.Column(sa.Date, nullable=False)
+    metric = sa.Column(sa.String, nullable=False)
+    dimension = sa.Column(sa.String, nullable=False, default="", server_default="")
+    value = sa.Column(sa.BigInteger, nullable=False, default=0, server_default="0")
+    is_final = sa.Column(
+        sa.Boolean, nullable=False, default=False, server_default=sa.false()
+    )
+
+    __table_args__ = (
+        sa.UniqueConstraint(
+            "metric", "day", "dimension", name="uq_daily_stats_metric_day"
+        ),
+    )
@@ -29,3 +29,27 @@ class Author(BaseModel):
     author_id_from_x = sa.Column(sa.String, nullable=False, unique=True)
     # relationship back to post
     posts = relationship("Post", backref="author")
+
+    # trigram indexes serve fuzzy (%) and leading-wildcard ILIKE author lookups
+    __table_args__ = (
+        sa.Index(
+            "ix_authors_username_trgm",
+            "username",
+            postgresql_using="gin",
+            postgresql_ops={"username": "gin_trgm_ops"},
+        ),
+        sa.Index(
+            "ix_authors_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
+
+
+# create_all() needs pg_trgm before it can build the gin_trgm_ops indexes
+sa.event.listen(
+    Author.__table__,
+    "before_create",
+    sa.DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"),
+)
@@ -2,6 +2,9 @@ from src.v1.base.model import BaseModel
 import sqlalchemy as sa
 from sqlalchemy.orm import relationship
 
+# How much of a post's text is copied into bookmarks.sort_text for alpha sorting.
+SORT_TEXT_LENGTH = 256
+
 
 class Bookmark(BaseModel):
     """
@@ -15,6 +18,11 @@ class Bookmark(BaseModel):
     - Each bookmark belongs to exactly one user (owner).
     - One post can have many bookmarks.
     - Each bookmark belongs to exactly one post (post_data).
+
+    Sort keys (copied from the post so the feed can be served by an index
+    range scan on bookmarks alone):
+    - post_created_at: The post's created_at_from_twitter.
+    - sort_text: The first SORT_TEXT_LENGTH characters of the post's text.
     """
 
     __tablename__ = "bookmarks"
@@ -31,11 +39,36 @@ class Bookmark(BaseModel):
     post = relationship("Post", backref="bookmarks")
 
     # read status
-    is_read = sa.Column(sa.Boolean, default=False)
+    is_read = sa.Column(
+        sa.Boolean, default=False, server_default=sa.false(), nullable=False
+    )
 
     # referenced tweet ID for retweets/quotes
     referenced_tweet_id = sa.Column(sa.String, nullable=True)
 
+    # denormalized feed sort keys
+    post_created_at = sa.Column(sa.DateTime(timezone=True), nullable=True)
+    sort_text = sa.Column(sa.Text, nullable=True)
+
+    __table_args__ = (
+        sa.Index("ix_bookmarks_user_id_post_id", "user_id", "post_id"),
+        sa.Index(
+            "ix_bookmarks_user_id_post_created_at",
+            "user_id",
+            sa.text("post_created_at DESC"),
+            sa.text("id DESC"),
+        ),
+        sa.Index(
+            "ix_bookmarks_user_id_is_read_post_created_at",
+            "user_id",
+            "is_read",
+            sa.text("post_created_at DESC"),
+            sa.text("id DESC"),
+        ),
+        sa.Index("ix_bookmarks_user_id_sort_text", "user_id", "sort_text", "id"),
+        sa.Index("ix_bookmarks_created_at", "created_at"),
+    )
+
 
 class Folder(BaseModel):
     """
@@ -84,4 +117,6 @@ bookmark_folders = sa.Table(
         sa.ForeignKey("folders.id", ondelete="CASCADE"),
         primary_key=True,
     ),
+    # folder -> bookmarks lookups (feed folder filter)
+    sa.Index("ix_bookmarks_folders_folder_id_bookmark_id", "folder_id", "bookmark_id"),
 )
@@ -0,0 +1,35 @@
+from src.v1.base.model import BaseModel
+import sqlalchemy as sa
+
+
+class BookmarkCounter(BaseModel):
+    """
+    Per-user bookmark counts, kept current by the bookmark write paths.
+
+    Each row counts the bookmarks in one scope of a user's library, so list
+    endpoints can read totals in O(1) instead of scanning bookmarks. Rows are
+    adjusted in the same transaction as the write that changes them.
+
+    Fields:
+    - user_id: Owner of the counted bookmarks.
+    - scope: 'all' (whole library), 'folder' or 'tag'.
+    - scope_id: Folder or tag ID; the user's own ID for the 'all' scope.
+    - total: Number of bookmarks in the scope.
+    - unread: Number of those bookmarks with is_read = false.
+    """
+
+    __tablename__ = "bookmark_counters"
+
+    user_id = sa.Column(
+        sa.UUID, sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    scope = sa.Column(sa.String, nullable=False)
+    scope_id = sa.Column(sa.UUID, nullable=False)
+    total = sa.Column(sa.Integer, nullable=False, default=0, server_default="0")
+    unread = sa.Column(sa.Integer, nullable=False, default=0, server_default="0")
+
+    __table_args__ = (
+        sa.UniqueConstraint(
+            "user_id", "scope", "scope_id", name="uq_bookmark_counters_scope"
+        ),
+    )
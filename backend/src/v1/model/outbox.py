@@ -0,0 +1,51 @@
+from src.v1.base.model import BaseModel
+import sqlalchemy as sa
+
+
+class XOutbox(BaseModel):
+    """
+    Pending writes to the user's bookmarks on X.
+
+    Rows are inserted in the same transaction as the local change they mirror
+    and drained by a Celery worker, so API requests never wait on X.
+
+    Fields:
+    - user_id: Owner of the bookmark.
+    - operation: 'create_bookmark' or 'delete_bookmark'.
+    - tweet_id: X post ID the operation targets.
+    - status: 'pending' or 'failed' (retries exhausted or X rejected the
+      write); rows are deleted
+      once the write goes through.
+    - attempts: Failed attempts so far (rate-limit deferrals are not counted).
+    - available_at: Earliest time the worker may pick the row up; also used
+      as the lease of a claimed row.
+    - last_error: Error of the most recent failed attempt.
+    """
+
+    __tablename__ = "x_outbox"
+
+    user_id = sa.Column(
+        sa.UUID, sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    operation = sa.Column(sa.String, nullable=False)
+    tweet_id = sa.Column(sa.String, nullable=False)
+    status = sa.Column(
+        sa.String, nullable=False, default="pending", server_default="pending"
+    )
+    attempts = sa.Column(sa.Integer, nullable=False, default=0, server_default="0")
+    available_at = sa.Column(
+        sa.DateTime(timezone=True),
+        nullable=False,
+        default=sa.func.now(),
+        server_default=sa.func.now(),
+    )
+    last_error = sa.Column(sa.Text, nullable=True)
+
+    __table_args__ = (
+        sa.Index(
+            "ix_x_outbox_pending_available_at",
+            "available_at",
+            postgresql_where=sa.text("status = 'pending'"),
+        ),
+        sa.Index("ix_x_outbox_user_id_tweet_id", "user_id", "tweet_id"),
+    )
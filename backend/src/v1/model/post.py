@@ -1,6 +1,36 @@
 from src.v1.base.model import BaseModel
 import sqlalchemy as sa
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
+
+
+# Maps an X `lang` code onto a Postgres text search configuration. Declared
+# IMMUTABLE so it can drive the generated `search_vector` column below; unknown
+# or undetermined languages ("und", "zxx", ...) fall back to 'simple'.
+SEARCH_CONFIG_FUNCTION_DDL = """
+CREATE OR REPLACE FUNCTION posts_search_config(lang text)
+RETURNS regconfig
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT CASE lang
+        WHEN 'en' THEN 'english'::regconfig
+        WHEN 'es' THEN 'spanish'::regconfig
+        WHEN 'fr' THEN 'french'::regconfig
+        WHEN 'de' THEN 'german'::regconfig
+        WHEN 'pt' THEN 'portuguese'::regconfig
+        WHEN 'it' THEN 'italian'::regconfig
+        WHEN 'nl' THEN 'dutch'::regconfig
+        WHEN 'ru' THEN 'russian'::regconfig
+        ELSE 'simple'::regconfig
+    END
+$$
+"""
+
+# Stemmed lexemes in the post's own language (weight A) plus unstemmed 'simple'
+# lexemes (weight B), so exact words still match whatever the post language is.
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector(posts_search_config(lang), coalesce(text, '')), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(text, '')), 'B')"
+)
 
 
 class Post(BaseModel):
@@ -22,6 +52,7 @@ class Post(BaseModel):
     - created_at_from_twitter: Timestamp from X API.
     - lang: Language code of the post.
     - possibly_sensitive: Content warning flag from X.
+    - search_vector: Generated tsvector over `text`, configured by `lang`.
     """
 
     __tablename__ = "posts"
@@ -37,12 +68,29 @@ class Post(BaseModel):
     lang = sa.Column(sa.String, nullable=False)
     possibly_sensitive = sa.Column(sa.Boolean, nullable=False)
 
-    author_id = sa.Column(sa.UUID, sa.ForeignKey("authors.id"), nullable=True)
+    author_id = sa.Column(
+        sa.UUID, sa.ForeignKey("authors.id"), nullable=True, index=True
+    )
     tweet_type = sa.Column(sa.String, nullable=True)
 
+    # full-text search document, maintained by Postgres (GIN indexed)
+    search_vector = deferred(
+        sa.Column(TSVECTOR, sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True))
+    )
+
     # relationship back to media
     medias = relationship("Media", backref="posts", lazy="selectin")
 
+    __table_args__ = (
+        sa.Index("ix_posts_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
+
+# create_all() needs the config function before it can create the table
+sa.event.listen(
+    Post.__table__, "before_create", sa.DDL(SEARCH_CONFIG_FUNCTION_DDL)
+)
+
 
 class Media(BaseModel):
     """
@@ -65,7 +113,9 @@ class Media(BaseModel):
 
     __tablename__ = "medias"
     # relationship: Posts 1 → N Media
-    post_id = sa.Column(sa.UUID, sa.ForeignKey("posts.id"), nullable=False)
+    post_id = sa.Column(
+        sa.UUID, sa.ForeignKey("posts.id"), nullable=False, index=True
+    )
     media_key = sa.Column(sa.String, unique=True)
     media_type = sa.Column(sa.String)
     url = sa.Column(sa.String, nullable=True)
@@ -57,4 +57,6 @@ bookmark_tags = sa.Table(
         sa.ForeignKey("tags.id", ondelete="CASCADE"),
         primary_key=True,
     ),
+    # tag -> bookmarks lookups (feed tag filter)
+    sa.Index("ix_bookmarks_tags_tag_id_bookmark_id", "tag_id", "bookmark_id"),
 )
@@ -42,6 +42,38 @@ class User(BaseModel):
     role = sa.Column(sa.String, default="user")
     token = relationship("UserToken", uselist=False, back_populates="user")
 
+    # trigram indexes serve the admin user search (leading-wildcard ILIKE);
+    # (created_at, id) backs its keyset pagination
+    __table_args__ = (
+        sa.Index(
+            "ix_users_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+        sa.Index(
+            "ix_users_username_trgm",
+            "username",
+            postgresql_using="gin",
+            postgresql_ops={"username": "gin_trgm_ops"},
+        ),
+        sa.Index(
+            "ix_users_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        sa.Index("ix_users_created_at_id", "created_at", "id"),
+    )
+
+
+# create_all() needs pg_trgm before it can build the gin_trgm_ops indexes
+sa.event.listen(
+    User.__table__,
+    "before_create",
+    sa.DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"),
+)
+
 
 class UserToken(BaseModel):
     """
@@ -1,3 +1,4 @@
+from typing import Optional
 from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.utils.db import get_session
@@ -7,6 +8,7 @@ from src.v1.route.dependencies import (
     get_stats_service,
     get_user_admin_service,
     get_audit_service,
+    get_job_admin_service,
     get_health_service,
 )
 from src.v1.service.admin import (
@@ -14,6 +16,7 @@ from src.v1.service.admin import (
     StatsService,
     UserAdminService,
     AuditService,
+    JobAdminService,
     HealthService,
 )
 from src.v1.model import SyncJob
@@ -27,6 +30,7 @@ from src.v1.schema import (
     InviteAdminResponse,
     StatsOverview,
     StatsDatePoint,
+    SyncJobStatsPoint,
     UserListItem,
     UserListResponse,
     UserDetailResponse,
@@ -35,6 +39,7 @@ from src.v1.schema import (
     QueueStatsResponse,
     OAuthTokenListResponse,
     HealthMetricsResponse,
+    RouteLatencyItem,
     ErrorLogResponse,
     AuditLogItem,
     AuditLogResponse,
@@ -116,21 +121,45 @@ async def get_bookmarks(
     return await service.get_bookmarks(days)
 
 
+@admin_router.get("/stats/sync-jobs", response_model=list[SyncJobStatsPoint])
+async def get_sync_job_stats(
+    range: str = Query("14d"),
+    admin: User = Depends(admin_required),
+    service: StatsService = Depends(get_stats_service),
+):
+    days = int(range.replace("d", ""))
+    return await service.get_sync_jobs(days)
+
+
+@admin_router.get("/stats/x-calls", response_model=list[StatsDatePoint])
+async def get_x_call_stats(
+    range: str = Query("14d"),
+    admin: User = Depends(admin_required),
+    service: StatsService = Depends(get_stats_service),
+):
+    days = int(range.replace("d", ""))
+    return await service.get_x_calls(days)
+
+
 @admin_router.get("/users", response_model=UserListResponse)
 async def list_users(
     search: str = Query(""),
     status: str = Query(""),
     page: int = Query(1, ge=1),
     limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
     admin: User = Depends(admin_required),
     service: UserAdminService = Depends(get_user_admin_service),
 ):
-    items, total = await service.list_users(search, status, page, limit)
+    items, total, next_cursor = await service.list_users(
+        search, status, page, limit, cursor
+    )
     return UserListResponse(
         items=[UserListItem(**item) for item in items],
         total=total,
         page=page,
         limit=limit,
+        next_cursor=next_cursor,
     )
 
 
@@ -202,6 +231,15 @@ async def get_health(
     return await service.get_metrics()
 
 
+@admin_router.get("/health/latency", response_model=list[RouteLatencyItem])
+async def get_route_latencies(
+    window: int = Query(5, ge=1, le=60),
+    admin: User = Depends(admin_required),
+    service: HealthService = Depends(get_health_service),
+):
+    return await service.get_route_latencies(window)
+
+
 @admin_router.get("/health/logs", response_model=ErrorLogResponse)
 async def get_error_logs(
     level: str = Query("error"),
@@ -218,19 +256,11 @@ async def get_audit_logs(
     action: str = Query(""),
     page: int = Query(1, ge=1),
     limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
     admin: User = Depends(admin_required),
-    db: AsyncSession = Depends(get_session),
+    service: AuditService = Depends(get_audit_service),
 ):
-    from sqlalchemy import select
-    from src.v1.model import AdminAuditLog
-
-    result = await db.execute(
-        select(AdminAuditLog)
-        .order_by(AdminAuditLog.timestamp.desc())
-        .offset((page - 1) * limit)
-        .limit(limit)
-    )
-    logs = result.scalars().all()
+    logs, total, next_cursor = await service.list_logs(action, page, limit, cursor)
 
     return AuditLogResponse(
         items=[
@@ -245,19 +275,19 @@ async def get_audit_logs(
             )
             for log in logs
         ],
-        total=len(logs),
+        total=total,
         page=page,
         limit=limit,
+        next_cursor=next_cursor,
     )
 
 
 @admin_router.get("/queues/stats", response_model=QueueStatsResponse)
 async def get_queue_stats(
     admin: User = Depends(admin_required),
+    service: HealthService = Depends(get_health_service),
 ):
-    return QueueStatsResponse(
-        active_workers=0, queue_depth=0, active_jobs=0, queued_jobs=0, failed_jobs=0
-    )
+    return await service.get_queue_stats()
 
 
 @admin_router.get("/oauth/tokens", response_model=OAuthTokenListResponse)
@@ -300,31 +330,13 @@ async def list_jobs(
     job_type: str = Query(""),
     page: int = Query(1, ge=1),
     limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
     admin: User = Depends(admin_required),
-    db: AsyncSession = Depends(get_session),
+    service: JobAdminService = Depends(get_job_admin_service),
 ):
-    from sqlalchemy import select
-    from src.v1.model import SyncJob
-
-    query = select(SyncJob)
-
-    if status:
-        query = query.where(SyncJob.status == status)
-    if job_type:
-        query = query.where(SyncJob.type == job_type)
-
-    from sqlalchemy import func
-
-    count_result = await db.execute(select(func.count()).select_from(query.subquery()))
-    total = count_result.scalar() or 0
-
-    query = (
-        query.order_by(SyncJob.started_at.desc())
-        .offset((page - 1) * limit)
-        .limit(limit)
+    jobs, total, next_cursor = await service.list_jobs(
+        status, job_type, page, limit, cursor
     )
-    result = await db.execute(query)
-    jobs = result.scalars().all()
 
     return SyncJobListResponse(
         items=[
@@ -343,6 +355,7 @@ async def list_jobs(
         total=total,
         page=page,
         limit=limit,
+        next_cursor=next_cursor,
     )
 
 
@@ -1,13 +1,29 @@
-from fastapi import APIRouter, Depends, Query
+from datetime import datetime, timezone
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.utils.db import get_session
 from src.utils.log import get_logger
+from src.utils.response import json_response
 from src.v1.model.users import User
 from src.v1.service.bookmark import BookmarkService
-from src.v1.route.dependencies import get_current_user, get_bookmark_service
-from src.v1.schema import MarkReadRequest, BookmarkFolderRequest, BookmarkTagRequest
-from src.v1.base.exception import ExternalAPIError
-from typing import Optional
+from src.v1.route.dependencies import (
+    ConditionalGet,
+    get_current_user,
+    get_bookmark_service,
+    get_read_session,
+)
+from src.v1.schema import (
+    MarkReadRequest,
+    BookmarkFolderRequest,
+    BookmarkTagRequest,
+    BulkReadRequest,
+    BulkFolderRequest,
+    BulkTagRequest,
+    AddBookmarkRequest,
+)
+from src.v1.base.exception import NotFoundError
+from typing import Literal, Optional
 
 logger = get_logger(__name__)
 
@@ -24,38 +40,54 @@ def _trigger_background_sync(user_id: str):
         logger.error(f"Failed to trigger background sync for user {user_id}: {e}")
 
 
-@bookmark_router.get("")  # empty string = "/bookmarks" (not "/bookmarks/")
+def _trigger_outbox_drain():
+    """Start draining the X outbox now instead of at the next beat tick."""
+    try:
+        from src.celery.task import drain_x_outbox_task
+
+        drain_x_outbox_task.delay()
+    except Exception as e:
+        logger.error(f"Failed to trigger outbox drain: {e}")
+
+
+@bookmark_router.get(
+    "",  # empty string = "/bookmarks" (not "/bookmarks/")
+    dependencies=[Depends(ConditionalGet("bookmarks"))],
+)
 async def get_bookmarks(
+    response: Response,
     limit: int = 10,
     offset: int = 0,
     search: Optional[str] = Query(None, description="Full-text search"),
     sort: Optional[str] = Query(
-        "date-desc", description="Sort: date-desc, date-asc, alpha-asc, alpha-desc"
+        "date-desc",
+        description="Sort: date-desc, date-asc, alpha-asc, alpha-desc, relevance",
     ),
     tags: Optional[str] = Query(None, description="Comma-separated tag IDs"),
+    tag_mode: Literal["any", "all"] = Query(
+        "any", description="Match bookmarks with any (default) or all of the tags"
+    ),
     folder_id: Optional[str] = Query(None, description="Filter by folder ID"),
     unread: Optional[bool] = Query(None, description="Filter only unread bookmarks"),
+    highlight: bool = Query(False, description="Include search snippets"),
+    author: Optional[str] = Query(
+        None, description="Filter by author name or @handle (typo-tolerant)"
+    ),
     current_user: User = Depends(get_current_user),
     bookmark_service: BookmarkService = Depends(get_bookmark_service),
-    db: AsyncSession = Depends(get_session),
+    db: AsyncSession = Depends(get_read_session),
 ):
     """
     List user's bookmarks.
 
-    Returns immediately from DB. If DB is empty, triggers background sync
-    and returns empty - user polls or clicks refresh to get data.
+    Returns immediately from DB (or the per-user feed cache). If DB is empty,
+    triggers background sync and returns empty - user polls or clicks refresh
+    to get data.
     """
     user_id = current_user.id
     tag_ids = tags.split(",") if tags else []
 
-    bookmark_count = await bookmark_service.count_user_bookmarks(db, user_id)
-    logger.info(f"User {user_id} has {bookmark_count} bookmarks in DB")
-
-    if bookmark_count == 0:
-        logger.info(f"DB empty for user {user_id}, triggering background sync")
-        _trigger_background_sync(str(user_id))
-
-    result = await bookmark_service.get_bookmarks_from_db(
+    result = await bookmark_service.get_bookmark_feed(
         db,
         user_id,
         limit=limit,
@@ -65,10 +97,136 @@ async def get_bookmarks(
         tag_ids=tag_ids,
         folder_id=folder_id,
         unread=unread,
+        highlight=highlight,
+        author=author,
+        tag_mode=tag_mode,
     )
 
+    if not result["data"] and offset == 0:
+        bookmark_count = await bookmark_service.count_user_bookmarks(db, user_id)
+        if bookmark_count == 0:
+            logger.info(f"DB empty for user {user_id}, triggering background sync")
+            _trigger_background_sync(str(user_id))
+
     result["meta"]["last_synced_at"] = current_user.last_front_sync_time
-    return result
+    return json_response(result, response)
+
+
+@bookmark_router.get("/export")
+async def export_bookmarks(
+    export_format: Literal["ndjson", "csv"] = Query(
+        "ndjson", alias="format", description="Export format: ndjson or csv"
+    ),
+    current_user: User = Depends(get_current_user),
+    bookmark_service: BookmarkService = Depends(get_bookmark_service),
+):
+    """
+    Download the user's whole library (tags, folders, media and referenced
+    tweets included) as a streamed NDJSON or CSV file.
+    """
+    user_id = current_user.id
+    media_type = "text/csv" if export_format == "csv" else "application/x-ndjson"
+    filename = (
+        f"bookmarks-{datetime.now(timezone.utc):%Y%m%d-%H%M%S}.{export_format}"
+    )
+
+    return StreamingResponse(
+        bookmark_service.stream_export(user_id, export_format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@bookmark_router.post("", status_code=202)
+async def create_bookmark(
+    request: AddBookmarkRequest,
+    current_user: User = Depends(get_current_user),
+    bookmark_service: BookmarkService = Depends(get_bookmark_service),
+    db: AsyncSession = Depends(get_session),
+):
+    """
+    Bookmark a tweet on X. The write is queued in the outbox; the bookmark
+    shows up in the library after the worker's follow-up sync.
+    """
+    queued = await bookmark_service.create_bookmark(
+        db, current_user.id, request.tweet_id
+    )
+    if queued:
+        _trigger_outbox_drain()
+    return {
+        "status": "queued" if queued else "exists",
+        "tweet_id": request.tweet_id,
+    }
+
+
+# Bulk routes are declared before the /{bookmark_id} routes so "bulk" is
+# never taken for a bookmark ID.
+@bookmark_router.post("/bulk/read")
+async def bulk_mark_read(
+    request: BulkReadRequest,
+    current_user: User = Depends(get_current_user),
+    bookmark_service: BookmarkService = Depends(get_bookmark_service),
+    db: AsyncSession = Depends(get_session),
+):
+    """Mark bookmarks selected by IDs or by a feed filter as read or unread."""
+    updated = await bookmark_service.bulk_set_read_state(
+        db,
+        current_user.id,
+        request.is_read,
+        bookmark_ids=request.bookmark_ids,
+        filters=request.filter.model_dump() if request.filter else None,
+    )
+    return {"status": "updated", "is_read": request.is_read, "updated": updated}
+
+
+@bookmark_router.post("/bulk/folders")
+async def bulk_update_folder(
+    request: BulkFolderRequest,
+    current_user: User = Depends(get_current_user),
+    bookmark_service: BookmarkService = Depends(get_bookmark_service),
+    db: AsyncSession = Depends(get_session),
+):
+    """Add bookmarks selected by IDs or by a feed filter to a folder, or remove them."""
+    from uuid import UUID
+
+    updated = await bookmark_service.bulk_update_folder(
+        db,
+        current_user.id,
+        UUID(request.folder_id),
+        request.action,
+        bookmark_ids=request.bookmark_ids,
+        filters=request.filter.model_dump() if request.filter else None,
+    )
+    return {
+        "status": "added" if request.action == "add" else "removed",
+        "folder_id": request.folder_id,
+        "updated": updated,
+    }
+
+
+@bookmark_router.post("/bulk/tags")
+async def bulk_update_tag(
+    request: BulkTagRequest,
+    current_user: User = Depends(get_current_user),
+    bookmark_service: BookmarkService = Depends(get_bookmark_service),
+    db: AsyncSession = Depends(get_session),
+):
+    """Tag or untag bookmarks selected by IDs or by a feed filter."""
+    from uuid import UUID
+
+    updated = await bookmark_service.bulk_update_tag(
+        db,
+        current_user.id,
+        UUID(request.tag_id),
+        request.action,
+        bookmark_ids=request.bookmark_ids,
+        filters=request.filter.model_dump() if request.filter else None,
+    )
+    return {
+        "status": "added" if request.action == "add" else "removed",
+        "tag_id": request.tag_id,
+        "updated": updated,
+    }
 
 
 @bookmark_router.delete("/{bookmark_id}")
@@ -79,41 +237,18 @@ async def delete_bookmark(
     db: AsyncSession = Depends(get_session),
 ):
     """
-    Delete a bookmark from both SaveStack DB and X API.
-    X API is source of truth - if X API fails, abort and keep local record.
+    Delete a bookmark from SaveStack and queue its deletion on X.
+    The X call is made by the outbox worker, so this never waits on X.
     """
-    from src.v1.service.utils import get_valid_tokens
-    from src.v1.service.twitter import twitter_service
-    from src.v1.base.exception import BadRequest
-
     user_id = current_user.id
-    x_id = current_user.x_id
     logger.info(f"Deleting bookmark {bookmark_id} for user {user_id}")
 
-    tokens = await get_valid_tokens(str(user_id), db)
-    access_token = tokens.get("access_token")
-
-    if not access_token or not x_id:
-        raise BadRequest("Missing credentials for X API")
-
-    try:
-        await twitter_service.delete_bookmark(
-            access_token=access_token,
-            user_id=str(user_id),
-            x_id=int(x_id),
-            tweet_id=bookmark_id,
-        )
-        logger.info(f"Successfully deleted bookmark {bookmark_id} from X API")
-    except Exception as e:
-        logger.error(f"Failed to delete bookmark {bookmark_id} from X API: {e}")
-        raise ExternalAPIError(
-            f"Failed to delete from X: {str(e)}. Local record preserved."
-        )
-
-    await bookmark_service.delete_bookmark(db, str(user_id), bookmark_id)
-    logger.info(f"Successfully deleted bookmark {bookmark_id} from local DB")
+    deleted = await bookmark_service.delete_bookmark(db, str(user_id), bookmark_id)
+    if not deleted:
+        raise NotFoundError("Bookmark not found")
+    _trigger_outbox_drain()
 
-    return {"status": "deleted", "bookmark_id": bookmark_id}
+    return {"status": "deleted", "bookmark_id": bookmark_id, "x_sync": "pending"}
 
 
 @bookmark_router.patch("/{bookmark_id}/read")
@@ -184,7 +319,7 @@ async def get_bookmark_folders(
     bookmark_id: str,
     current_user: User = Depends(get_current_user),
     bookmark_service: BookmarkService = Depends(get_bookmark_service),
-    db: AsyncSession = Depends(get_session),
+    db: AsyncSession = Depends(get_read_session),
 ):
     """Get folders containing a bookmark."""
     from uuid import UUID
@@ -240,7 +375,7 @@ async def get_bookmark_tags(
     bookmark_id: str,
     current_user: User = Depends(get_current_user),
     bookmark_service: BookmarkService = Depends(get_bookmark_service),
-    db: AsyncSession = Depends(get_session),
+    db: AsyncSession = Depends(get_read_session),
 ):
     """Get tags for a bookmark."""
     user_id = current_user.id
@@ -248,22 +383,31 @@ async def get_bookmark_tags(
     return tags
 
 
-@bookmark_router.get("/sync-status")
+@bookmark_router.get(
+    "/sync-status", dependencies=[Depends(ConditionalGet("sync-status"))]
+)
 async def get_sync_status(
+    response: Response,
     current_user: User = Depends(get_current_user),
     bookmark_service: BookmarkService = Depends(get_bookmark_service),
-    db: AsyncSession = Depends(get_session),
+    db: AsyncSession = Depends(get_read_session),
 ):
     """
     Get sync status for the user's bookmarks.
 
-    Returns the last sync timestamp and backfill completion status.
+    Returns the last sync timestamp, backfill completion status and the
+    user's bookmark/unread counts.
     """
     user_id = current_user.id
 
     last_sync_time = await bookmark_service.get_last_sync_time(db, user_id)
-
-    return {
-        "last_sync_time": last_sync_time.isoformat() if last_sync_time else None,
-        "is_backfill_complete": current_user.is_backfill_complete,
-    }
+    counts = await bookmark_service.get_bookmark_counts(db, user_id)
+
+    return json_response(
+        {
+            "last_sync_time": last_sync_time.isoformat() if last_sync_time else None,
+            "is_backfill_complete": current_user.is_backfill_complete,
+            **counts,
+        },
+        response,
+    )
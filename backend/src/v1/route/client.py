@@ -1,9 +1,18 @@
-from fastapi import APIRouter, Depends
+from typing import AsyncIterator, Optional
+
+import orjson
+from fastapi import APIRouter, Depends, Header, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.utils.db import get_session
 from src.utils.log import get_logger
 from src.v1.model.users import User
-from src.v1.route.dependencies import get_current_user, get_bookmark_service
+from src.utils.redis import events_channel, get_data_version, get_redis
+from src.v1.route.dependencies import (
+    access_token_bearer,
+    get_current_user,
+    get_bookmark_service,
+)
 from src.v1.schema import SyncResponse
 from src.v1.service.bookmark import BookmarkService
 
@@ -11,6 +20,9 @@ logger = get_logger(__name__)
 
 client_router = APIRouter(prefix="/client", tags=["client"])
 
+# Comment frames keep proxies from closing an idle event stream.
+SSE_HEARTBEAT_INTERVAL = 15  # seconds
+
 from src.v1.route.bookmark import bookmark_router
 from src.v1.route.folder import folder_router
 from src.v1.route.tag import tag_router
@@ -43,6 +55,71 @@ async def trigger_sync(
     )
 
 
+def _sse_frame(event: str, data, event_id=None) -> bytes:
+    frame = f"event: {event}\n"
+    if event_id is not None:
+        frame += f"id: {event_id}\n"
+    return frame.encode() + b"data: " + orjson.dumps(data) + b"\n\n"
+
+
+async def _event_stream(
+    request: Request, user_id: str, last_event_id: Optional[str]
+) -> AsyncIterator[bytes]:
+    """Relay the user's Redis pub/sub channel as Server-Sent Events."""
+    redis = await get_redis()
+    pubsub = redis.pubsub()
+    await pubsub.subscribe(events_channel(user_id))
+    try:
+        # Subscribed before reading the version, so no change can slip
+        # between the two. A reconnecting client whose Last-Event-ID is
+        # behind missed a change while disconnected.
+        version = await get_data_version(user_id)
+        yield _sse_frame("ready", {"version": version}, event_id=version)
+        if last_event_id is not None and last_event_id != str(version):
+            yield _sse_frame("data_changed", {"version": version}, event_id=version)
+
+        while not await request.is_disconnected():
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=SSE_HEARTBEAT_INTERVAL
+            )
+            if message is None:
+                yield b": keep-alive\n\n"
+                continue
+            payload = orjson.loads(message["data"])
+            yield _sse_frame(payload["event"], payload["data"], payload.get("id"))
+    finally:
+        await pubsub.unsubscribe()
+        await pubsub.aclose()
+
+
+@client_router.get("/events")
+async def stream_events(
+    request: Request,
+    user_details: dict = Depends(access_token_bearer),
+    last_event_id: Optional[str] = Header(None),
+):
+    """
+    Server-Sent Events stream of changes to the user's library.
+
+    Events:
+    - ready: sent on connect with the current data version
+    - data_changed: something the client displays changed (the event id is
+      the new data version); refetch, conditional GETs will now miss
+    - sync_completed / sync_failed: a sync task finished
+
+    Clients that can send an Authorization header (fetch-based SSE clients)
+    should listen here instead of polling after POST /client/sync; no
+    database connection is held while the stream is open.
+    """
+    user_id = user_details["user"]["user_id"]
+    logger.info(f"Opening event stream for user_id={user_id}")
+    return StreamingResponse(
+        _event_stream(request, user_id, last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 client_router.include_router(bookmark_router)
 client_router.include_router(folder_router)
 client_router.include_router(tag_router)
@@ -1,6 +1,6 @@
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.utils.db import get_session
+from src.utils.db import get_session, get_async_read_session
 from src.v1.auth.service import AccessTokenBearer
 from src.v1.service.user import UserService
 from src.v1.model.users import User
@@ -12,16 +12,40 @@ from src.v1.service.admin import (
     StatsService,
     UserAdminService,
     AuditService,
+    JobAdminService,
     HealthService,
 )
 from src.v1.auth.twitter_auth import TwitterAuthService
-from fastapi import Depends, HTTPException, Request
+from fastapi import Depends, HTTPException, Request, Response
 from src.utils.log import get_logger
-from src.v1.base.exception import Unauthorized
+from src.utils.redis import get_data_version
+from src.v1.base.exception import NotModified, Unauthorized
+from typing import AsyncGenerator, Optional
+import hashlib
 
 logger = get_logger(__name__)
 
 
+access_token_bearer = AccessTokenBearer()
+
+
+async def get_read_session(
+    user_details: dict = Depends(access_token_bearer),
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency function to get a session for read-only routes.
+
+    Uses a read replica when DATABASE_REPLICA_URLS is set, except right after
+    the user's own write (see bump_data_version), when reads stay on the
+    primary so the user sees what they just wrote.
+
+    Yields:
+        AsyncSession: Database session (never commits)
+    """
+    async with get_async_read_session(user_details["user"]["user_id"]) as session:
+        yield session
+
+
 def get_user_service(db: AsyncSession = Depends(get_session)):
     """
     Dependency function to get an instance of UserService.
@@ -92,7 +116,7 @@ def get_admin_auth_service(db: AsyncSession = Depends(get_session)):
     return AdminAuthService(db)
 
 
-def get_stats_service(db: AsyncSession = Depends(get_session)):
+def get_stats_service(db: AsyncSession = Depends(get_read_session)):
     """
     Dependency function to get an instance of StatsService.
 
@@ -122,7 +146,17 @@ def get_audit_service(db: AsyncSession = Depends(get_session)):
     return AuditService(db)
 
 
-def get_health_service(db: AsyncSession = Depends(get_session)):
+def get_job_admin_service(db: AsyncSession = Depends(get_session)):
+    """
+    Dependency function to get an instance of JobAdminService.
+
+    Returns:
+        JobAdminService: An instance of the JobAdminService.
+    """
+    return JobAdminService(db)
+
+
+def get_health_service(db: AsyncSession = Depends(get_read_session)):
     """
     Dependency function to get an instance of HealthService.
 
@@ -133,7 +167,7 @@ def get_health_service(db: AsyncSession = Depends(get_session)):
 
 
 async def get_current_user(
-    user_details: dict = Depends(AccessTokenBearer()),
+    user_details: dict = Depends(access_token_bearer),
     user_service: UserService = Depends(get_user_service),
 ):
     logger.info(f"user details: {user_details}")
@@ -148,3 +182,51 @@ async def admin_required(
     if user.role != "admin":
         raise Unauthorized()
     return user
+
+
+class ConditionalGet:
+    """
+    Conditional-GET dependency for polled client read endpoints.
+
+    The ETag is derived from the user's data version (bumped after every write)
+    plus the endpoint and query string, so it only needs the JWT and one Redis
+    read. A matching If-None-Match raises NotModified (304) before the user is
+    loaded or any query runs. Declare it as the route's first dependency.
+
+    Usage:
+        @router.get("", dependencies=[Depends(ConditionalGet("folders"))])
+    """
+
+    CACHE_CONTROL = "private, no-cache"
+
+    def __init__(self, resource: str):
+        self.resource = resource
+
+    async def __call__(
+        self,
+        request: Request,
+        response: Response,
+        user_details: dict = Depends(access_token_bearer),
+    ) -> Optional[str]:
+        user_id = user_details["user"]["user_id"]
+        try:
+            version = await get_data_version(user_id)
+        except Exception as e:
+            logger.error(f"Skipping ETag for user {user_id}: {str(e)}")
+            return None
+
+        digest = hashlib.sha1(
+            f"{self.resource}:{user_id}:{version}:{request.url.query}".encode()
+        ).hexdigest()
+        etag = f'"{digest}"'
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and (
+            if_none_match.strip() == "*"
+            or etag in [tag.strip() for tag in if_none_match.split(",")]
+        ):
+            raise NotModified(etag)
+
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = self.CACHE_CONTROL
+        return etag
@@ -1,10 +1,16 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.utils.db import get_session
 from src.utils.log import get_logger
+from src.utils.response import json_response
 from src.v1.model.users import User
 from src.v1.service.folder import FolderService
-from src.v1.route.dependencies import get_current_user, get_folder_service
+from src.v1.route.dependencies import (
+    ConditionalGet,
+    get_current_user,
+    get_folder_service,
+    get_read_session,
+)
 from src.v1.schema import CreateFolderRequest, UpdateFolderRequest
 from uuid import UUID
 
@@ -13,16 +19,17 @@ logger = get_logger(__name__)
 folder_router = APIRouter(prefix="/folders", tags=["folders"])
 
 
-@folder_router.get("")
+@folder_router.get("", dependencies=[Depends(ConditionalGet("folders"))])
 async def get_folders(
+    response: Response,
     current_user: User = Depends(get_current_user),
     folder_service: FolderService = Depends(get_folder_service),
-    db: AsyncSession = Depends(get_session),
+    db: AsyncSession = Depends(get_read_session),
 ):
     """Get all folders for the current user."""
     user_id = current_user.id
     folders = await folder_service.get_folders(db, user_id)
-    return folders
+    return json_response(folders, response)
 
 
 @folder_router.post("")
@@ -58,7 +65,7 @@ async def get_folder(
     folder_id: str,
     current_user: User = Depends(get_current_user),
     folder_service: FolderService = Depends(get_folder_service),
-    db: AsyncSession = Depends(get_session),
+    db: AsyncSession = Depends(get_read_session),
 ):
     """Get a single folder by ID."""
     user_id = current_user.id
@@ -1,10 +1,16 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.utils.db import get_session
 from src.utils.log import get_logger
+from src.utils.response import json_response
 from src.v1.model.users import User
 from src.v1.service.tag import TagService
-from src.v1.route.dependencies import get_current_user, get_tag_service
+from src.v1.route.dependencies import (
+    ConditionalGet,
+    get_current_user,
+    get_tag_service,
+    get_read_session,
+)
 from src.v1.schema import CreateTagRequest, UpdateTagRequest
 from src.v1.base.exception import NotFoundError
 from uuid import UUID
@@ -14,16 +20,17 @@ logger = get_logger(__name__)
 tag_router = APIRouter(prefix="/tags", tags=["tags"])
 
 
-@tag_router.get("")
+@tag_router.get("", dependencies=[Depends(ConditionalGet("tags"))])
 async def get_tags(
+    response: Response,
     current_user: User = Depends(get_current_user),
     tag_service: TagService = Depends(get_tag_service),
-    db: AsyncSession = Depends(get_session),
+    db: AsyncSession = Depends(get_read_session),
 ):
     """Get all tags for the current user."""
     user_id = current_user.id
     tags = await tag_service.get_tags(db, user_id)
-    return tags
+    return json_response(tags, response)
 
 
 @tag_router.get("/name/{name}")
@@ -31,7 +38,7 @@ async def get_tag_by_name(
     name: str,
     current_user: User = Depends(get_current_user),
     tag_service: TagService = Depends(get_tag_service),
-    db: AsyncSession = Depends(get_session),
+    db: AsyncSession = Depends(get_read_session),
 ):
     """Get a tag by name."""
     user_id = current_user.id
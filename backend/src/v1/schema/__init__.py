@@ -13,6 +13,7 @@ from src.v1.schema.admin import (
     InviteAdminResponse,
     StatsOverview,
     StatsDatePoint,
+    SyncJobStatsPoint,
     PaginationParams,
     UserListItem,
     UserListResponse,
@@ -27,6 +28,7 @@ from src.v1.schema.admin import (
     OAuthTokenListResponse,
     RateLimitItem,
     HealthMetricsResponse,
+    RouteLatencyItem,
     ResponseTimePoint,
     ErrorRatePoint,
     ErrorLogItem,
@@ -45,6 +47,12 @@ from src.v1.schema.bookmark import (
     MarkReadRequest,
     BookmarkFolderRequest,
     BookmarkTagRequest,
+    BulkBookmarkFilter,
+    BulkReadRequest,
+    BulkFolderRequest,
+    BulkTagRequest,
+    BulkSelection,
+    AddBookmarkRequest,
 )
 
 __all__ = [
@@ -66,6 +74,12 @@ __all__ = [
     "MarkReadRequest",
     "BookmarkFolderRequest",
     "BookmarkTagRequest",
+    "BulkBookmarkFilter",
+    "BulkReadRequest",
+    "BulkFolderRequest",
+    "BulkTagRequest",
+    "BulkSelection",
+    "AddBookmarkRequest",
     "UserRole",
     "UserStatus",
     "LoginRequest",
@@ -76,6 +90,7 @@ __all__ = [
     "InviteAdminResponse",
     "StatsOverview",
     "StatsDatePoint",
+    "SyncJobStatsPoint",
     "PaginationParams",
     "UserListItem",
     "UserListResponse",
@@ -90,6 +105,7 @@ __all__ = [
     "OAuthTokenListResponse",
     "RateLimitItem",
     "HealthMetricsResponse",
+    "RouteLatencyItem",
     "ResponseTimePoint",
     "ErrorRatePoint",
     "ErrorLogItem",
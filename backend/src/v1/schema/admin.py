@@ -67,6 +67,13 @@ class StatsDatePoint(BaseModel):
     count: int
 
 
+class SyncJobStatsPoint(BaseModel):
+    date: str
+    type: str
+    status: str
+    count: int
+
+
 class PaginationParams(BaseModel):
     page: int = 1
     limit: int = 50
@@ -88,6 +95,7 @@ class UserListResponse(BaseModel):
     total: int
     page: int
     limit: int
+    next_cursor: Optional[str] = None
 
 
 class UserDetailResponse(BaseModel):
@@ -138,6 +146,7 @@ class SyncJobListResponse(BaseModel):
     total: int
     page: int
     limit: int
+    next_cursor: Optional[str] = None
 
 
 class QueueStatsResponse(BaseModel):
@@ -146,6 +155,8 @@ class QueueStatsResponse(BaseModel):
     active_jobs: int
     queued_jobs: int
     failed_jobs: int
+    queues: dict[str, int] = {}
+    sampled_at: Optional[datetime] = None
 
 
 class OAuthTokenItem(BaseModel):
@@ -178,6 +189,16 @@ class HealthMetricsResponse(BaseModel):
     redis_memory_used_mb: float
     redis_memory_total_mb: float
     rabbitmq_queue_depth: int
+    sampled_at: Optional[datetime] = None
+
+
+class RouteLatencyItem(BaseModel):
+    route: str
+    status_class: str
+    count: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
 
 
 class ResponseTimePoint(BaseModel):
@@ -201,6 +222,8 @@ class ErrorLogItem(BaseModel):
     message: str
     trace: Optional[str] = None
     source: str
+    count: int = 1
+    first_seen: Optional[datetime] = None
 
 
 class ErrorLogResponse(BaseModel):
@@ -225,6 +248,7 @@ class AuditLogResponse(BaseModel):
     total: int
     page: int
     limit: int
+    next_cursor: Optional[str] = None
 
 
 class AdminAction(str, Enum):
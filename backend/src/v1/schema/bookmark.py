@@ -88,3 +88,39 @@ class BookmarkFolderRequest(BaseModel):
 
 class BookmarkTagRequest(BaseModel):
     tag_id: str
+
+
+class BulkBookmarkFilter(BaseModel):
+    """Feed filter selecting the bookmarks of a bulk operation."""
+
+    search: Optional[str] = None
+    tag_ids: Optional[List[str]] = None
+    tag_mode: Literal["any", "all"] = "any"
+    folder_id: Optional[str] = None
+    unread: Optional[bool] = None
+    author: Optional[str] = None
+
+
+class BulkSelection(BaseModel):
+    """Either explicit bookmark IDs or a feed filter, not both."""
+
+    bookmark_ids: Optional[List[str]] = None
+    filter: Optional[BulkBookmarkFilter] = None
+
+
+class BulkReadRequest(BulkSelection):
+    is_read: bool
+
+
+class BulkFolderRequest(BulkSelection):
+    folder_id: str
+    action: Literal["add", "remove"] = "add"
+
+
+class BulkTagRequest(BulkSelection):
+    tag_id: str
+    action: Literal["add", "remove"] = "add"
+
+
+class AddBookmarkRequest(BaseModel):
+    tweet_id: str
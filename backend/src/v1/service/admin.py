@@ -1,14 +1,25 @@
+import base64
 import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import func, select
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from typing import Optional
+from uuid import UUID
 
 from src.v1.model.users import User, UserToken
+from src.v1.model import BookmarkCounter, DailyStat
+from src.v1.service.counter import SCOPE_ALL
 from src.v1.base.exception import NotFoundError, BadRequest, ServerError, Unauthorized
 from sqlalchemy.exc import SQLAlchemyError
 from src.utils.log import get_logger
 from src.utils.config import config
+from src.utils.latency import get_overall_p95, get_route_latencies
+from src.utils.redis import (
+    X_CALLS_KEY_TTL,
+    get_health_snapshot,
+    get_or_fetch_cache,
+    get_x_calls,
+)
 
 from src.v1.auth.service import auth_service, encrypt_token
 from src.v1.auth.service import hash_password, verify_password
@@ -21,6 +32,82 @@ from src.v1.schema import (
 
 logger = get_logger(__name__)
 
+STATS_OVERVIEW_CACHE_KEY = "admin:stats:overview"
+STATS_OVERVIEW_CACHE_TTL = 30  # seconds
+
+# Totals of the admin lists (users, audit logs, sync jobs) are exact counts
+# cached per filter, so browsing pages does not rescan the table; a total may
+# lag a signup or suspension by up to the TTL.
+ADMIN_COUNT_CACHE_KEY = "admin:count:{table}:{filters}"
+ADMIN_COUNT_CACHE_TTL = 60  # seconds
+
+METRIC_SIGNUPS = "signups"
+METRIC_BOOKMARKS = "bookmarks"
+METRIC_SYNC_JOBS = "sync_jobs"
+METRIC_X_CALLS = "x_calls"
+
+# sync_jobs keeps this many days of rows; older days survive as daily_stats.
+SYNC_JOBS_RETENTION_DAYS = 30
+SYNC_JOBS_PARTITION_NAME = "sync_jobs_p%Y%m%d"
+
+
+def _utc_day(column):
+    """The UTC calendar day of a timestamptz column."""
+    return func.date(func.timezone("UTC", column))
+
+
+def _day_start(day) -> datetime:
+    return datetime.combine(day, datetime.min.time(), tzinfo=timezone.utc)
+
+
+def _encode_cursor(sort_value: datetime, row_id) -> str:
+    """Opaque keyset cursor for the admin list endpoints."""
+    raw = f"{sort_value.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        sort_value, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(sort_value), UUID(row_id)
+    except (ValueError, UnicodeDecodeError):
+        raise BadRequest("Invalid cursor")
+
+
+def _paginate(
+    query, sort_column, id_column, page: int, limit: int, cursor: Optional[str]
+):
+    """
+    Order a list query newest first on (sort_column, id_column) and select one
+    page: rows after the keyset cursor when given, otherwise by page offset.
+    One extra row is fetched so _page_rows can tell whether more follow.
+    """
+    query = query.order_by(sort_column.desc(), id_column.desc()).limit(limit + 1)
+    if cursor:
+        sort_value, row_id = _decode_cursor(cursor)
+        return query.where(sa.tuple_(sort_column, id_column) < (sort_value, row_id))
+    return query.offset((page - 1) * limit)
+
+
+async def _cached_count(db: AsyncSession, table: str, filters: str, query) -> int:
+    """Exact row count of `query`, cached for ADMIN_COUNT_CACHE_TTL."""
+
+    async def fetch():
+        result = await db.execute(select(func.count()).select_from(query.subquery()))
+        return result.scalar() or 0
+
+    key = ADMIN_COUNT_CACHE_KEY.format(table=table, filters=filters)
+    return await get_or_fetch_cache(key, fetch, ttl=ADMIN_COUNT_CACHE_TTL)
+
+
+def _page_rows(rows, limit: int, sort_key) -> tuple[list, Optional[str]]:
+    """Trim the look-ahead row and build next_cursor from the last row kept."""
+    if len(rows) <= limit:
+        return list(rows), None
+    rows = rows[:limit]
+    return rows, _encode_cursor(*sort_key(rows[-1]))
+
 
 class AdminAuthService:
     def __init__(self, db: AsyncSession):
@@ -118,147 +205,410 @@ class StatsService:
         self.db = db
 
     async def get_overview(self) -> dict:
+        """Dashboard counters, cached for STATS_OVERVIEW_CACHE_TTL seconds."""
+        return await get_or_fetch_cache(
+            STATS_OVERVIEW_CACHE_KEY,
+            self._compute_overview,
+            ttl=STATS_OVERVIEW_CACHE_TTL,
+        )
+
+    async def _compute_overview(self) -> dict:
+        """
+        One aggregate per table: each window is a count(*) FILTER (WHERE ...)
+        over a single scan. bookmarks and sync_jobs are only read for the last
+        30 days, through their created_at / started_at indexes.
+        """
+        from src.v1.model import Bookmark, SyncJob
+
         now = datetime.now(timezone.utc)
         today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
         week_start = now - timedelta(days=7)
         month_start = now - timedelta(days=30)
 
-        total_users_result = await self.db.execute(select(func.count(User.id)))
-        total_users = total_users_result.scalar() or 0
+        def windows(column, include_total: bool = False) -> list:
+            counts = [
+                func.count().filter(column >= today_start).label("today"),
+                func.count().filter(column >= week_start).label("weekly"),
+                func.count().filter(column >= month_start).label("monthly"),
+            ]
+            if include_total:
+                counts.insert(0, func.count().label("total"))
+            return counts
+
+        users = (
+            await self.db.execute(
+                select(
+                    *windows(User.created_at, include_total=True),
+                    func.count()
+                    .filter(User.last_front_sync_time >= today_start)
+                    .label("active_today"),
+                    func.count()
+                    .filter(User.last_front_sync_time >= week_start)
+                    .label("active_weekly"),
+                    func.count()
+                    .filter(User.last_front_sync_time >= month_start)
+                    .label("active_monthly"),
+                )
+            )
+        ).one()
 
-        daily_users_result = await self.db.execute(
-            select(func.count(User.id)).where(User.created_at >= today_start)
-        )
-        total_users_daily = daily_users_result.scalar() or 0
+        bookmarks = (
+            await self.db.execute(
+                select(*windows(Bookmark.created_at)).where(
+                    Bookmark.created_at >= month_start
+                )
+            )
+        ).one()
 
-        weekly_users_result = await self.db.execute(
-            select(func.count(User.id)).where(User.created_at >= week_start)
-        )
-        total_users_weekly = weekly_users_result.scalar() or 0
+        jobs = (
+            await self.db.execute(
+                select(*windows(SyncJob.started_at)).where(
+                    SyncJob.started_at >= month_start
+                )
+            )
+        ).one()
 
-        monthly_users_result = await self.db.execute(
-            select(func.count(User.id)).where(User.created_at >= month_start)
-        )
-        total_users_monthly = monthly_users_result.scalar() or 0
+        return {
+            "total_users": users.total,
+            "total_users_daily": users.today,
+            "total_users_weekly": users.weekly,
+            "total_users_monthly": users.monthly,
+            "active_users": users.active_today,
+            "active_users_daily": users.active_today,
+            "active_users_weekly": users.active_weekly,
+            "active_users_monthly": users.active_monthly,
+            "bookmarks_today": bookmarks.today,
+            "bookmarks_daily": bookmarks.today,
+            "bookmarks_weekly": bookmarks.weekly,
+            "bookmarks_monthly": bookmarks.monthly,
+            "jobs_today": jobs.today,
+            "jobs_daily": jobs.today,
+            "jobs_weekly": jobs.weekly,
+            "jobs_monthly": jobs.monthly,
+        }
 
-        active_users_result = await self.db.execute(
-            select(func.count(User.id)).where(User.last_front_sync_time >= today_start)
-        )
-        active_users = active_users_result.scalar() or 0
+    async def _series(
+        self, metric: str, column, days: int, dimensions: tuple = ()
+    ) -> dict:
+        """
+        Daily counts of `metric` for the last `days` days, keyed by
+        (day, *dimensions): rolled-up days come from daily_stats, and only
+        days the rollup has not reached yet (normally just today) are
+        counted live from `column`.
+        """
+        now = datetime.now(timezone.utc)
+        start_day = (now - timedelta(days=days)).date()
 
-        active_users_daily_result = await self.db.execute(
-            select(func.count(User.id)).where(User.last_front_sync_time >= today_start)
+        # Signups get a row for every rolled-up day, so they mark coverage.
+        rolled_until = (
+            await self.db.execute(
+                select(func.max(DailyStat.day)).where(
+                    DailyStat.metric == METRIC_SIGNUPS
+                )
+            )
+        ).scalar()
+
+        counts = {}
+        live_from = start_day
+        if rolled_until is not None and rolled_until >= start_day:
+            result = await self.db.execute(
+                select(DailyStat.day, DailyStat.dimension, DailyStat.value).where(
+                    DailyStat.metric == metric,
+                    DailyStat.day >= start_day,
+                    DailyStat.day <= rolled_until,
+                )
+            )
+            for row in result.all():
+                key = (row.day, *row.dimension.split(":")) if dimensions else (row.day,)
+                counts[key] = row.value
+            live_from = rolled_until + timedelta(days=1)
+        day = _utc_day(column)
+        live = await self.db.execute(
+            select(day.label("day"), *dimensions, func.count().label("value"))
+            .where(column >= _day_start(live_from))
+            .group_by(day, *dimensions)
         )
-        active_users_daily = active_users_daily_result.scalar() or 0
+        for row in live.all():
+            counts[tuple(row)[:-1]] = row.value
+        return counts
 
-        active_users_weekly_result = await self.db.execute(
-            select(func.count(User.id)).where(User.last_front_sync_time >= week_start)
-        )
-        active_users_weekly = active_users_weekly_result.scalar() or 0
+    async def get_signups(self, days: int = 30) -> list[dict]:
+        counts = await self._series(METRIC_SIGNUPS, User.created_at, days)
+        return [
+            {"date": str(day), "count": count}
+            for (day,), count in sorted(counts.items())
+            if count
+        ]
 
-        active_users_monthly_result = await self.db.execute(
-            select(func.count(User.id)).where(User.last_front_sync_time >= month_start)
-        )
-        active_users_monthly = active_users_monthly_result.scalar() or 0
+    async def get_bookmarks(self, days: int = 14) -> list[dict]:
+        from src.v1.model import Bookmark
 
-        from src.v1.model.bookmark import Bookmark
+        counts = await self._series(METRIC_BOOKMARKS, Bookmark.created_at, days)
+        return [
+            {"date": str(day), "count": count}
+            for (day,), count in sorted(counts.items())
+            if count
+        ]
 
-        bookmarks_today_result = await self.db.execute(
-            select(func.count(Bookmark.id)).where(Bookmark.created_at >= today_start)
-        )
-        bookmarks_today = bookmarks_today_result.scalar() or 0
+    async def get_sync_jobs(self, days: int = 14) -> list[dict]:
+        from src.v1.model import SyncJob
 
-        bookmarks_daily_result = await self.db.execute(
-            select(func.count(Bookmark.id)).where(Bookmark.created_at >= today_start)
+        counts = await self._series(
+            METRIC_SYNC_JOBS,
+            SyncJob.started_at,
+            days,
+            dimensions=(SyncJob.type, func.coalesce(SyncJob.status, "")),
         )
-        bookmarks_daily = bookmarks_daily_result.scalar() or 0
+        return [
+            {"date": str(day), "type": job_type, "status": status, "count": count}
+            for (day, job_type, status), count in sorted(counts.items())
+            if count
+        ]
 
-        bookmarks_weekly_result = await self.db.execute(
-            select(func.count(Bookmark.id)).where(Bookmark.created_at >= week_start)
+    async def get_x_calls(self, days: int = 14) -> list[dict]:
+        start_day = (datetime.now(timezone.utc) - timedelta(days=days)).date()
+        result = await self.db.execute(
+            select(DailyStat.day, func.sum(DailyStat.value).label("value"))
+            .where(DailyStat.metric == METRIC_X_CALLS, DailyStat.day >= start_day)
+            .group_by(DailyStat.day)
         )
-        bookmarks_weekly = bookmarks_weekly_result.scalar() or 0
+        counts = {row.day: row.value for row in result.all()}
 
-        bookmarks_monthly_result = await self.db.execute(
-            select(func.count(Bookmark.id)).where(Bookmark.created_at >= month_start)
-        )
-        bookmarks_monthly = bookmarks_monthly_result.scalar() or 0
+        # Days past the rollup are still in Redis.
+        day = max(counts, default=start_day - timedelta(days=1)) + timedelta(days=1)
+        today = datetime.now(timezone.utc).date()
+        while day <= today:
+            try:
+                counts[day] = sum((await get_x_calls(day)).values())
+            except Exception as e:
+                logger.error(f"X call counts unavailable for {day}: {str(e)}")
+            day += timedelta(days=1)
 
-        from src.v1.model import SyncJob
+        return [
+            {"date": str(day), "count": count}
+            for day, count in sorted(counts.items())
+            if count
+        ]
 
-        jobs_today_result = await self.db.execute(
-            select(func.count(SyncJob.id)).where(SyncJob.started_at >= today_start)
-        )
-        jobs_today = jobs_today_result.scalar() or 0
 
-        jobs_daily_result = await self.db.execute(
-            select(func.count(SyncJob.id)).where(SyncJob.started_at >= today_start)
-        )
-        jobs_daily = jobs_daily_result.scalar() or 0
+class StatsRollupService:
+    """
+    Maintains daily_stats. Each run recomputes the days after the last final
+    one, with one GROUP BY per source table over just that range, and marks
+    days older than yesterday final so they are never scanned again.
+    """
 
-        jobs_weekly_result = await self.db.execute(
-            select(func.count(SyncJob.id)).where(SyncJob.started_at >= week_start)
-        )
-        jobs_weekly = jobs_weekly_result.scalar() or 0
+    def __init__(self, db: AsyncSession):
+        self.db = db
 
-        jobs_monthly_result = await self.db.execute(
-            select(func.count(SyncJob.id)).where(SyncJob.started_at >= month_start)
-        )
-        jobs_monthly = jobs_monthly_result.scalar() or 0
+    async def rollup(self) -> dict:
+        from src.v1.model import Bookmark, SyncJob
 
-        return {
-            "total_users": total_users,
-            "total_users_daily": total_users_daily,
-            "total_users_weekly": total_users_weekly,
-            "total_users_monthly": total_users_monthly,
-            "active_users": active_users,
-            "active_users_daily": active_users_daily,
-            "active_users_weekly": active_users_weekly,
-            "active_users_monthly": active_users_monthly,
-            "bookmarks_today": bookmarks_today,
-            "bookmarks_daily": bookmarks_daily,
-            "bookmarks_weekly": bookmarks_weekly,
-            "bookmarks_monthly": bookmarks_monthly,
-            "jobs_today": jobs_today,
-            "jobs_daily": jobs_daily,
-            "jobs_weekly": jobs_weekly,
-            "jobs_monthly": jobs_monthly,
-        }
+        today = datetime.now(timezone.utc).date()
+        final_before = today - timedelta(days=1)
 
-    async def get_signups(self, days: int = 30) -> list[dict]:
-        start_date = datetime.now(timezone.utc) - timedelta(days=days)
+        last_final = (
+            await self.db.execute(
+                select(func.max(DailyStat.day)).where(DailyStat.is_final == True)
+            )
+        ).scalar()
+        if last_final is not None:
+            start_day = last_final + timedelta(days=1)
+        else:
+            first_signup = (
+                await self.db.execute(select(func.min(User.created_at)))
+            ).scalar()
+            if first_signup is None:
+                return {"days": 0}
+            start_day = first_signup.astimezone(timezone.utc).date()
+
+        if start_day >= today:
+            return {"days": 0}
+
+        days = [
+            start_day + timedelta(days=offset)
+            for offset in range((today - start_day).days)
+        ]
+        # Signups and bookmarks get a row for every day, zero included, so
+        # the rollup's coverage is visible to StatsService._series.
+        values = {
+            (metric, day, ""): 0
+            for metric in (METRIC_SIGNUPS, METRIC_BOOKMARKS)
+            for day in days
+        }
 
-        result = await self.db.execute(
-            select(
-                func.date(User.created_at).label("date"),
-                func.count(User.id).label("count"),
+        sources = (
+            (METRIC_SIGNUPS, User.created_at, ()),
+            (METRIC_BOOKMARKS, Bookmark.created_at, ()),
+            (
+                METRIC_SYNC_JOBS,
+                SyncJob.started_at,
+                (SyncJob.type, func.coalesce(SyncJob.status, "")),
+            ),
+        )
+        for metric, column, dimensions in sources:
+            day = _utc_day(column)
+            result = await self.db.execute(
+                select(day.label("day"), *dimensions, func.count().label("value"))
+                .where(column >= _day_start(start_day), column < _day_start(today))
+                .group_by(day, *dimensions)
+            )
+            for row in result.all():
+                dimension = ":".join(tuple(row)[1:-1])
+                values[(metric, row.day, dimension)] = row.value
+
+        for day in days:
+            if today - day > timedelta(seconds=X_CALLS_KEY_TTL):
+                continue
+            for endpoint, count in (await get_x_calls(day)).items():
+                values[(METRIC_X_CALLS, day, endpoint)] = count
+
+        await self.db.execute(
+            sa.delete(DailyStat).where(
+                DailyStat.day >= start_day, DailyStat.day < today
             )
-            .where(User.created_at >= start_date)
-            .group_by(func.date(User.created_at))
-            .order_by(func.date(User.created_at))
         )
+        await self.db.execute(
+            sa.insert(DailyStat),
+            [
+                {
+                    "metric": metric,
+                    "day": day,
+                    "dimension": dimension,
+                    "value": value,
+                    "is_final": day < final_before,
+                }
+                for (metric, day, dimension), value in values.items()
+            ],
+        )
+        await self.db.commit()
 
-        return [
-            {"date": str(row.date), "count": row.count} for row in result.fetchall()
-        ]
+        logger.info(
+            f"Rolled up daily stats for {start_day}..{today - timedelta(days=1)}"
+        )
+        return {"days": len(days), "rows": len(values)}
 
-    async def get_bookmarks(self, days: int = 14) -> list[dict]:
-        start_date = datetime.now(timezone.utc) - timedelta(days=days)
 
-        from src.v1.model.bookmark import Bookmark
+class SyncJobPartitionService:
+    """
+    Maintains the daily partitions of sync_jobs: creates the coming days'
+    partitions ahead of time, moving any rows parked in the default
+    partition into them, and drops days older than SYNC_JOBS_RETENTION_DAYS.
+    A day is only dropped once its outcomes are final in daily_stats (metric
+    'sync_jobs'), which keeps the per-day type/status counts after the rows
+    are gone.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
 
+    async def _partitions(self) -> list[tuple[str, date]]:
         result = await self.db.execute(
-            select(
-                func.date(Bookmark.created_at).label("date"),
-                func.count(Bookmark.id).label("count"),
+            sa.text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = 'sync_jobs'::regclass"
             )
-            .where(Bookmark.created_at >= start_date)
-            .group_by(func.date(Bookmark.created_at))
-            .order_by(func.date(Bookmark.created_at))
+        )
+        partitions = []
+        for name in result.scalars().all():
+            try:
+                day = datetime.strptime(name, SYNC_JOBS_PARTITION_NAME).date()
+            except ValueError:
+                continue
+            partitions.append((name, day))
+        return sorted(partitions, key=lambda partition: partition[1])
+
+    async def maintain(self) -> dict:
+        from src.v1.model.admin import (
+            SYNC_JOBS_DEFAULT_PARTITION,
+            SYNC_JOBS_PARTITIONS_AHEAD,
         )
 
-        return [
-            {"date": str(row.date), "count": row.count} for row in result.fetchall()
+        today = datetime.now(timezone.utc).date()
+        cutoff = today - timedelta(days=SYNC_JOBS_RETENTION_DAYS)
+
+        # Days within retention whose jobs landed in the default partition
+        # (maintenance was not running) get their partition now as well;
+        # sync_jobs_create_partitions moves their rows into it.
+        parked_since = (
+            await self.db.execute(
+                sa.text(
+                    f"SELECT min(started_at) FROM {SYNC_JOBS_DEFAULT_PARTITION} "
+                    "WHERE started_at >= :cutoff"
+                ),
+                {"cutoff": _day_start(cutoff)},
+            )
+        ).scalar()
+        first_day = today
+        if parked_since is not None:
+            first_day = min(today, parked_since.astimezone(timezone.utc).date())
+
+        await self.db.execute(
+            sa.text("SELECT sync_jobs_create_partitions(:first_day, :last_day)"),
+            {
+                "first_day": first_day,
+                "last_day": today + timedelta(days=SYNC_JOBS_PARTITIONS_AHEAD),
+            },
+        )
+        await self.db.commit()
+
+        expired = [
+            (name, day) for name, day in await self._partitions() if day < cutoff
         ]
+        parked_expired = (
+            await self.db.execute(
+                sa.text(
+                    f"SELECT EXISTS (SELECT 1 FROM {SYNC_JOBS_DEFAULT_PARTITION} "
+                    "WHERE started_at < :cutoff)"
+                ),
+                {"cutoff": _day_start(cutoff)},
+            )
+        ).scalar()
+        if not expired and not parked_expired:
+            return {"dropped": [], "purged": 0}
+
+        # Bring daily_stats up to date first; past days become final there.
+        await StatsRollupService(self.db).rollup()
+        last_final = (
+            await self.db.execute(
+                select(func.max(DailyStat.day)).where(DailyStat.is_final == True)
+            )
+        ).scalar()
+
+        dropped = []
+        for name, day in expired:
+            if last_final is None or day > last_final:
+                logger.warning(
+                    f"Keeping sync_jobs partition {name}: not rolled up yet"
+                )
+                continue
+            await self.db.execute(sa.text(f'DROP TABLE IF EXISTS "{name}"'))
+            dropped.append(name)
+
+        # Expired rows left in the default partition are deleted row by row;
+        # only days that never had a partition end up there.
+        purged = 0
+        if parked_expired and last_final is not None:
+            result = await self.db.execute(
+                sa.text(
+                    f"DELETE FROM {SYNC_JOBS_DEFAULT_PARTITION} "
+                    "WHERE started_at < :before"
+                ),
+                {
+                    "before": _day_start(
+                        min(cutoff, last_final + timedelta(days=1))
+                    )
+                },
+            )
+            purged = result.rowcount
+        await self.db.commit()
+
+        logger.info(
+            f"Dropped expired sync_jobs partitions: {dropped}, "
+            f"purged {purged} expired rows from the default partition"
+        )
+        return {"dropped": dropped, "purged": purged}
 
 
 class UserAdminService:
@@ -266,57 +616,82 @@ class UserAdminService:
         self.db = db
 
     async def list_users(
-        self, search: str = "", status: str = "", page: int = 1, limit: int = 50
-    ) -> tuple[list[User], int]:
-        offset = (page - 1) * limit
-
-        query = select(User)
+        self,
+        search: str = "",
+        status: str = "",
+        page: int = 1,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> tuple[list[dict], int, Optional[str]]:
+        """
+        List users newest first with their bookmark counts.
+
+        Pages by keyset on (created_at, id) when a cursor is given, otherwise
+        by offset; next_cursor continues from the last row either way. Search
+        is a substring match served by the trigram indexes on email, username
+        and name. Bookmark counts come from the maintained 'all' counters in
+        the same query; the total is cached like the other admin lists.
+        """
+        conditions = []
 
         if search:
-            query = query.where(
+            pattern = f"%{search}%"
+            conditions.append(
                 sa.or_(
-                    User.email.ilike(f"%{search}%"),
-                    User.username.ilike(f"%{search}%"),
-                    User.name.ilike(f"%{search}%"),
+                    User.email.ilike(pattern),
+                    User.username.ilike(pattern),
+                    User.name.ilike(pattern),
                 )
             )
 
         if status == "suspended":
-            query = query.where(User.deleted_at != None)
+            conditions.append(User.deleted_at != None)
         elif status == "active":
-            query = query.where(User.deleted_at == None)
+            conditions.append(User.deleted_at == None)
 
-        count_result = await self.db.execute(
-            select(func.count()).select_from(query.subquery())
+        total = await _cached_count(
+            self.db,
+            "users",
+            f"{status}:{search.lower()}",
+            select(User.id).where(*conditions),
         )
-        total = count_result.scalar() or 0
 
-        query = query.order_by(User.created_at.desc()).offset(offset).limit(limit)
+        query = (
+            select(
+                User,
+                func.coalesce(BookmarkCounter.total, 0).label("bookmark_count"),
+            )
+            .outerjoin(
+                BookmarkCounter,
+                sa.and_(
+                    BookmarkCounter.user_id == User.id,
+                    BookmarkCounter.scope == SCOPE_ALL,
+                    BookmarkCounter.scope_id == User.id,
+                ),
+            )
+            .where(*conditions)
+        )
+        query = _paginate(query, User.created_at, User.id, page, limit, cursor)
 
         result = await self.db.execute(query)
-        users = result.scalars().all()
-
-        user_list = []
-        for user in users:
-            bookmark_count_result = await self.db.execute(
-                select(func.count()).select_from(
-                    select(User).where(User.id == user.id).subquery()
-                )
-            )
+        rows, next_cursor = _page_rows(
+            result.all(), limit, lambda row: (row.User.created_at, row.User.id)
+        )
 
-            user_list.append(
-                {
-                    "id": str(user.id),
-                    "email": user.email,
-                    "username": user.username,
-                    "name": user.name,
-                    "role": user.role,
-                    "created_at": user.created_at,
-                    "bookmark_count": 0,
-                }
-            )
+        user_list = [
+            {
+                "id": str(user.id),
+                "email": user.email,
+                "username": user.username,
+                "name": user.name,
+                "role": user.role,
+                "created_at": user.created_at,
+                "bookmark_count": bookmark_count,
+            }
+            for user, bookmark_count in rows
+        ]
 
-        return user_list, total
+        return user_list, total, next_cursor
 
     async def get_user(self, user_id: str) -> Optional[User]:
         result = await self.db.execute(select(User).where(User.id == user_id))
@@ -438,43 +813,131 @@ class AuditService:
             await self.db.rollback()
             logger.error(f"Error writing audit log: {e}")
 
+    async def list_logs(
+        self,
+        action: str = "",
+        page: int = 1,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> tuple[list, int, Optional[str]]:
+        """List audit log entries newest first, optionally for one action."""
+        from src.v1.model import AdminAuditLog
+
+        query = select(AdminAuditLog)
+        if action:
+            query = query.where(AdminAuditLog.action == action)
+
+        total = await _cached_count(self.db, "admin_audit_logs", action, query)
+
+        result = await self.db.execute(
+            _paginate(
+                query, AdminAuditLog.timestamp, AdminAuditLog.id, page, limit, cursor
+            )
+        )
+        logs, next_cursor = _page_rows(
+            result.scalars().all(), limit, lambda log: (log.timestamp, log.id)
+        )
+        return logs, total, next_cursor
+
+
+class JobAdminService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def list_jobs(
+        self,
+        status: str = "",
+        job_type: str = "",
+        page: int = 1,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> tuple[list, int, Optional[str]]:
+        """List sync jobs by start time, newest first, optionally filtered."""
+        from src.v1.model import SyncJob
+
+        query = select(SyncJob)
+        if status:
+            query = query.where(SyncJob.status == status)
+        if job_type:
+            query = query.where(SyncJob.type == job_type)
+
+        total = await _cached_count(
+            self.db, "sync_jobs", f"{status}:{job_type}", query
+        )
+
+        result = await self.db.execute(
+            _paginate(query, SyncJob.started_at, SyncJob.id, page, limit, cursor)
+        )
+        jobs, next_cursor = _page_rows(
+            result.scalars().all(), limit, lambda job: (job.started_at, job.id)
+        )
+        return jobs, total, next_cursor
+
 
 class HealthService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
     async def get_metrics(self) -> dict:
-        redis_info = {}
+        """Health summary from the collector's latest snapshot (never blocks)."""
+        snapshot = await self._snapshot()
         try:
-            from src.utils.redis import get_redis_sync
-
-            r = get_redis_sync()
-            info = r.info("memory")
-            redis_info = {
-                "used": info.get("used_memory", 0) / 1024 / 1024,
-                "total": info.get("maxmemory", 0) / 1024 / 1024,
-            }
+            api_p95_latency_ms = await get_overall_p95()
         except Exception as e:
-            logger.error(f"Error getting Redis info: {e}")
-
-        celery_workers = 0
-        try:
-            from src.celery.celery import celery_app
+            logger.error(f"Latency histograms unavailable: {e}")
+            api_p95_latency_ms = 0
+        return {
+            "api_p95_latency_ms": api_p95_latency_ms,
+            "celery_workers": len(snapshot.get("workers", [])),
+            "redis_memory_used_mb": snapshot.get("redis_memory_used_mb", 0),
+            "redis_memory_total_mb": snapshot.get("redis_memory_total_mb", 0),
+            "rabbitmq_queue_depth": sum(snapshot.get("queues", {}).values()),
+            "sampled_at": snapshot.get("sampled_at"),
+        }
 
-            inspect = celery_app.control.inspect()
-            stats = inspect.stats()
-            celery_workers = len(stats) if stats else 0
-        except Exception as e:
-            logger.error(f"Error getting Celery stats: {e}")
+    async def get_route_latencies(self, minutes: int) -> list[dict]:
+        """p50/p95/p99 per route and status class, across all API workers."""
+        return await get_route_latencies(minutes)
 
+    async def get_queue_stats(self) -> dict:
+        """Queue and worker counts from the collector's latest snapshot."""
+        snapshot = await self._snapshot()
+        queues = snapshot.get("queues", {})
         return {
-            "api_p95_latency_ms": 0,
-            "celery_workers": celery_workers,
-            "redis_memory_used_mb": redis_info.get("used", 0),
-            "redis_memory_total_mb": redis_info.get("total", 0),
-            "rabbitmq_queue_depth": 0,
+            "active_workers": len(snapshot.get("workers", [])),
+            "queue_depth": sum(queues.values()),
+            "active_jobs": snapshot.get("active_tasks", 0),
+            "queued_jobs": sum(queues.values()) + snapshot.get("reserved_tasks", 0),
+            "failed_jobs": snapshot.get("failed_jobs", 0),
+            "queues": queues,
+            "sampled_at": snapshot.get("sampled_at"),
         }
 
+    async def _snapshot(self) -> dict:
+        try:
+            snapshot = await get_health_snapshot()
+        except Exception as e:
+            logger.error(f"Health snapshot unavailable: {e}")
+            return {}
+        if snapshot is None:
+            logger.warning(
+                "No health snapshot; is collect_health_snapshot_task running?"
+            )
+            return {}
+        return snapshot
+
+    async def count_failed_jobs(self, hours: int = 24) -> int:
+        """Sync jobs that failed among those started in the last `hours`."""
+        from src.v1.model import SyncJob
+
+        since = datetime.now(timezone.utc) - timedelta(hours=hours)
+        result = await self.db.execute(
+            select(func.count()).where(
+                SyncJob.started_at >= since, SyncJob.status == "failed"
+            )
+        )
+        return result.scalar() or 0
+
     async def get_error_logs(self, level: str = "error", limit: int = 50) -> list[dict]:
         from src.v1.model import ErrorLog
 
@@ -495,6 +958,8 @@ class HealthService:
                 "message": log.message,
                 "trace": log.trace,
                 "source": log.source,
+                "count": log.count,
+                "first_seen": log.first_seen,
             }
             for log in logs
         ]
@@ -1,14 +1,34 @@
+import csv
+import hashlib
+import io
+import json
 import re
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional
 from uuid import UUID
 from .utils import _clean_structure, read_json_file
 
+import orjson
 import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSON, aggregate_order_by, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
 from src.v1.model.users import User, UserToken
 from sqlalchemy.exc import IntegrityError, DatabaseError, SQLAlchemyError
 from src.v1.service.user import UserService
+from src.utils.db import get_async_read_session
+from src.utils.redis import bump_data_version, get_data_version, get_or_fetch_cache
+from src.v1.service.outbox import (
+    outbox_service,
+    OP_CREATE_BOOKMARK,
+    OP_DELETE_BOOKMARK,
+)
+from src.v1.service.counter import (
+    bookmark_id_in,
+    counter_service,
+    SCOPE_ALL,
+    SCOPE_FOLDER,
+    SCOPE_TAG,
+)
 from datetime import datetime, timedelta, timezone
 from src.v1.schema.bookmark import (
     BookmarkResponse,
@@ -27,6 +47,8 @@ from src.v1.model import (
     Folder as FolderModel,
     Tag as TagModel,
     Media as MediaModel,
+    BookmarkCounter,
+    SORT_TEXT_LENGTH,
     bookmark_folders,
     bookmark_tags,
 )
@@ -53,6 +75,49 @@ logger = get_logger(__name__)
 
 TCO_PATTERN = re.compile(r"^https://t\.co/[a-zA-Z0-9]{10}$")
 
+# Configs a search term is parsed with. Each post's search_vector holds its own
+# language's stems plus 'simple' lexemes, so OR-ing the query across these keeps
+# it a constant expression that the GIN index on posts.search_vector can serve.
+SEARCH_QUERY_CONFIGS = (
+    "simple",
+    "english",
+    "spanish",
+    "french",
+    "german",
+    "portuguese",
+    "italian",
+    "dutch",
+    "russian",
+)
+# How many authors a single fuzzy author term may resolve to. Fuzzy matches use
+# the pg_trgm `%` operator (similarity >= pg_trgm.similarity_threshold, 0.3).
+AUTHOR_MATCH_LIMIT = 5
+# Most explicit bookmark_ids a single bulk read/folder/tag update may name;
+# larger selections go through the feed filter instead.
+BULK_MAX_IDS = 10000
+
+# Rows fetched per server-side cursor round trip when exporting a library.
+EXPORT_BATCH_SIZE = 1000
+EXPORT_CSV_FIELDS = [
+    "bookmark_id",
+    "tweet_id",
+    "created_at",
+    "bookmarked_at",
+    "author_id",
+    "author_username",
+    "author_name",
+    "text",
+    "lang",
+    "tweet_type",
+    "is_read",
+    "tags",
+    "folders",
+    "media_urls",
+    "referenced_tweet_id",
+    "referenced_tweet_text",
+]
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2"
+
 
 def _is_tco_only(text: str) -> bool:
     stripped = text.strip()
@@ -160,6 +225,217 @@ def _classify_and_resolve(
     return ("plain", text, None, None, None)
 
 
+def _search_tsquery(search: str):
+    """Build a tsquery for `search` that matches in any supported language."""
+    tsquery = None
+    for search_config in SEARCH_QUERY_CONFIGS:
+        part = sa.func.websearch_to_tsquery(
+            sa.literal_column(f"'{search_config}'::regconfig"), search
+        )
+        tsquery = part if tsquery is None else tsquery.op("||")(part)
+    return tsquery
+
+
+def _search_condition(tsquery):
+    """
+    Match post text via the GIN-indexed search_vector only. Authors are
+    matched through the trigram-indexed `author` filter, not the search term.
+    """
+    return PostModel.search_vector.op("@@")(tsquery)
+
+
+def _feed_conditions(
+    tsquery=None,
+    author_ids: Optional[List[UUID]] = None,
+    unread: Optional[bool] = None,
+    folder_uuid: Optional[UUID] = None,
+    tag_uuids: Optional[List[UUID]] = None,
+    tag_mode: Literal["any", "all"] = "any",
+) -> List[Any]:
+    """
+    WHERE clauses of a feed filter, over bookmarks joined to posts.
+
+    Folder and tag filters are semi-joins, so a bookmark matches once
+    however many of the selected tags it carries.
+    """
+    conditions = []
+    if tsquery is not None:
+        conditions.append(_search_condition(tsquery))
+
+    if author_ids is not None:
+        conditions.append(PostModel.author_id.in_(author_ids))
+
+    if unread is True:
+        conditions.append(BookmarkModel.is_read == False)
+
+    if folder_uuid:
+        conditions.append(
+            sa.exists().where(
+                bookmark_folders.c.bookmark_id == BookmarkModel.id,
+                bookmark_folders.c.folder_id == folder_uuid,
+            )
+        )
+
+    if tag_uuids and tag_mode == "all" and len(tag_uuids) > 1:
+        conditions.append(
+            BookmarkModel.id.in_(
+                sa.select(bookmark_tags.c.bookmark_id)
+                .where(bookmark_tags.c.tag_id.in_(tag_uuids))
+                .group_by(bookmark_tags.c.bookmark_id)
+                .having(sa.func.count() == len(tag_uuids))
+            )
+        )
+    elif tag_uuids:
+        conditions.append(
+            sa.exists().where(
+                bookmark_tags.c.bookmark_id == BookmarkModel.id,
+                bookmark_tags.c.tag_id.in_(tag_uuids),
+            )
+        )
+    return conditions
+
+
+def _json_object(**fields):
+    """json_build_object() over keyword arguments; keys are inlined as SQL literals."""
+    args = []
+    for key, value in fields.items():
+        args.extend((sa.literal_column(f"'{key}'"), value))
+    return sa.func.json_build_object(*args)
+
+
+def _tags_lateral(bookmark_id_column):
+    """LATERAL subquery: a bookmark's tags as a JSON array ('tags')."""
+    return (
+        sa.select(
+            sa.func.coalesce(
+                sa.func.json_agg(
+                    _json_object(
+                        id=TagModel.id, name=TagModel.name, color=TagModel.color
+                    )
+                ),
+                sa.text("'[]'::json"),
+            ).label("tags")
+        )
+        .select_from(bookmark_tags)
+        .join(TagModel, bookmark_tags.c.tag_id == TagModel.id)
+        .where(bookmark_tags.c.bookmark_id == bookmark_id_column)
+        .lateral("bookmark_tags_agg")
+    )
+
+
+def _folders_lateral(bookmark_id_column):
+    """LATERAL subquery: a bookmark's folders as a JSON array ('folders')."""
+    return (
+        sa.select(
+            sa.func.coalesce(
+                sa.func.json_agg(_json_object(id=FolderModel.id, name=FolderModel.name)),
+                sa.text("'[]'::json"),
+            ).label("folders")
+        )
+        .select_from(bookmark_folders)
+        .join(FolderModel, bookmark_folders.c.folder_id == FolderModel.id)
+        .where(bookmark_folders.c.bookmark_id == bookmark_id_column)
+        .lateral("bookmark_folders_agg")
+    )
+
+
+def _media_lateral(post_pk_column):
+    """LATERAL subquery: a post's media as a JSON array ('media'), or NULL."""
+    return (
+        sa.select(
+            sa.func.json_agg(
+                aggregate_order_by(
+                    _json_object(
+                        media_key=MediaModel.media_key,
+                        type=MediaModel.media_type,
+                        url=MediaModel.url,
+                        preview_image_url=MediaModel.preview_image_url,
+                        alt_text=MediaModel.alt_text,
+                    ),
+                    MediaModel.created_at,
+                )
+            ).label("media")
+        )
+        .where(MediaModel.post_id == post_pk_column)
+        .lateral("post_media_agg")
+    )
+
+
+def _referenced_tweet_lateral(referenced_tweet_id_column):
+    """LATERAL subquery: the referenced tweet as a JSON object ('referenced_tweet')."""
+    ref_post = aliased(PostModel, name="ref_post")
+    ref_author = aliased(AuthorModel, name="ref_author")
+    return (
+        sa.select(
+            _json_object(
+                id=ref_post.post_id,
+                text=ref_post.text,
+                author_id=sa.func.coalesce(ref_author.author_id_from_x, ""),
+                created_at=ref_post.created_at_from_twitter,
+                lang=ref_post.lang,
+                possibly_sensitive=ref_post.possibly_sensitive,
+            ).label("referenced_tweet")
+        )
+        .select_from(ref_post)
+        .outerjoin(ref_author, ref_post.author_id == ref_author.id)
+        .where(ref_post.post_id == referenced_tweet_id_column)
+        .limit(1)
+        .lateral("referenced_tweet_agg")
+    )
+
+
+def _export_record(row) -> Dict[str, Any]:
+    """One exported bookmark as a JSON-ready dict."""
+    referenced_tweet = row.referenced_tweet
+    if not referenced_tweet and row.referenced_tweet_id:
+        referenced_tweet = {"id": row.referenced_tweet_id, "text": None}
+    return {
+        "bookmark_id": str(row.bookmark_id),
+        "tweet_id": row.post_id,
+        "text": row.text,
+        "created_at": row.created_at_from_twitter,
+        "bookmarked_at": row.bookmarked_at,
+        "lang": row.lang,
+        "tweet_type": row.tweet_type or "plain",
+        "is_read": row.is_read,
+        "author": {
+            "id": row.author_id_from_x,
+            "username": row.username,
+            "name": row.author_name,
+        },
+        "tags": row.tags,
+        "folders": row.folders,
+        "media": row.media or [],
+        "referenced_tweet": referenced_tweet,
+    }
+
+
+def _export_csv_row(row) -> List[Any]:
+    """One exported bookmark as a CSV row in EXPORT_CSV_FIELDS order."""
+    referenced_tweet = row.referenced_tweet or {}
+    return [
+        str(row.bookmark_id),
+        row.post_id,
+        row.created_at_from_twitter.isoformat() if row.created_at_from_twitter else "",
+        row.bookmarked_at.isoformat() if row.bookmarked_at else "",
+        row.author_id_from_x or "",
+        row.username or "",
+        row.author_name or "",
+        row.text,
+        row.lang,
+        row.tweet_type or "plain",
+        row.is_read,
+        ";".join(tag["name"] for tag in row.tags),
+        ";".join(folder["name"] for folder in row.folders),
+        " ".join(
+            media.get("url") or media.get("preview_image_url") or ""
+            for media in row.media or []
+        ),
+        row.referenced_tweet_id or "",
+        referenced_tweet.get("text") or "",
+    ]
+
+
 class BookmarkService:
     def __init__(self, db: AsyncSession = None, user_service: UserService = None):
         self.db = db
@@ -274,6 +550,7 @@ class BookmarkService:
             .values(last_front_sync_time=sync_time)
         )
         await db.commit()
+        await bump_data_version(user_id)
 
     async def update_front_sync_token(self, db: AsyncSession, user_id, token: str):
         """Update the front_sync_token for front sync pagination."""
@@ -293,16 +570,111 @@ class BookmarkService:
             sa.update(User).where(User.id == user_id).values(is_backfill_complete=True)
         )
         await db.commit()
+        await bump_data_version(user_id)
 
     async def count_user_bookmarks(self, db: AsyncSession, user_id: UUID) -> int:
-        """Count total bookmarks for a user."""
+        """Count total bookmarks for a user (read from bookmark_counters)."""
+        total, _ = await counter_service.get_counts(db, user_id)
+        return total
+
+    async def get_bookmark_counts(
+        self, db: AsyncSession, user_id: UUID
+    ) -> Dict[str, int]:
+        """Get total and unread bookmark counts for a user."""
+        total, unread = await counter_service.get_counts(db, user_id)
+        return {"bookmark_count": total, "unread_count": unread}
+
+    async def resolve_author_ids(
+        self, db: AsyncSession, user_id: UUID, author: str
+    ) -> List[UUID]:
+        """
+        Resolve a (possibly misspelled) author name or @handle to author IDs.
+
+        Candidates come from the trigram indexes on authors.username/name and are
+        limited to authors the user has bookmarked. An exact handle match wins
+        outright; otherwise the best matches by similarity are returned.
+
+        Args:
+            db: SQLAlchemy session
+            user_id: UUID of the user
+            author: Author name or handle, with or without a leading '@'
+
+        Returns:
+            List of matching author IDs, best match first
+        """
+        term = author.strip().lstrip("@")
+        if not term:
+            return []
+
+        exact = sa.func.lower(AuthorModel.username) == term.lower()
+        score = sa.func.greatest(
+            sa.func.similarity(AuthorModel.username, term),
+            sa.func.similarity(AuthorModel.name, term),
+        )
+        bookmarked_by_user = (
+            sa.select(sa.literal(1))
+            .select_from(PostModel)
+            .join(BookmarkModel, BookmarkModel.post_id == PostModel.id)
+            .where(
+                PostModel.author_id == AuthorModel.id,
+                BookmarkModel.user_id == user_id,
+            )
+            .exists()
+        )
+
         result = await db.execute(
-            sa.select(sa.func.count(BookmarkModel.user_id)).where(
-                BookmarkModel.user_id == user_id
+            sa.select(AuthorModel.id, exact.label("exact"))
+            .where(
+                sa.or_(
+                    AuthorModel.username.ilike(f"%{term}%"),
+                    AuthorModel.name.ilike(f"%{term}%"),
+                    AuthorModel.username.op("%")(term),
+                    AuthorModel.name.op("%")(term),
+                ),
+                bookmarked_by_user,
             )
+            .order_by(sa.desc("exact"), score.desc())
+            .limit(AUTHOR_MATCH_LIMIT)
+        )
+        rows = result.all()
+
+        if rows and rows[0].exact:
+            return [rows[0].id]
+        return [row.id for row in rows]
+
+    async def get_bookmark_feed(
+        self, db: AsyncSession, user_id: UUID, **params
+    ) -> Dict[str, Any]:
+        """
+        Cached get_bookmarks_from_db.
+
+        Pages are cached per (user, data version, query params). Every write to
+        the user's bookmarks bumps the data version, so a poll is served from
+        Redis until something actually changes; concurrent identical misses
+        are coalesced into a single database query.
+
+        Args:
+            db: SQLAlchemy session
+            user_id: UUID of the user
+            **params: Keyword arguments of get_bookmarks_from_db
+
+        Returns:
+            Same dict as get_bookmarks_from_db
+        """
+        try:
+            version = await get_data_version(user_id)
+        except Exception as e:
+            logger.error(f"Feed cache unavailable for user_id={user_id}: {str(e)}")
+            return await self.get_bookmarks_from_db(db, user_id, **params)
+
+        params_hash = hashlib.sha1(
+            json.dumps(params, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        key = f"feed:{user_id}:{version}:{params_hash}"
+
+        return await get_or_fetch_cache(
+            key, lambda: self.get_bookmarks_from_db(db, user_id, **params)
         )
-        count = result.scalar()
-        return count if count else 0
 
     async def get_bookmarks_from_db(
         self,
@@ -315,6 +687,9 @@ class BookmarkService:
         tag_ids: list = None,
         folder_id: Optional[str] = None,
         unread: Optional[bool] = None,
+        highlight: bool = False,
+        author: Optional[str] = None,
+        tag_mode: Literal["any", "all"] = "any",
     ) -> Dict[str, Any]:
         """
         Fetch bookmarks from database with pagination.
@@ -325,186 +700,201 @@ class BookmarkService:
             user_id: UUID of the user
             limit: Number of results to return
             offset: Offset for pagination
-            search: Full-text search (post text, author name)
-            sort: Sort order (date-desc, date-asc, alpha-asc, alpha-desc)
+            search: Full-text search over post text
+            sort: Sort order (date-desc, date-asc, alpha-asc, alpha-desc, relevance)
             tag_ids: Filter by tag IDs
             folder_id: Filter by folder ID
             unread: Filter only unread bookmarks
+            highlight: Attach a ts_headline snippet to each search hit
+            author: Filter by author name or @handle (typo-tolerant)
+            tag_mode: 'any' matches bookmarks with at least one of tag_ids,
+                'all' only those carrying every one of them
 
         Returns:
             Dict with 'data', 'includes', 'meta' keys matching X API response format
         """
         logger.info(
             f"Fetching bookmarks from DB for user_id={user_id}, limit={limit}, offset={offset}, "
-            f"search={search}, sort={sort}, tag_ids={tag_ids}, folder_id={folder_id}, unread={unread}"
+            f"search={search}, sort={sort}, tag_ids={tag_ids}, folder_id={folder_id}, unread={unread}, "
+            f"author={author}, tag_mode={tag_mode}"
         )
 
+        empty_response = {
+            "data": [],
+            "includes": {"users": [], "media": [], "tweets": []},
+            "meta": {"result_count": 0},
+        }
+
+        author_ids = None
+        if author:
+            author_ids = await self.resolve_author_ids(db, user_id, author)
+            if not author_ids:
+                logger.info(f"No author matching '{author}' for user_id={user_id}")
+                return empty_response
+
+        tsquery = _search_tsquery(search) if search else None
+        folder_uuid = UUID(folder_id) if folder_id else None
+        tag_uuids = list(dict.fromkeys(UUID(tid) for tid in tag_ids or []))
+
+        # Filters that select exactly one counted scope take their total from
+        # bookmark_counters; anything narrower is counted over the filtered set.
+        if (
+            tsquery is None
+            and author_ids is None
+            and len(tag_uuids) + (1 if folder_uuid else 0) <= 1
+        ):
+            if folder_uuid:
+                scope, scope_id = SCOPE_FOLDER, folder_uuid
+            elif tag_uuids:
+                scope, scope_id = SCOPE_TAG, tag_uuids[0]
+            else:
+                scope, scope_id = SCOPE_ALL, user_id
+            counter_column = (
+                BookmarkCounter.unread if unread else BookmarkCounter.total
+            )
+            total_column = sa.func.coalesce(
+                sa.select(counter_column)
+                .where(
+                    BookmarkCounter.user_id == user_id,
+                    BookmarkCounter.scope == scope,
+                    BookmarkCounter.scope_id == scope_id,
+                )
+                .scalar_subquery(),
+                0,
+            )
+        else:
+            total_column = sa.func.count().over()
+
+        # Only the columns the response needs; no ORM entities are hydrated.
+        columns = [
+            BookmarkModel.id.label("bookmark_id"),
+            BookmarkModel.referenced_tweet_id,
+            BookmarkModel.post_created_at,
+            BookmarkModel.sort_text,
+            PostModel.id.label("post_pk"),
+            PostModel.post_id,
+            PostModel.text,
+            PostModel.created_at_from_twitter,
+            PostModel.lang,
+            PostModel.possibly_sensitive,
+            PostModel.tweet_type,
+            AuthorModel.author_id_from_x,
+            AuthorModel.username,
+            AuthorModel.name.label("author_name"),
+            AuthorModel.profile_image_url,
+            total_column.label("total_count"),
+        ]
+        if tsquery is not None:
+            columns.append(
+                sa.func.ts_rank_cd(PostModel.search_vector, tsquery).label("rank")
+            )
+            if highlight:
+                columns.append(
+                    sa.func.ts_headline(
+                        sa.func.posts_search_config(PostModel.lang),
+                        PostModel.text,
+                        tsquery,
+                        HEADLINE_OPTIONS,
+                    ).label("headline")
+                )
+
         query = (
-            sa.select(BookmarkModel, PostModel, AuthorModel)
+            sa.select(*columns)
             .join(PostModel, BookmarkModel.post_id == PostModel.id)
             .outerjoin(AuthorModel, PostModel.author_id == AuthorModel.id)
             .where(BookmarkModel.user_id == user_id)
         )
 
-        if search:
-            search_pattern = f"%{search}%"
-            query = query.where(
-                sa.or_(
-                    PostModel.text.ilike(search_pattern),
-                    sa.and_(
-                        AuthorModel.name.isnot(None),
-                        AuthorModel.name.ilike(search_pattern),
-                    ),
-                    sa.and_(
-                        AuthorModel.username.isnot(None),
-                        AuthorModel.username.ilike(search_pattern),
-                    ),
-                )
+        query = query.where(
+            *_feed_conditions(
+                tsquery=tsquery,
+                author_ids=author_ids,
+                unread=unread,
+                folder_uuid=folder_uuid,
+                tag_uuids=tag_uuids,
+                tag_mode=tag_mode,
             )
+        )
 
-        if unread is True:
-            query = query.where(BookmarkModel.is_read == False)
-
-        if folder_id:
-            folder_uuid = UUID(folder_id)
-            query = query.join(
-                bookmark_folders,
-                BookmarkModel.id == bookmark_folders.c.bookmark_id,
-            ).where(bookmark_folders.c.folder_id == folder_uuid)
-
-        if tag_ids:
-            tag_uuids = [UUID(tid) for tid in tag_ids]
-            query = query.join(
-                bookmark_tags,
-                BookmarkModel.id == bookmark_tags.c.bookmark_id,
-            ).where(bookmark_tags.c.tag_id.in_(tag_uuids))
-
-        if sort == "date-asc":
-            query = query.order_by(PostModel.created_at_from_twitter.asc())
+        # (column, descending) pairs; applied to the page and again to the
+        # outer query, since the lateral joins do not preserve row order.
+        # Sort keys live on bookmarks, matching the (user_id, ..., id) indexes,
+        # and bookmark_id breaks ties so pages are stable.
+        if sort == "relevance" and tsquery is not None:
+            order = [("rank", True), ("post_created_at", True), ("bookmark_id", True)]
+        elif sort == "date-asc":
+            order = [("post_created_at", False), ("bookmark_id", False)]
         elif sort == "alpha-asc":
-            query = query.order_by(PostModel.text.asc())
+            order = [("sort_text", False), ("bookmark_id", False)]
         elif sort == "alpha-desc":
-            query = query.order_by(PostModel.text.desc())
+            order = [("sort_text", True), ("bookmark_id", True)]
         else:
-            query = query.order_by(PostModel.created_at_from_twitter.desc())
+            order = [("post_created_at", True), ("bookmark_id", True)]
+
+        def order_by(columns):
+            return [
+                columns[name].desc() if descending else columns[name].asc()
+                for name, descending in order
+            ]
+
+        page = (
+            query.order_by(*order_by(query.selected_columns))
+            .limit(limit)
+            .offset(offset)
+            .cte("page")
+        )
 
-        query = query.limit(limit).offset(offset)
+        tags_lateral = _tags_lateral(page.c.bookmark_id)
+        media_lateral = _media_lateral(page.c.post_pk)
+        ref_lateral = _referenced_tweet_lateral(page.c.referenced_tweet_id)
+
+        feed_query = (
+            sa.select(
+                page,
+                sa.type_coerce(tags_lateral.c.tags, JSON).label("tags"),
+                sa.type_coerce(media_lateral.c.media, JSON).label("media"),
+                sa.type_coerce(ref_lateral.c.referenced_tweet, JSON).label(
+                    "referenced_tweet"
+                ),
+            )
+            .select_from(page)
+            .outerjoin(tags_lateral, sa.true())
+            .outerjoin(media_lateral, sa.true())
+            .outerjoin(ref_lateral, sa.true())
+            .order_by(*order_by(page.c))
+        )
 
-        result = await db.execute(query)
+        result = await db.execute(feed_query)
         rows = result.all()
 
         if not rows:
             logger.info(f"No bookmarks found for user_id={user_id}")
-            return {
-                "data": [],
-                "includes": {"users": [], "media": [], "tweets": []},
-                "meta": {"result_count": 0},
-            }
-
-        bookmark_ids = [bookmark.id for bookmark, post, author in rows]
-        post_ids = [post.id for bookmark, post, author in rows]
-
-        tags_query = (
-            sa.select(bookmark_tags.c.bookmark_id, TagModel)
-            .join(TagModel, bookmark_tags.c.tag_id == TagModel.id)
-            .where(bookmark_tags.c.bookmark_id.in_(bookmark_ids))
-        )
-        tags_result = await db.execute(tags_query)
-        tags_rows = tags_result.all()
-
-        bookmark_tags_map: Dict[str, List[Dict[str, Any]]] = {}
-        for bookmark_id, tag in tags_rows:
-            tag_dict = {
-                "id": str(tag.id),
-                "name": tag.name,
-                "color": tag.color,
-            }
-            if str(bookmark_id) not in bookmark_tags_map:
-                bookmark_tags_map[str(bookmark_id)] = []
-            bookmark_tags_map[str(bookmark_id)].append(tag_dict)
-
-        media_query = sa.select(MediaModel).where(MediaModel.post_id.in_(post_ids))
-        media_result = await db.execute(media_query)
-        media_rows = media_result.scalars().all()
-        post_media_map: Dict[str, Dict[str, Any]] = {}
-        includes_media_map: Dict[str, Dict[str, Any]] = {}
-        for media in media_rows:
-            if media.post_id and str(media.post_id) not in post_media_map:
-                post_media_map[str(media.post_id)] = {
-                    "media_key": media.media_key,
-                    "type": media.media_type,
-                    "url": media.url,
-                    "preview_image_url": media.preview_image_url,
-                    "alt_text": media.alt_text,
-                }
-                includes_media_map[media.media_key] = post_media_map[str(media.post_id)]
-
-        ref_ids = list(
-            set(
-                bookmark.referenced_tweet_id
-                for bookmark, post, author in rows
-                if bookmark.referenced_tweet_id
-            )
-        )
-        includes_tweets_map: Dict[str, Dict[str, Any]] = {}
-        includes_users_map: Dict[str, Dict[str, Any]] = {}
-        if ref_ids:
-            ref_posts_query = (
-                sa.select(PostModel, AuthorModel)
-                .outerjoin(AuthorModel, PostModel.author_id == AuthorModel.id)
-                .where(PostModel.post_id.in_(ref_ids))
-            )
-            ref_result = await db.execute(ref_posts_query)
-            ref_rows = ref_result.all()
-            for ref_post, ref_author in ref_rows:
-                ref_author_x_id = ref_author.author_id_from_x if ref_author else ""
-                if ref_author_x_id and ref_author_x_id not in includes_users_map:
-                    includes_users_map[ref_author_x_id] = {
-                        "id": ref_author_x_id,
-                        "username": ref_author.username if ref_author else "",
-                        "name": ref_author.name if ref_author else "",
-                        "profile_image_url": ref_author.profile_image_url
-                        if ref_author
-                        else None,
-                    }
-                includes_tweets_map[ref_post.post_id] = {
-                    "id": ref_post.post_id,
-                    "text": ref_post.text,
-                    "author_id": ref_author_x_id,
-                    "created_at": (
-                        ref_post.created_at_from_twitter.isoformat()
-                        if ref_post.created_at_from_twitter
-                        else None
-                    ),
-                    "lang": ref_post.lang,
-                    "possibly_sensitive": ref_post.possibly_sensitive,
-                }
+            return empty_response
 
         data = []
         users_map = {}
+        includes_media_map: Dict[str, Dict[str, Any]] = {}
+        includes_tweets_map: Dict[str, Dict[str, Any]] = {}
 
-        for bookmark, post, author in rows:
-            author_x_id = author.author_id_from_x if author else ""
+        for row in rows:
+            author_x_id = row.author_id_from_x or ""
             if author_x_id and author_x_id not in users_map:
                 users_map[author_x_id] = {
                     "id": author_x_id,
-                    "username": author.username if author else "",
-                    "name": author.name if author else "",
-                    "profile_image_url": author.profile_image_url if author else None,
+                    "username": row.username or "",
+                    "name": row.author_name or "",
+                    "profile_image_url": row.profile_image_url,
                 }
 
-            tweet_type = post.tweet_type or "plain"
-            media = post_media_map.get(str(post.id))
-
             item = {
-                "id": post.post_id,
-                "bookmark_id": str(bookmark.id),
-                "tweet_type": tweet_type,
-                "text": post.text,
+                "id": row.post_id,
+                "bookmark_id": str(row.bookmark_id),
+                "tweet_type": row.tweet_type or "plain",
+                "text": row.text,
                 "author_id": author_x_id,
                 "created_at": (
-                    post.created_at_from_twitter.isoformat()
-                    if post.created_at_from_twitter
+                    row.created_at_from_twitter.isoformat()
+                    if row.created_at_from_twitter
                     else None
                 ),
                 "public_metrics": {
@@ -515,22 +905,29 @@ class BookmarkService:
                     "bookmark_count": 0,
                     "impression_count": 0,
                 },
-                "lang": post.lang,
-                "possibly_sensitive": post.possibly_sensitive,
-                "tags": bookmark_tags_map.get(str(bookmark.id), []),
+                "lang": row.lang,
+                "possibly_sensitive": row.possibly_sensitive,
+                "tags": row.tags,
             }
 
-            if media:
+            if row.media:
+                media = row.media[0]
                 item["media"] = media
+                includes_media_map[media["media_key"]] = media
 
-            ref_tweet_id = bookmark.referenced_tweet_id
-            if ref_tweet_id and ref_tweet_id in includes_tweets_map:
-                ref_tweet = includes_tweets_map[ref_tweet_id]
-                ref_author_x_id = ref_tweet.get("author_id", "")
+            if tsquery is not None:
+                item["rank"] = row.rank
+                if highlight:
+                    item["highlight"] = row.headline
+
+            ref_tweet_id = row.referenced_tweet_id
+            ref_tweet = row.referenced_tweet
+            if ref_tweet:
+                includes_tweets_map[ref_tweet["id"]] = ref_tweet
                 item["referenced_tweet"] = {
                     "id": ref_tweet["id"],
                     "text": ref_tweet["text"],
-                    "author_id": ref_author_x_id,
+                    "author_id": ref_tweet["author_id"],
                 }
             elif ref_tweet_id:
                 item["referenced_tweet"] = {
@@ -541,33 +938,7 @@ class BookmarkService:
 
             data.append(item)
 
-        count_query = sa.select(sa.func.count(BookmarkModel.user_id)).where(
-            BookmarkModel.user_id == user_id
-        )
-        if search:
-            search_pattern = f"%{search}%"
-            count_query = (
-                count_query.join(PostModel, BookmarkModel.post_id == PostModel.id)
-                .outerjoin(AuthorModel, PostModel.author_id == AuthorModel.id)
-                .where(
-                    sa.or_(
-                        PostModel.text.ilike(search_pattern),
-                        sa.and_(
-                            AuthorModel.name.isnot(None),
-                            AuthorModel.name.ilike(search_pattern),
-                        ),
-                        sa.and_(
-                            AuthorModel.username.isnot(None),
-                            AuthorModel.username.ilike(search_pattern),
-                        ),
-                    )
-                )
-            )
-        if unread is True:
-            count_query = count_query.where(BookmarkModel.is_read == False)
-
-        count_result = await db.execute(count_query)
-        total_count = count_result.scalar() or 0
+        total_count = rows[0].total_count or 0
         has_next = (offset + limit) < total_count
 
         response = {
@@ -589,6 +960,91 @@ class BookmarkService:
         )
         return response
 
+    async def stream_export(
+        self, user_id: UUID, export_format: Literal["ndjson", "csv"] = "ndjson"
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream a user's whole library as NDJSON or CSV.
+
+        Each bookmark comes with its tags, folders, media and referenced tweet,
+        aggregated in SQL. Rows are read through a server-side cursor
+        EXPORT_BATCH_SIZE at a time and encoded per batch, so memory stays flat
+        however large the library is. Uses its own read session (a replica
+        when configured): the request's session is closed before a streaming
+        body is sent.
+
+        Args:
+            user_id: UUID of the user
+            export_format: 'ndjson' (one JSON object per line) or 'csv'
+
+        Yields:
+            Encoded chunks of the export
+        """
+        logger.info(f"Exporting bookmarks for user_id={user_id} as {export_format}")
+
+        tags_lateral = _tags_lateral(BookmarkModel.id)
+        folders_lateral = _folders_lateral(BookmarkModel.id)
+        media_lateral = _media_lateral(PostModel.id)
+        ref_lateral = _referenced_tweet_lateral(BookmarkModel.referenced_tweet_id)
+
+        query = (
+            sa.select(
+                BookmarkModel.id.label("bookmark_id"),
+                BookmarkModel.is_read,
+                BookmarkModel.created_at.label("bookmarked_at"),
+                BookmarkModel.referenced_tweet_id,
+                PostModel.post_id,
+                PostModel.text,
+                PostModel.created_at_from_twitter,
+                PostModel.lang,
+                PostModel.tweet_type,
+                AuthorModel.author_id_from_x,
+                AuthorModel.username,
+                AuthorModel.name.label("author_name"),
+                sa.type_coerce(tags_lateral.c.tags, JSON).label("tags"),
+                sa.type_coerce(folders_lateral.c.folders, JSON).label("folders"),
+                sa.type_coerce(media_lateral.c.media, JSON).label("media"),
+                sa.type_coerce(ref_lateral.c.referenced_tweet, JSON).label(
+                    "referenced_tweet"
+                ),
+            )
+            .select_from(BookmarkModel)
+            .join(PostModel, BookmarkModel.post_id == PostModel.id)
+            .outerjoin(AuthorModel, PostModel.author_id == AuthorModel.id)
+            .outerjoin(tags_lateral, sa.true())
+            .outerjoin(folders_lateral, sa.true())
+            .outerjoin(media_lateral, sa.true())
+            .outerjoin(ref_lateral, sa.true())
+            .where(BookmarkModel.user_id == user_id)
+            .order_by(BookmarkModel.post_created_at.desc(), BookmarkModel.id.desc())
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+
+        exported = 0
+        async with get_async_read_session(user_id) as session:
+            result = await session.stream(query)
+
+            if export_format == "csv":
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                writer.writerow(EXPORT_CSV_FIELDS)
+                yield buffer.getvalue().encode()
+
+                async for rows in result.partitions():
+                    buffer.seek(0)
+                    buffer.truncate()
+                    writer.writerows(_export_csv_row(row) for row in rows)
+                    exported += len(rows)
+                    yield buffer.getvalue().encode()
+            else:
+                async for rows in result.partitions():
+                    exported += len(rows)
+                    yield b"".join(
+                        orjson.dumps(_export_record(row)) + b"\n" for row in rows
+                    )
+
+        logger.info(f"Exported {exported} bookmarks for user_id={user_id}")
+
     async def save_bookmarks(
         self,
         db: AsyncSession,
@@ -623,6 +1079,22 @@ class BookmarkService:
             f"Found {len(validated_response.bookmarks)} bookmarks to process for user {user_id}"
         )
 
+        # Bookmarks deleted locally stay on X until the outbox drains; do not
+        # let a sync bring them back in the meantime.
+        pending_deletes = await outbox_service.pending_delete_tweet_ids(
+            db, user_id, (bm.post.id for bm in validated_response.bookmarks)
+        )
+        if pending_deletes:
+            logger.info(
+                f"Skipping {len(pending_deletes)} bookmarks pending deletion on X for user {user_id}"
+            )
+            validated_response.bookmarks = [
+                bm
+                for bm in validated_response.bookmarks
+                if bm.post.id not in pending_deletes
+            ]
+
+        new_bookmarks = []
         for index, bm in enumerate(validated_response.bookmarks, 1):
             logger.debug(
                 f"Processing bookmark {index}/{len(validated_response.bookmarks)}"
@@ -719,10 +1191,19 @@ class BookmarkService:
                     user_id=user_id,
                     post_id=post.id,
                     referenced_tweet_id=ref_tweet_id,
+                    post_created_at=post.created_at_from_twitter,
+                    sort_text=(post.text or "")[:SORT_TEXT_LENGTH],
                 )
                 db.add(bookmark)
+                new_bookmarks.append(bookmark)
             # Don't store tokens on individual bookmarks anymore
 
+        if new_bookmarks:
+            await db.flush()
+            await counter_service.bookmarks_added(
+                db, user_id, [bookmark.id for bookmark in new_bookmarks]
+            )
+
         if sync_time:
             logger.debug(
                 f"Updating front_sync_token and last_front_sync_time for user {user_id}"
@@ -736,6 +1217,7 @@ class BookmarkService:
 
         try:
             await db.commit()
+            await bump_data_version(user_id)
             logger.info(
                 f"Successfully saved all {len(validated_response.bookmarks)} bookmarks for user_id={user_id}"
             )
@@ -752,7 +1234,7 @@ class BookmarkService:
         response: Dict[str, Any], user_id: str
     ) -> BookmarkResponse:
         logger.info(f"Parsing bookmarks for user_id={user_id}")
-        logger.debug(f"Full X response in parse: {response}")
+        logger.debug("x_api.parse", user_id=user_id, payload=response)
 
         if isinstance(response, dict):
             tweets_data = response.get("data", [])
@@ -840,7 +1322,11 @@ class BookmarkService:
         self, db: AsyncSession, user_id: str, tweet_id: str
     ) -> bool:
         """
-        Delete a bookmark from the local database.
+        Delete a bookmark from the local database and queue its deletion on X.
+
+        The X delete is queued only when a local bookmark was removed, and
+        commits together with that delete; the X call is made by
+        drain_x_outbox_task.
 
         Args:
             db: SQLAlchemy session
@@ -852,6 +1338,8 @@ class BookmarkService:
         """
         logger.info(f"Deleting bookmark for user_id={user_id}, tweet_id={tweet_id}")
 
+        user_uuid = UUID(user_id)
+
         result = await db.execute(
             sa.select(PostModel).where(PostModel.post_id == tweet_id)
         )
@@ -861,26 +1349,67 @@ class BookmarkService:
             logger.warning(f"Post not found for tweet_id={tweet_id}")
             return False
 
-        user_uuid = UUID(user_id)
+        # The counters are computed from the bookmark and its memberships, so
+        # they are moved before the DELETE; locking the row first makes a
+        # concurrent delete of the same bookmark wait, then find nothing.
         result = await db.execute(
-            sa.delete(BookmarkModel).where(
+            sa.select(BookmarkModel.id)
+            .where(
                 BookmarkModel.user_id == user_uuid, BookmarkModel.post_id == post.id
             )
+            .with_for_update()
         )
-
-        await db.commit()
-
-        if result.rowcount > 0:
-            logger.info(
-                f"Successfully deleted bookmark for user_id={user_id}, tweet_id={tweet_id}"
-            )
-            return True
-        else:
+        bookmark_ids = result.scalars().all()
+        if not bookmark_ids:
             logger.warning(
                 f"No bookmark found to delete for user_id={user_id}, tweet_id={tweet_id}"
             )
             return False
 
+        await counter_service.bookmarks_removed(db, user_uuid, bookmark_ids)
+        await db.execute(
+            sa.delete(BookmarkModel).where(bookmark_id_in(bookmark_ids))
+        )
+        await outbox_service.enqueue(db, user_uuid, OP_DELETE_BOOKMARK, tweet_id)
+        await db.commit()
+        await bump_data_version(user_uuid)
+        logger.info(
+            f"Successfully deleted bookmark for user_id={user_id}, tweet_id={tweet_id}"
+        )
+        return True
+
+    async def create_bookmark(
+        self, db: AsyncSession, user_id: UUID, tweet_id: str
+    ) -> bool:
+        """
+        Queue bookmarking a tweet on X.
+
+        The bookmark is written to X by drain_x_outbox_task, which then runs
+        a front sync to pull it into the local library.
+
+        Args:
+            db: SQLAlchemy session
+            user_id: The user's ID
+            tweet_id: The tweet/post ID to bookmark
+
+        Returns:
+            True if queued, False if the tweet is already bookmarked
+        """
+        logger.info(f"Queueing bookmark for user_id={user_id}, tweet_id={tweet_id}")
+
+        result = await db.execute(
+            sa.select(BookmarkModel.id)
+            .join(PostModel, BookmarkModel.post_id == PostModel.id)
+            .where(BookmarkModel.user_id == user_id, PostModel.post_id == tweet_id)
+        )
+        if result.first() is not None:
+            logger.info(f"Tweet {tweet_id} already bookmarked by user_id={user_id}")
+            return False
+
+        await outbox_service.enqueue(db, user_id, OP_CREATE_BOOKMARK, tweet_id)
+        await db.commit()
+        return True
+
     async def mark_as_read(
         self, db: AsyncSession, user_id: UUID, tweet_id: str
     ) -> bool:
@@ -906,15 +1435,28 @@ class BookmarkService:
             logger.warning(f"Post not found for tweet_id={tweet_id}")
             return False
 
+        # Only rows whose state actually flips move the unread counters.
         result = await db.execute(
             sa.update(BookmarkModel)
-            .where(BookmarkModel.user_id == user_id, BookmarkModel.post_id == post.id)
+            .where(
+                BookmarkModel.user_id == user_id,
+                BookmarkModel.post_id == post.id,
+                BookmarkModel.is_read == False,
+            )
             .values(is_read=True)
+            .returning(BookmarkModel.id)
         )
+        changed_ids = result.scalars().all()
+        if changed_ids:
+            await counter_service.read_state_changed(
+                db, user_id, changed_ids, is_read=True
+            )
+            await db.commit()
+            await bump_data_version(user_id)
 
-        await db.commit()
-
-        if result.rowcount > 0:
+        if changed_ids or await self.check_if_bookmark_exists(
+            db, post_id=post.id, user_id=user_id
+        ):
             logger.info(f"Marked as read for user_id={user_id}, tweet_id={tweet_id}")
             return True
         else:
@@ -948,15 +1490,28 @@ class BookmarkService:
             logger.warning(f"Post not found for tweet_id={tweet_id}")
             return False
 
+        # Only rows whose state actually flips move the unread counters.
         result = await db.execute(
             sa.update(BookmarkModel)
-            .where(BookmarkModel.user_id == user_id, BookmarkModel.post_id == post.id)
+            .where(
+                BookmarkModel.user_id == user_id,
+                BookmarkModel.post_id == post.id,
+                BookmarkModel.is_read == True,
+            )
             .values(is_read=False)
+            .returning(BookmarkModel.id)
         )
+        changed_ids = result.scalars().all()
+        if changed_ids:
+            await counter_service.read_state_changed(
+                db, user_id, changed_ids, is_read=False
+            )
+            await db.commit()
+            await bump_data_version(user_id)
 
-        await db.commit()
-
-        if result.rowcount > 0:
+        if changed_ids or await self.check_if_bookmark_exists(
+            db, post_id=post.id, user_id=user_id
+        ):
             logger.info(f"Marked as unread for user_id={user_id}, tweet_id={tweet_id}")
             return True
         else:
@@ -1005,12 +1560,19 @@ class BookmarkService:
             logger.info(f"Bookmark already in folder")
             return True
 
-        await db.execute(
-            bookmark_folders.insert().values(
-                bookmark_id=bookmark.id, folder_id=folder_id
-            )
+        result = await db.execute(
+            pg_insert(bookmark_folders)
+            .values(bookmark_id=bookmark.id, folder_id=folder_id)
+            .on_conflict_do_nothing()
+            .returning(bookmark_folders.c.bookmark_id)
+        )
+        changed_ids = result.scalars().all()
+        await counter_service.membership_changed(
+            db, user_id, SCOPE_FOLDER, folder_id, changed_ids, added=True
         )
         await db.commit()
+        if changed_ids:
+            await bump_data_version(user_id)
 
         logger.info(f"Added bookmark to folder")
         return True
@@ -1043,13 +1605,21 @@ class BookmarkService:
         if not bookmark:
             raise NotFoundError(f"Bookmark not found")
 
-        await db.execute(
-            bookmark_folders.delete().where(
+        result = await db.execute(
+            bookmark_folders.delete()
+            .where(
                 bookmark_folders.c.bookmark_id == bookmark.id,
                 bookmark_folders.c.folder_id == folder_id,
             )
+            .returning(bookmark_folders.c.bookmark_id)
+        )
+        changed_ids = result.scalars().all()
+        await counter_service.membership_changed(
+            db, user_id, SCOPE_FOLDER, folder_id, changed_ids, added=False
         )
         await db.commit()
+        if changed_ids:
+            await bump_data_version(user_id)
 
         logger.info(f"Removed bookmark from folder")
         return True
@@ -1149,10 +1719,19 @@ class BookmarkService:
             logger.info(f"Bookmark already tagged")
             return True
 
-        await db.execute(
-            bookmark_tags.insert().values(bookmark_id=bookmark.id, tag_id=tag_id)
+        result = await db.execute(
+            pg_insert(bookmark_tags)
+            .values(bookmark_id=bookmark.id, tag_id=tag_id)
+            .on_conflict_do_nothing()
+            .returning(bookmark_tags.c.bookmark_id)
+        )
+        changed_ids = result.scalars().all()
+        await counter_service.membership_changed(
+            db, user_id, SCOPE_TAG, tag_id, changed_ids, added=True
         )
         await db.commit()
+        if changed_ids:
+            await bump_data_version(user_id)
 
         logger.info(f"Added tag to bookmark")
         return True
@@ -1195,13 +1774,21 @@ class BookmarkService:
         if not tag:
             raise NotFoundError(f"Tag not found")
 
-        await db.execute(
-            bookmark_tags.delete().where(
+        result = await db.execute(
+            bookmark_tags.delete()
+            .where(
                 bookmark_tags.c.bookmark_id == bookmark.id,
                 bookmark_tags.c.tag_id == tag_id,
             )
+            .returning(bookmark_tags.c.bookmark_id)
+        )
+        changed_ids = result.scalars().all()
+        await counter_service.membership_changed(
+            db, user_id, SCOPE_TAG, tag_id, changed_ids, added=False
         )
         await db.commit()
+        if changed_ids:
+            await bump_data_version(user_id)
 
         logger.info(f"Removed tag from bookmark")
         return True
@@ -1251,3 +1838,215 @@ class BookmarkService:
             )
 
         return tag_list
+
+    async def _bulk_conditions(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        bookmark_ids: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Optional[List[Any]]:
+        """
+        WHERE clauses selecting the target of a bulk operation.
+
+        Args:
+            db: SQLAlchemy session
+            user_id: The user's ID
+            bookmark_ids: Explicit bookmark IDs
+            filters: Feed filter (search, tag_ids, tag_mode, folder_id,
+                unread, author); clauses may reference posts
+
+        Returns:
+            List of clauses, or None when the selection is known to be empty
+        """
+        if (bookmark_ids is None) == (filters is None):
+            raise BadRequest("Provide either bookmark_ids or filter")
+
+        conditions = [BookmarkModel.user_id == user_id]
+
+        if bookmark_ids is not None:
+            if len(bookmark_ids) > BULK_MAX_IDS:
+                raise BadRequest(f"At most {BULK_MAX_IDS} bookmark_ids per request")
+            try:
+                ids = list(dict.fromkeys(UUID(bid) for bid in bookmark_ids))
+            except ValueError:
+                raise BadRequest("Invalid bookmark ID")
+            if not ids:
+                return None
+            conditions.append(bookmark_id_in(ids))
+            return conditions
+
+        author_ids = None
+        if filters.get("author"):
+            author_ids = await self.resolve_author_ids(db, user_id, filters["author"])
+            if not author_ids:
+                return None
+
+        search = filters.get("search")
+        try:
+            folder_uuid = UUID(filters["folder_id"]) if filters.get("folder_id") else None
+            tag_uuids = list(
+                dict.fromkeys(UUID(tid) for tid in filters.get("tag_ids") or [])
+            )
+        except ValueError:
+            raise BadRequest("Invalid folder or tag ID")
+
+        conditions.append(BookmarkModel.post_id == PostModel.id)
+        conditions.extend(
+            _feed_conditions(
+                tsquery=_search_tsquery(search) if search else None,
+                author_ids=author_ids,
+                unread=filters.get("unread"),
+                folder_uuid=folder_uuid,
+                tag_uuids=tag_uuids,
+                tag_mode=filters.get("tag_mode") or "any",
+            )
+        )
+        return conditions
+
+    async def bulk_set_read_state(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        is_read: bool,
+        bookmark_ids: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """
+        Mark every selected bookmark as read or unread in one UPDATE.
+
+        Args:
+            db: SQLAlchemy session
+            user_id: The user's ID
+            is_read: New read state
+            bookmark_ids: Explicit bookmark IDs
+            filters: Feed filter (see _bulk_conditions)
+
+        Returns:
+            Number of bookmarks whose state changed
+        """
+        logger.info(f"Bulk setting is_read={is_read} for user_id={user_id}")
+
+        conditions = await self._bulk_conditions(db, user_id, bookmark_ids, filters)
+        if conditions is None:
+            return 0
+
+        # UPDATE bookmarks ... FROM posts when the filter needs post columns;
+        # only rows whose state actually flips move the unread counters.
+        result = await db.execute(
+            sa.update(BookmarkModel)
+            .where(*conditions, BookmarkModel.is_read == (not is_read))
+            .values(is_read=is_read)
+            .returning(BookmarkModel.id)
+        )
+        changed_ids = result.scalars().all()
+        if changed_ids:
+            await counter_service.read_state_changed(
+                db, user_id, changed_ids, is_read=is_read
+            )
+            await db.commit()
+            await bump_data_version(user_id)
+
+        logger.info(f"Bulk updated {len(changed_ids)} bookmarks for user_id={user_id}")
+        return len(changed_ids)
+
+    async def _bulk_membership(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        scope: str,
+        scope_id: UUID,
+        add: bool,
+        bookmark_ids: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """Add or remove the selected bookmarks to/from one folder or tag."""
+        model = FolderModel if scope == SCOPE_FOLDER else TagModel
+        table, scope_column = (
+            (bookmark_folders, bookmark_folders.c.folder_id)
+            if scope == SCOPE_FOLDER
+            else (bookmark_tags, bookmark_tags.c.tag_id)
+        )
+
+        result = await db.execute(
+            sa.select(model.id).where(model.id == scope_id, model.user_id == user_id)
+        )
+        if result.scalar_one_or_none() is None:
+            raise NotFoundError(f"{scope.capitalize()} not found")
+
+        conditions = await self._bulk_conditions(db, user_id, bookmark_ids, filters)
+        if conditions is None:
+            return 0
+
+        selected = sa.select(BookmarkModel.id).where(*conditions)
+        if add:
+            stmt = (
+                pg_insert(table)
+                .from_select(
+                    ["bookmark_id", scope_column.name],
+                    sa.select(BookmarkModel.id, sa.literal(scope_id, sa.UUID)).where(
+                        *conditions
+                    ),
+                )
+                .on_conflict_do_nothing()
+            )
+        else:
+            stmt = table.delete().where(
+                scope_column == scope_id, table.c.bookmark_id.in_(selected)
+            )
+        result = await db.execute(stmt.returning(table.c.bookmark_id))
+        changed_ids = result.scalars().all()
+
+        if changed_ids:
+            await counter_service.membership_changed(
+                db, user_id, scope, scope_id, changed_ids, added=add
+            )
+            await db.commit()
+            await bump_data_version(user_id)
+
+        logger.info(
+            f"Bulk {'added' if add else 'removed'} {len(changed_ids)} bookmarks "
+            f"{'to' if add else 'from'} {scope} {scope_id} for user_id={user_id}"
+        )
+        return len(changed_ids)
+
+    async def bulk_update_folder(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        folder_id: UUID,
+        action: Literal["add", "remove"],
+        bookmark_ids: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """
+        Add the selected bookmarks to, or remove them from, a folder.
+
+        Adds are one INSERT ... SELECT ... ON CONFLICT DO NOTHING, removes
+        one DELETE; bookmarks already in the desired state are skipped.
+
+        Returns:
+            Number of bookmarks whose membership changed
+        """
+        return await self._bulk_membership(
+            db, user_id, SCOPE_FOLDER, folder_id, action == "add", bookmark_ids, filters
+        )
+
+    async def bulk_update_tag(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        tag_id: UUID,
+        action: Literal["add", "remove"],
+        bookmark_ids: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """
+        Tag or untag the selected bookmarks (see bulk_update_folder).
+
+        Returns:
+            Number of bookmarks whose membership changed
+        """
+        return await self._bulk_membership(
+            db, user_id, SCOPE_TAG, tag_id, action == "add", bookmark_ids, filters
+        )
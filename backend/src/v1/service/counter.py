@@ -0,0 +1,287 @@
+from typing import Iterable, List, Optional, Tuple
+from uuid import UUID
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.v1.model import (
+    Bookmark as BookmarkModel,
+    BookmarkCounter,
+    bookmark_folders,
+    bookmark_tags,
+)
+
+from src.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+SCOPE_ALL = "all"
+SCOPE_FOLDER = "folder"
+SCOPE_TAG = "tag"
+
+# Membership table and its scope column for each per-collection scope.
+MEMBERSHIP_TABLES = {
+    SCOPE_FOLDER: (bookmark_folders, bookmark_folders.c.folder_id),
+    SCOPE_TAG: (bookmark_tags, bookmark_tags.c.tag_id),
+}
+
+COUNTER_COLUMNS = [
+    "id",
+    "user_id",
+    "scope",
+    "scope_id",
+    "total",
+    "unread",
+    "created_at",
+    "updated_at",
+]
+
+
+def bookmark_id_in(bookmark_ids: List[UUID]):
+    """
+    bookmarks.id = ANY(:ids) with the IDs bound as one uuid[] parameter,
+    so bulk operations are not limited by the driver's bind parameter cap.
+    """
+    ids = [UUID(str(bookmark_id)) for bookmark_id in bookmark_ids]
+    return BookmarkModel.id == sa.any_(sa.bindparam(None, ids, type_=ARRAY(sa.UUID)))
+
+
+class CounterService:
+    """
+    Maintains the bookmark_counters rows.
+
+    Every method only issues statements on the given session; callers commit,
+    so a counter change lands in the same transaction as the write it reflects.
+    Deltas are computed in SQL from the bookmarks being changed, which keeps
+    each adjustment to one statement per scope regardless of batch size.
+    """
+
+    async def _upsert(self, db: AsyncSession, rows: sa.Select) -> None:
+        """Add the (total, unread) deltas selected by `rows` onto the counters."""
+        stmt = pg_insert(BookmarkCounter).from_select(COUNTER_COLUMNS, rows)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_bookmark_counters_scope",
+            set_={
+                "total": BookmarkCounter.total + stmt.excluded.total,
+                "unread": BookmarkCounter.unread + stmt.excluded.unread,
+                "updated_at": sa.func.now(),
+            },
+        )
+        await db.execute(stmt)
+
+    @staticmethod
+    def _deltas(total_sign: int, unread_sign: int, unread_all: bool):
+        """
+        Delta columns for a group of bookmarks.
+
+        unread_all counts every bookmark in the group as an unread change
+        (used for read-state flips, where is_read already holds the new value);
+        otherwise only bookmarks that are currently unread are counted.
+        """
+        unread = (
+            sa.func.count()
+            if unread_all
+            else sa.func.count().filter(BookmarkModel.is_read == sa.false())
+        )
+        return (
+            (sa.func.count() * total_sign).label("total"),
+            (unread * unread_sign).label("unread"),
+        )
+
+    async def _apply(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        condition,
+        total_sign: int,
+        unread_sign: int,
+        unread_all: bool = False,
+        scopes: Iterable[str] = (SCOPE_ALL, SCOPE_FOLDER, SCOPE_TAG),
+    ) -> None:
+        """Apply deltas for the user's bookmarks matching `condition` to each scope."""
+        user_id = UUID(str(user_id))
+        deltas = self._deltas(total_sign, unread_sign, unread_all)
+        for scope in scopes:
+            if scope == SCOPE_ALL:
+                rows = (
+                    sa.select(
+                        sa.func.gen_random_uuid(),
+                        sa.literal(user_id, sa.UUID),
+                        sa.literal(SCOPE_ALL),
+                        sa.literal(user_id, sa.UUID),
+                        *deltas,
+                        sa.func.now(),
+                        sa.func.now(),
+                    )
+                    .select_from(BookmarkModel)
+                    .where(BookmarkModel.user_id == user_id, condition)
+                    .having(sa.func.count() > 0)
+                )
+            else:
+                table, scope_column = MEMBERSHIP_TABLES[scope]
+                rows = (
+                    sa.select(
+                        sa.func.gen_random_uuid(),
+                        sa.literal(user_id, sa.UUID),
+                        sa.literal(scope),
+                        scope_column,
+                        *deltas,
+                        sa.func.now(),
+                        sa.func.now(),
+                    )
+                    .select_from(table)
+                    .join(BookmarkModel, BookmarkModel.id == table.c.bookmark_id)
+                    .where(BookmarkModel.user_id == user_id, condition)
+                    .group_by(scope_column)
+                )
+            await self._upsert(db, rows)
+
+    async def bookmarks_added(
+        self, db: AsyncSession, user_id: UUID, bookmark_ids: List[UUID]
+    ) -> None:
+        """Count newly inserted bookmarks (call after they are flushed)."""
+        if not bookmark_ids:
+            return
+        await self._apply(
+            db,
+            user_id,
+            bookmark_id_in(bookmark_ids),
+            total_sign=1,
+            unread_sign=1,
+            scopes=(SCOPE_ALL,),
+        )
+
+    async def bookmarks_removed(
+        self, db: AsyncSession, user_id: UUID, bookmark_ids: List[UUID]
+    ) -> None:
+        """Uncount bookmarks from every scope (call before deleting them, rows locked)."""
+        if not bookmark_ids:
+            return
+        await self._apply(
+            db,
+            user_id,
+            bookmark_id_in(bookmark_ids),
+            total_sign=-1,
+            unread_sign=-1,
+        )
+
+    async def read_state_changed(
+        self, db: AsyncSession, user_id: UUID, bookmark_ids: List[UUID], is_read: bool
+    ) -> None:
+        """Move bookmarks whose is_read actually flipped (call after the update)."""
+        if not bookmark_ids:
+            return
+        await self._apply(
+            db,
+            user_id,
+            bookmark_id_in(bookmark_ids),
+            total_sign=0,
+            unread_sign=-1 if is_read else 1,
+            unread_all=True,
+        )
+
+    async def membership_changed(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        scope: str,
+        scope_id: UUID,
+        bookmark_ids: List[UUID],
+        added: bool,
+    ) -> None:
+        """
+        Count bookmarks that actually entered or left one folder or tag.
+
+        Only pass IDs whose membership row was inserted or deleted; deltas come
+        from the bookmarks themselves, so this works before or after the write.
+        """
+        if not bookmark_ids:
+            return
+
+        user_id = UUID(str(user_id))
+        sign = 1 if added else -1
+        total, unread = self._deltas(sign, sign, unread_all=False)
+        rows = (
+            sa.select(
+                sa.func.gen_random_uuid(),
+                sa.literal(user_id, sa.UUID),
+                sa.literal(scope),
+                sa.literal(scope_id, sa.UUID),
+                total,
+                unread,
+                sa.func.now(),
+                sa.func.now(),
+            )
+            .select_from(BookmarkModel)
+            .where(
+                BookmarkModel.user_id == user_id,
+                bookmark_id_in(bookmark_ids),
+            )
+            .having(sa.func.count() > 0)
+        )
+        await self._upsert(db, rows)
+
+    async def scope_deleted(
+        self, db: AsyncSession, user_id: UUID, scope: str, scope_id: UUID
+    ) -> None:
+        """Drop the counter of a folder or tag that is being deleted."""
+        await db.execute(
+            sa.delete(BookmarkCounter).where(
+                BookmarkCounter.user_id == user_id,
+                BookmarkCounter.scope == scope,
+                BookmarkCounter.scope_id == scope_id,
+            )
+        )
+
+    async def get_counts(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        scope: str = SCOPE_ALL,
+        scope_id: Optional[UUID] = None,
+    ) -> Tuple[int, int]:
+        """
+        Get (total, unread) for one scope.
+
+        Args:
+            db: SQLAlchemy session
+            user_id: The user's ID
+            scope: 'all', 'folder' or 'tag'
+            scope_id: Folder or tag ID (ignored for 'all')
+
+        Returns:
+            (total, unread); (0, 0) when the scope has never held a bookmark
+        """
+        result = await db.execute(
+            sa.select(BookmarkCounter.total, BookmarkCounter.unread).where(
+                BookmarkCounter.user_id == user_id,
+                BookmarkCounter.scope == scope,
+                BookmarkCounter.scope_id == (user_id if scope == SCOPE_ALL else scope_id),
+            )
+        )
+        row = result.one_or_none()
+        return (row.total, row.unread) if row else (0, 0)
+
+    def total_for(
+        self, user_id: UUID, scope: str, scope_id_column
+    ) -> sa.ScalarSelect:
+        """Correlated scalar subquery of a folder/tag total, for list queries."""
+        return (
+            sa.select(BookmarkCounter.total)
+            .where(
+                BookmarkCounter.user_id == user_id,
+                BookmarkCounter.scope == scope,
+                BookmarkCounter.scope_id == scope_id_column,
+            )
+            .scalar_subquery()
+        )
+
+    async def rebuild(self, db: AsyncSession, user_id: UUID) -> None:
+        """Recompute every counter of a user from the bookmark tables."""
+        logger.info(f"Rebuilding bookmark counters for user_id={user_id}")
+        await db.execute(
+            sa.delete(BookmarkCounter).where(BookmarkCounter.user_id == user_id)
+        )
+        await self._apply(db, user_id, sa.true(), total_sign=1, unread_sign=1)
+
+
+counter_service = CounterService()
@@ -2,7 +2,9 @@ from typing import Any, Dict, List
 from uuid import UUID
 import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.v1.model.bookmark import Folder as FolderModel, bookmark_folders
+from src.v1.model.bookmark import Folder as FolderModel
+from src.v1.service.counter import counter_service, SCOPE_FOLDER
+from src.utils.redis import bump_data_version
 from src.v1.base.exception import NotFoundError, AlreadyExistsError
 
 from src.utils.log import get_logger
@@ -26,20 +28,17 @@ class FolderService:
         """
         logger.info(f"Fetching folders for user_id={user_id}")
 
+        bookmark_count = sa.func.coalesce(
+            counter_service.total_for(user_id, SCOPE_FOLDER, FolderModel.id), 0
+        )
         result = await db.execute(
-            sa.select(FolderModel).where(FolderModel.user_id == user_id)
+            sa.select(FolderModel, bookmark_count.label("bookmark_count")).where(
+                FolderModel.user_id == user_id
+            )
         )
-        folders = result.scalars().all()
 
         folder_list = []
-        for folder in folders:
-            count_result = await db.execute(
-                sa.select(sa.func.count(bookmark_folders.c.bookmark_id)).where(
-                    bookmark_folders.c.folder_id == folder.id
-                )
-            )
-            bookmark_count = count_result.scalar() or 0
-
+        for folder, bookmark_count in result.all():
             folder_list.append(
                 {
                     "id": str(folder.id),
@@ -78,8 +77,9 @@ class FolderService:
 
         folder = FolderModel(user_id=user_id, name=name)
         db.add(folder)
-        await db.flush()
+        await db.commit()
         await db.refresh(folder)
+        await bump_data_version(user_id)
 
         logger.info(f"Created folder '{name}' with id={folder.id}")
         return {
@@ -126,15 +126,13 @@ class FolderService:
             raise AlreadyExistsError(f"Folder '{name}' already exists")
 
         folder.name = name
-        await db.flush()
+        await db.commit()
         await db.refresh(folder)
+        await bump_data_version(user_id)
 
-        count_result = await db.execute(
-            sa.select(sa.func.count(bookmark_folders.c.bookmark_id)).where(
-                bookmark_folders.c.folder_id == folder.id
-            )
+        bookmark_count, _ = await counter_service.get_counts(
+            db, user_id, SCOPE_FOLDER, folder.id
         )
-        bookmark_count = count_result.scalar() or 0
 
         logger.info(f"Updated folder {folder_id} to name '{name}'")
         return {
@@ -168,8 +166,10 @@ class FolderService:
         if not folder:
             raise NotFoundError(f"Folder not found")
 
+        await counter_service.scope_deleted(db, user_id, SCOPE_FOLDER, folder.id)
         await db.delete(folder)
         await db.commit()
+        await bump_data_version(user_id)
 
         logger.info(f"Deleted folder {folder_id}")
         return True
@@ -199,12 +199,9 @@ class FolderService:
         if not folder:
             raise NotFoundError(f"Folder not found")
 
-        count_result = await db.execute(
-            sa.select(sa.func.count(bookmark_folders.c.bookmark_id)).where(
-                bookmark_folders.c.folder_id == folder.id
-            )
+        bookmark_count, _ = await counter_service.get_counts(
+            db, user_id, SCOPE_FOLDER, folder.id
         )
-        bookmark_count = count_result.scalar() or 0
 
         logger.info(f"Found folder {folder_id} with {bookmark_count} bookmarks")
         return {
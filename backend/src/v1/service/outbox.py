@@ -0,0 +1,144 @@
+from datetime import timedelta
+from typing import Iterable, List, Set
+from uuid import UUID
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.v1.model import XOutbox
+
+from src.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+OP_CREATE_BOOKMARK = "create_bookmark"
+OP_DELETE_BOOKMARK = "delete_bookmark"
+
+STATUS_PENDING = "pending"
+STATUS_FAILED = "failed"
+
+OUTBOX_BATCH_SIZE = 50
+OUTBOX_MAX_ATTEMPTS = 8
+# A claimed row is hidden from other workers for this long; if the worker
+# dies mid-batch the row becomes claimable again once the lease runs out.
+OUTBOX_LEASE = timedelta(minutes=5)
+OUTBOX_RETRY_BASE_DELAY = 30  # seconds, doubled per failed attempt
+OUTBOX_RATE_LIMIT_BACKOFF = timedelta(minutes=15)  # X's rate-limit window
+
+
+class OutboxService:
+    """
+    Queue of bookmark writes to X.
+
+    enqueue only adds a row to the given session, so the outbox entry
+    commits or rolls back together with the local change it mirrors. The
+    worker-side methods (claim_batch, complete, record_failure, defer) commit
+    on their own so progress survives a crash mid-batch.
+    """
+
+    async def enqueue(
+        self, db: AsyncSession, user_id: UUID, operation: str, tweet_id: str
+    ) -> None:
+        """Queue one X write for a tweet (does not commit)."""
+        db.add(XOutbox(user_id=user_id, operation=operation, tweet_id=str(tweet_id)))
+
+    async def pending_delete_tweet_ids(
+        self, db: AsyncSession, user_id: UUID, tweet_ids: Iterable[str]
+    ) -> Set[str]:
+        """Tweet IDs among `tweet_ids` whose X delete has not gone through yet."""
+        tweet_ids = list(tweet_ids)
+        if not tweet_ids:
+            return set()
+        result = await db.execute(
+            sa.select(XOutbox.tweet_id).where(
+                XOutbox.user_id == user_id,
+                XOutbox.operation == OP_DELETE_BOOKMARK,
+                XOutbox.status == STATUS_PENDING,
+                XOutbox.tweet_id.in_(tweet_ids),
+            )
+        )
+        return set(result.scalars().all())
+
+    async def claim_batch(
+        self, db: AsyncSession, limit: int = OUTBOX_BATCH_SIZE
+    ) -> List[sa.Row]:
+        """
+        Lease up to `limit` due entries, oldest first.
+
+        FOR UPDATE SKIP LOCKED lets several workers claim concurrently without
+        blocking on or double-claiming each other's rows.
+
+        Returns:
+            Rows with id, user_id, operation, tweet_id and attempts
+        """
+        claimable = (
+            sa.select(XOutbox.id)
+            .where(
+                XOutbox.status == STATUS_PENDING,
+                XOutbox.available_at <= sa.func.now(),
+            )
+            .order_by(XOutbox.available_at, XOutbox.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await db.execute(
+            sa.update(XOutbox)
+            .where(XOutbox.id.in_(claimable.scalar_subquery()))
+            .values(available_at=sa.func.now() + OUTBOX_LEASE)
+            .returning(
+                XOutbox.id,
+                XOutbox.user_id,
+                XOutbox.operation,
+                XOutbox.tweet_id,
+                XOutbox.attempts,
+                XOutbox.created_at,
+            )
+        )
+        entries = sorted(result.all(), key=lambda entry: entry.created_at)
+        await db.commit()
+        return entries
+
+    async def complete(self, db: AsyncSession, entry_id: UUID) -> None:
+        """Drop an entry whose write went through."""
+        await db.execute(sa.delete(XOutbox).where(XOutbox.id == entry_id))
+        await db.commit()
+
+    async def record_failure(
+        self,
+        db: AsyncSession,
+        entry_id: UUID,
+        attempts: int,
+        error: str,
+        permanent: bool = False,
+    ) -> None:
+        """
+        Schedule a retry with exponential backoff, or give up once
+        OUTBOX_MAX_ATTEMPTS is reached. A permanent failure (an X error that
+        retrying cannot fix, e.g. 401/403/404) gives up right away.
+        """
+        attempts += 1
+        values = {"attempts": attempts, "last_error": error[:2000]}
+        if permanent or attempts >= OUTBOX_MAX_ATTEMPTS:
+            values["status"] = STATUS_FAILED
+            logger.error(f"Giving up on outbox entry {entry_id}: {error}")
+        else:
+            delay = timedelta(seconds=OUTBOX_RETRY_BASE_DELAY * 2 ** (attempts - 1))
+            values["available_at"] = sa.func.now() + delay
+        await db.execute(
+            sa.update(XOutbox).where(XOutbox.id == entry_id).values(**values)
+        )
+        await db.commit()
+
+    async def defer(
+        self, db: AsyncSession, entry_ids: List[UUID], delay: timedelta
+    ) -> None:
+        """Push entries back without counting an attempt (e.g. on HTTP 429)."""
+        if not entry_ids:
+            return
+        await db.execute(
+            sa.update(XOutbox)
+            .where(XOutbox.id.in_(entry_ids))
+            .values(available_at=sa.func.now() + delay)
+        )
+        await db.commit()
+
+
+outbox_service = OutboxService()
@@ -6,7 +6,7 @@ import uuid
 def setup_task_signals():
     from src.celery.celery import celery_app
     from src.utils.db import get_async_db_session
-    from src.v1.admin.models import SyncJob
+    from src.v1.model import SyncJob
 
     @task_started.connect
     def on_task_started(sender=None, request=None, **kwargs):
@@ -24,14 +24,34 @@ def setup_task_signals():
 
         async def _create_job():
             async with get_async_db_session() as db:
-                job = SyncJob(
-                    task_id=task_id,
-                    user_id=user_id,
-                    type=job_type,
-                    status="active",
-                    started_at=datetime.now(timezone.utc),
+                from sqlalchemy import func, select
+
+                # sync_jobs cannot hold a unique task_id (unique keys on a
+                # partitioned table must include started_at), so one row per
+                # task is kept here: a retry runs under the same task id and
+                # restarts the existing row. The lock serializes starts of
+                # the same id until commit.
+                await db.execute(
+                    select(func.pg_advisory_xact_lock(func.hashtext(task_id)))
                 )
-                db.add(job)
+                result = await db.execute(
+                    select(SyncJob).where(SyncJob.task_id == task_id)
+                )
+                job = result.scalars().first()
+                if job:
+                    job.status = "active"
+                    job.completed_at = None
+                    job.error = None
+                else:
+                    db.add(
+                        SyncJob(
+                            task_id=task_id,
+                            user_id=user_id,
+                            type=job_type,
+                            status="active",
+                            started_at=datetime.now(timezone.utc),
+                        )
+                    )
                 await db.commit()
 
         try:
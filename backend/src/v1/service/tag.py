@@ -2,9 +2,11 @@ from typing import Any, Dict, List, Optional
 from uuid import UUID
 import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.v1.model.tag import Tag as TagModel, bookmark_tags
+from src.v1.model.tag import Tag as TagModel
 from src.v1.model.bookmark import Bookmark as BookmarkModel
 from src.v1.model.post import Post as PostModel
+from src.v1.service.counter import counter_service, SCOPE_TAG
+from src.utils.redis import bump_data_version
 from src.v1.base.exception import NotFoundError, AlreadyExistsError, BadRequest
 
 from src.utils.log import get_logger
@@ -26,20 +28,17 @@ class TagService:
         """
         logger.info(f"Fetching tags for user_id={user_id}")
 
+        bookmark_count = sa.func.coalesce(
+            counter_service.total_for(user_id, SCOPE_TAG, TagModel.id), 0
+        )
         result = await db.execute(
-            sa.select(TagModel).where(TagModel.user_id == user_id)
+            sa.select(TagModel, bookmark_count.label("bookmark_count")).where(
+                TagModel.user_id == user_id
+            )
         )
-        tags = result.scalars().all()
 
         tag_list = []
-        for tag in tags:
-            count_result = await db.execute(
-                sa.select(sa.func.count(bookmark_tags.c.bookmark_id)).where(
-                    bookmark_tags.c.tag_id == tag.id
-                )
-            )
-            bookmark_count = count_result.scalar() or 0
-
+        for tag, bookmark_count in result.all():
             tag_list.append(
                 {
                     "id": str(tag.id),
@@ -80,12 +79,9 @@ class TagService:
         if not tag:
             return None
 
-        count_result = await db.execute(
-            sa.select(sa.func.count(bookmark_tags.c.bookmark_id)).where(
-                bookmark_tags.c.tag_id == tag.id
-            )
+        bookmark_count, _ = await counter_service.get_counts(
+            db, user_id, SCOPE_TAG, tag.id
         )
-        bookmark_count = count_result.scalar() or 0
 
         return {
             "id": str(tag.id),
@@ -123,8 +119,9 @@ class TagService:
 
         tag = TagModel(user_id=user_id, name=name, color=color, source="user")
         db.add(tag)
-        await db.flush()
+        await db.commit()
         await db.refresh(tag)
+        await bump_data_version(user_id)
 
         logger.info(f"Created tag '{name}' with id={tag.id}")
         return {
@@ -186,15 +183,13 @@ class TagService:
         if color is not None:
             tag.color = color
 
-        await db.flush()
+        await db.commit()
         await db.refresh(tag)
+        await bump_data_version(user_id)
 
-        count_result = await db.execute(
-            sa.select(sa.func.count(bookmark_tags.c.bookmark_id)).where(
-                bookmark_tags.c.tag_id == tag.id
-            )
+        bookmark_count, _ = await counter_service.get_counts(
+            db, user_id, SCOPE_TAG, tag.id
         )
-        bookmark_count = count_result.scalar() or 0
 
         logger.info(f"Updated tag {tag_id}")
         return {
@@ -231,8 +226,10 @@ class TagService:
         if tag.source != "user":
             raise BadRequest("Cannot delete X annotation tags")
 
+        await counter_service.scope_deleted(db, user_id, SCOPE_TAG, tag.id)
         await db.delete(tag)
         await db.commit()
+        await bump_data_version(user_id)
 
         logger.info(f"Deleted tag {tag_id}")
         return True
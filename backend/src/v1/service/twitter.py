@@ -1,5 +1,6 @@
 from src.utils.xdk_client import xdk_client
 from src.utils.log import get_logger
+from src.utils.redis import record_x_call
 from typing import Dict, List, Any, Optional, Iterator
 from src.v1.schema.user import UserInfoFromX
 from src.v1.base.exception import ExternalAPIError
@@ -10,6 +11,7 @@ from tenacity import (
     stop_after_attempt,
     wait_exponential,
     wait_random,
+    retry_if_exception,
     retry_if_exception_type,
     before_sleep_log,
     after_log,
@@ -19,6 +21,25 @@ import httpx
 logger = get_logger(__name__)
 
 
+def _is_transient_error(exc: BaseException) -> bool:
+    """Retry network errors, 429s and 5xx; other X errors fail the same way again."""
+    if isinstance(exc, ExternalAPIError):
+        return exc.is_transient
+    return isinstance(
+        exc, (httpx.ConnectError, httpx.RequestError, httpx.TimeoutException)
+    )
+
+
+def _raise_for_write_error(response_data) -> None:
+    """Raise ExternalAPIError for any error payload from a bookmark write."""
+    if isinstance(response_data, dict) and (
+        response_data.get("errors") or response_data.get("title")
+    ):
+        raise ExternalAPIError(
+            f"API error: {response_data}", status_code=response_data.get("status")
+        )
+
+
 class TwitterService:
     """
     Twitter service using XDK for API endpoints with clean return values
@@ -86,6 +107,7 @@ class TwitterService:
             self.client.access_token = access_token
 
             # Use XDK to get user info
+            await record_x_call("get_me")
             user_response = self.client.users.get_me(
                 user_fields=[
                     "id",
@@ -131,6 +153,7 @@ class TwitterService:
             self.client.access_token = access_token
 
             # Use XDK to get user by username
+            await record_x_call("get_by_username")
             user_response = self.client.users.get_by_username(
                 username=username,
                 user_fields=[
@@ -172,6 +195,7 @@ class TwitterService:
             self.client.access_token = access_token
 
             # Use XDK to get user by ID
+            await record_x_call("get_by_id")
             user_response = self.client.users.get_by_id(
                 id=user_id,
                 user_fields=[
@@ -227,6 +251,7 @@ class TwitterService:
             self.client.access_token = access_token
 
             # Use XDK to get bookmarks - returns an iterator for pagination
+            await record_x_call("get_bookmarks")
             bookmarks_response = self.client.users.get_bookmarks(
                 id=str(x_id),
                 max_results=min(max_results, 400),
@@ -303,14 +328,7 @@ class TwitterService:
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=60) + wait_random(0, 1),
-        retry=retry_if_exception_type(
-            (
-                httpx.ConnectError,
-                httpx.RequestError,
-                httpx.TimeoutException,
-                ExternalAPIError,
-            )
-        ),
+        retry=retry_if_exception(_is_transient_error),
         before_sleep=before_sleep_log(logger, logging.WARNING),
         after=after_log(logger, logging.ERROR),
         reraise=True,
@@ -330,23 +348,21 @@ class TwitterService:
             # Use XDK to create bookmark
             request_body = CreateBookmarkRequest(tweet_id=tweet_id)
 
+            await record_x_call("create_bookmark")
             response = self.client.users.create_bookmark(
                 id=str(x_id), body=request_body
             )
 
-            # Check for API errors
+            # Any error payload (4xx included) raises, so a failed write is
+            # never mistaken for a completed one
             response_data = (
                 response.model_dump() if hasattr(response, "model_dump") else response
             )
-            if isinstance(response_data, dict):
-                if response_data.get("errors") or response_data.get("title"):
-                    status = response_data.get("status", 0)
-                    if status in (429, 500, 502, 503, 504):
-                        raise ExternalAPIError(
-                            f"API error: {response_data}", status_code=status
-                        )
+            _raise_for_write_error(response_data)
 
-            logger.info(f"Bookmark creation response: {response}")
+            logger.debug(
+                "x_api.response", phase="create_bookmark", user_id=user_id, payload=response_data
+            )
             return response_data
 
         except Exception as e:
@@ -359,14 +375,7 @@ class TwitterService:
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=60) + wait_random(0, 1),
-        retry=retry_if_exception_type(
-            (
-                httpx.ConnectError,
-                httpx.RequestError,
-                httpx.TimeoutException,
-                ExternalAPIError,
-            )
-        ),
+        retry=retry_if_exception(_is_transient_error),
         before_sleep=before_sleep_log(logger, logging.WARNING),
         after=after_log(logger, logging.ERROR),
         reraise=True,
@@ -384,23 +393,21 @@ class TwitterService:
             self.client.access_token = access_token
 
             # Use XDK to delete bookmark
+            await record_x_call("delete_bookmark")
             response = self.client.users.delete_bookmark(
                 id=str(x_id), tweet_id=tweet_id
             )
 
-            # Check for API errors
+            # Any error payload (4xx included) raises, so a failed write is
+            # never mistaken for a completed one
             response_data = (
                 response.model_dump() if hasattr(response, "model_dump") else response
             )
-            if isinstance(response_data, dict):
-                if response_data.get("errors") or response_data.get("title"):
-                    status = response_data.get("status", 0)
-                    if status in (429, 500, 502, 503, 504):
-                        raise ExternalAPIError(
-                            f"API error: {response_data}", status_code=status
-                        )
+            _raise_for_write_error(response_data)
 
-            logger.info(f"Bookmark deletion response: {response}")
+            logger.debug(
+                "x_api.response", phase="delete_bookmark", user_id=user_id, payload=response_data
+            )
             return response_data
 
         except Exception as e:
@@ -0,0 +1,53 @@
+"""
+Admin list totals: served from the per-filter count cache, not recounted
+on every page.
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.v1.service import admin as admin_module
+from src.v1.service.admin import UserAdminService
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cached = {}
+
+    async def get_or_fetch_cache(key, fetch, ttl):
+        if key not in cached:
+            cached[key] = await fetch()
+        return cached[key]
+
+    monkeypatch.setattr(admin_module, "get_or_fetch_cache", get_or_fetch_cache)
+    return cached
+
+
+def _db(count):
+    db = MagicMock()
+
+    async def execute(stmt):
+        result = MagicMock()
+        result.scalar.return_value = count
+        result.all.return_value = []
+        return result
+
+    db.execute = AsyncMock(side_effect=execute)
+    return db
+
+
+def test_user_total_is_counted_once_per_filter(cache):
+    db = _db(count=1234)
+    service = UserAdminService(db)
+
+    first = asyncio.run(service.list_users(search="Ada", status="active"))
+    second = asyncio.run(service.list_users(search="ada", status="active", page=2))
+
+    assert first[1] == second[1] == 1234
+    assert list(cache) == ["admin:count:users:active:ada"]
+    # two page queries, one count
+    assert db.execute.await_count == 3
+    count_sql = str(db.execute.await_args_list[0].args[0])
+    assert "count(*)" in count_sql
+    assert "bookmark_counters" not in count_sql
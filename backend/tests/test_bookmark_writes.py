@@ -0,0 +1,62 @@
+"""
+Single-bookmark write routes: the outbox drain only starts when the
+service actually queued an X write.
+"""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.utils.db import get_session
+from src.utils.exception import register_error_handlers
+from src.v1.route import bookmark as bookmark_route
+from src.v1.route.dependencies import get_bookmark_service, get_current_user
+
+USER_ID = "6f1c1c6e-2b55-4c8e-9d0a-3f2d7f0e5a11"
+
+
+@pytest.fixture
+def api(monkeypatch):
+    service = MagicMock()
+    service.delete_bookmark = AsyncMock(return_value=True)
+    service.create_bookmark = AsyncMock(return_value=True)
+    drain = MagicMock()
+    monkeypatch.setattr(bookmark_route, "_trigger_outbox_drain", drain)
+
+    app = FastAPI()
+    register_error_handlers(app)
+    app.include_router(bookmark_route.bookmark_router)
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=USER_ID)
+    app.dependency_overrides[get_bookmark_service] = lambda: service
+    app.dependency_overrides[get_session] = lambda: None
+    return SimpleNamespace(client=TestClient(app), service=service, drain=drain)
+
+
+def test_delete_queues_the_x_delete(api):
+    response = api.client.delete("/bookmarks/111")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "deleted"
+    api.service.delete_bookmark.assert_awaited_once_with(None, USER_ID, "111")
+    api.drain.assert_called_once_with()
+
+
+def test_delete_of_an_unknown_bookmark_is_404_and_queues_nothing(api):
+    api.service.delete_bookmark.return_value = False
+
+    response = api.client.delete("/bookmarks/111")
+
+    assert response.status_code == 404
+    api.drain.assert_not_called()
+
+
+def test_create_of_an_existing_bookmark_queues_nothing(api):
+    api.service.create_bookmark.return_value = False
+
+    response = api.client.post("/bookmarks", json={"tweet_id": "111"})
+
+    assert response.status_code == 202
+    assert response.json()["status"] == "exists"
+    api.drain.assert_not_called()
@@ -0,0 +1,147 @@
+"""
+Set-based bulk operations: selection by IDs or by feed filter, the
+BULK_MAX_IDS cap, and the counter writes that ride along.
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.v1.base.exception import BadRequest
+from src.v1.service import bookmark as bookmark_module
+from src.v1.service.bookmark import BULK_MAX_IDS, BookmarkService
+
+USER_ID = uuid4()
+
+
+def _sql(clause):
+    return str(clause.compile(dialect=postgresql.dialect()))
+
+
+def _conditions(**kwargs):
+    service = BookmarkService()
+    return asyncio.run(service._bulk_conditions(None, USER_ID, **kwargs))
+
+
+def _session(*results):
+    """Session whose execute() returns one result per call, yielding `results`."""
+    db = MagicMock()
+    db.execute = AsyncMock(
+        side_effect=[
+            MagicMock(**{"scalars.return_value.all.return_value": ids})
+            for ids in results
+        ]
+    )
+    db.commit = AsyncMock()
+    return db
+
+
+@pytest.fixture
+def side_effects(monkeypatch):
+    counters = MagicMock()
+    counters.read_state_changed = AsyncMock()
+    bump = AsyncMock()
+    monkeypatch.setattr(bookmark_module, "counter_service", counters)
+    monkeypatch.setattr(bookmark_module, "bump_data_version", bump)
+    return MagicMock(counters=counters, bump=bump)
+
+
+# ── selection ─────────────────────────────────────────────────────
+
+
+def test_ids_or_filter_exactly_one_is_required():
+    with pytest.raises(BadRequest):
+        _conditions()
+    with pytest.raises(BadRequest):
+        _conditions(bookmark_ids=[str(uuid4())], filters={})
+
+
+def test_selection_by_ids_is_one_array_bound_clause():
+    first, second = str(uuid4()), str(uuid4())
+
+    conditions = _conditions(bookmark_ids=[first, second, first])
+
+    assert len(conditions) == 2
+    assert "bookmarks.id = ANY" in _sql(conditions[1])
+    bound = conditions[1].compile().params
+    assert [str(value) for value in next(iter(bound.values()))] == [first, second]
+
+
+def test_bookmark_ids_are_capped():
+    at_cap = [str(uuid4()) for _ in range(BULK_MAX_IDS)]
+
+    assert _conditions(bookmark_ids=at_cap) is not None
+    with pytest.raises(BadRequest, match=str(BULK_MAX_IDS)):
+        _conditions(bookmark_ids=at_cap + [str(uuid4())])
+
+
+def test_invalid_or_empty_ids():
+    with pytest.raises(BadRequest):
+        _conditions(bookmark_ids=["not-a-uuid"])
+    assert _conditions(bookmark_ids=[]) is None
+
+
+def test_selection_by_filter_reuses_the_feed_clauses():
+    tag = str(uuid4())
+
+    conditions = _conditions(
+        filters={"tag_ids": [tag, tag, str(uuid4())], "tag_mode": "all", "unread": True}
+    )
+    sql = [_sql(condition) for condition in conditions]
+
+    assert "bookmarks.post_id = posts.id" in sql[1]
+    assert any("bookmarks.is_read = false" in clause for clause in sql)
+    (tag_clause,) = [clause for clause in conditions if "HAVING" in _sql(clause)]
+    # duplicate tag IDs are dropped before counting
+    assert tag_clause.compile().params["count_1"] == 2
+
+
+def test_filter_with_unknown_author_selects_nothing(monkeypatch):
+    monkeypatch.setattr(
+        BookmarkService, "resolve_author_ids", AsyncMock(return_value=[])
+    )
+
+    assert _conditions(filters={"author": "nobody"}) is None
+
+
+def test_filter_with_invalid_tag_id():
+    with pytest.raises(BadRequest):
+        _conditions(filters={"tag_ids": ["bad"]})
+
+
+# ── writes ────────────────────────────────────────────────────────
+
+
+def test_bulk_read_moves_counters_for_changed_rows_only(side_effects):
+    changed = [uuid4(), uuid4()]
+    db = _session(changed)
+
+    count = asyncio.run(
+        BookmarkService().bulk_set_read_state(
+            db, USER_ID, True, filters={"unread": True}
+        )
+    )
+
+    assert count == 2
+    side_effects.counters.read_state_changed.assert_awaited_once_with(
+        db, USER_ID, changed, is_read=True
+    )
+    db.commit.assert_awaited_once()
+    side_effects.bump.assert_awaited_once_with(USER_ID)
+
+
+def test_bulk_read_without_changes_does_not_commit(side_effects):
+    db = _session([])
+
+    count = asyncio.run(
+        BookmarkService().bulk_set_read_state(
+            db, USER_ID, False, bookmark_ids=[str(uuid4())]
+        )
+    )
+
+    assert count == 0
+    side_effects.counters.read_state_changed.assert_not_awaited()
+    db.commit.assert_not_awaited()
+    side_effects.bump.assert_not_awaited()
@@ -0,0 +1,100 @@
+"""
+ConditionalGet: ETags from the user's data version, and 304 on a match.
+"""
+import pytest
+from fastapi import Depends, FastAPI, Response
+from fastapi.testclient import TestClient
+
+from src.utils.exception import register_error_handlers
+from src.utils.response import json_response
+from src.v1.route import dependencies
+from src.v1.route.dependencies import ConditionalGet, access_token_bearer
+
+USER_ID = "6f1c1c6e-2b55-4c8e-9d0a-3f2d7f0e5a11"
+
+
+@pytest.fixture
+def data_version(monkeypatch):
+    version = {"value": 1}
+
+    async def fake_get_data_version(user_id):
+        if isinstance(version["value"], Exception):
+            raise version["value"]
+        return version["value"]
+
+    monkeypatch.setattr(dependencies, "get_data_version", fake_get_data_version)
+    return version
+
+
+@pytest.fixture
+def client(data_version):
+    app = FastAPI()
+    register_error_handlers(app)
+    calls = {"count": 0}
+
+    @app.get("/folders", dependencies=[Depends(ConditionalGet("folders"))])
+    async def list_folders(response: Response):
+        calls["count"] += 1
+        return json_response({"data": []}, response)
+
+    app.dependency_overrides[access_token_bearer] = lambda: {
+        "user": {"user_id": USER_ID}
+    }
+    test_client = TestClient(app)
+    test_client.calls = calls
+    return test_client
+
+
+def test_first_request_gets_an_etag(client):
+    response = client.get("/folders")
+
+    assert response.status_code == 200
+    assert response.headers["etag"].startswith('"')
+    assert response.headers["cache-control"] == "private, no-cache"
+
+
+def test_matching_if_none_match_returns_304_without_running_the_route(client):
+    etag = client.get("/folders").headers["etag"]
+
+    response = client.get("/folders", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+    assert client.calls["count"] == 1
+
+
+def test_etag_in_a_list_and_wildcard_match(client):
+    etag = client.get("/folders").headers["etag"]
+
+    listed = client.get("/folders", headers={"If-None-Match": f'"stale", {etag}'})
+    wildcard = client.get("/folders", headers={"If-None-Match": "*"})
+
+    assert listed.status_code == 304
+    assert wildcard.status_code == 304
+
+
+def test_write_bumps_the_version_and_invalidates_the_etag(client, data_version):
+    etag = client.get("/folders").headers["etag"]
+    data_version["value"] = 2
+
+    response = client.get("/folders", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_query_string_is_part_of_the_etag(client):
+    first = client.get("/folders?page=1").headers["etag"]
+    second = client.get("/folders?page=2").headers["etag"]
+
+    assert first != second
+
+
+def test_redis_failure_serves_without_an_etag(client, data_version):
+    data_version["value"] = ConnectionError("redis down")
+
+    response = client.get("/folders", headers={"If-None-Match": "*"})
+
+    assert response.status_code == 200
+    assert "etag" not in response.headers
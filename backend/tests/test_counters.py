@@ -0,0 +1,194 @@
+"""
+CounterService: the (total, unread) deltas each write applies per scope.
+
+The deltas are computed in SQL, so these tests inspect the INSERT ... SELECT
+... ON CONFLICT statements the service issues instead of running them.
+"""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from src.v1.service import bookmark as bookmark_module
+from src.v1.service.bookmark import BookmarkService
+from src.v1.service.counter import (
+    SCOPE_ALL,
+    SCOPE_FOLDER,
+    SCOPE_TAG,
+    counter_service,
+)
+
+
+class RecordingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+
+
+def _deltas(stmt):
+    """(scope, total sign, unread sign, unread counts only unread rows)."""
+    columns = {column.key: column for column in stmt.select.selected_columns}
+    total, unread = columns["total"].element, columns["unread"].element
+    scope = list(stmt.select.selected_columns)[2].value
+    return (
+        scope,
+        total.right.value,
+        unread.right.value,
+        "FILTER" in str(unread.left),
+    )
+
+
+def _run(method, *args, **kwargs):
+    db = RecordingSession()
+    asyncio.run(method(db, *args, **kwargs))
+    return db.statements
+
+
+def test_added_bookmarks_count_once_in_the_all_scope():
+    statements = _run(counter_service.bookmarks_added, uuid4(), [uuid4(), uuid4()])
+
+    assert [_deltas(stmt) for stmt in statements] == [(SCOPE_ALL, 1, 1, True)]
+
+
+def test_removed_bookmarks_leave_every_scope():
+    statements = _run(counter_service.bookmarks_removed, uuid4(), [uuid4()])
+
+    assert [_deltas(stmt) for stmt in statements] == [
+        (SCOPE_ALL, -1, -1, True),
+        (SCOPE_FOLDER, -1, -1, True),
+        (SCOPE_TAG, -1, -1, True),
+    ]
+
+
+def test_read_state_flip_moves_only_unread():
+    read = _run(counter_service.read_state_changed, uuid4(), [uuid4()], is_read=True)
+    unread = _run(
+        counter_service.read_state_changed, uuid4(), [uuid4()], is_read=False
+    )
+
+    # every flipped row counts, since is_read already holds the new value
+    assert {_deltas(stmt)[1:] for stmt in read} == {(0, -1, False)}
+    assert {_deltas(stmt)[1:] for stmt in unread} == {(0, 1, False)}
+
+
+def test_membership_change_targets_one_collection():
+    folder_id = uuid4()
+    added = _run(
+        counter_service.membership_changed,
+        uuid4(),
+        SCOPE_FOLDER,
+        folder_id,
+        [uuid4()],
+        added=True,
+    )
+    removed = _run(
+        counter_service.membership_changed,
+        uuid4(),
+        SCOPE_TAG,
+        uuid4(),
+        [uuid4()],
+        added=False,
+    )
+
+    assert [_deltas(stmt) for stmt in added] == [(SCOPE_FOLDER, 1, 1, True)]
+    assert list(added[0].select.selected_columns)[3].value == folder_id
+    assert [_deltas(stmt) for stmt in removed] == [(SCOPE_TAG, -1, -1, True)]
+
+
+def test_new_counter_rows_are_timestamped():
+    statements = _run(counter_service.bookmarks_removed, uuid4(), [uuid4()]) + _run(
+        counter_service.membership_changed,
+        uuid4(),
+        SCOPE_TAG,
+        uuid4(),
+        [uuid4()],
+        added=True,
+    )
+
+    for stmt in statements:
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "total, unread, created_at, updated_at)" in sql
+        assert sql.count("now()") == 3  # created_at, updated_at, and on conflict
+
+
+def test_ids_are_bound_as_one_array_parameter():
+    ids = [uuid4() for _ in range(3)]
+    (stmt,) = _run(counter_service.bookmarks_added, uuid4(), ids)
+
+    params = stmt.compile().params
+    assert ids in params.values()
+
+
+def test_empty_selection_issues_no_statement():
+    user_id = uuid4()
+
+    assert _run(counter_service.bookmarks_added, user_id, []) == []
+    assert _run(counter_service.bookmarks_removed, user_id, []) == []
+    assert _run(counter_service.read_state_changed, user_id, [], is_read=True) == []
+    assert (
+        _run(
+            counter_service.membership_changed,
+            user_id,
+            SCOPE_TAG,
+            uuid4(),
+            [],
+            added=True,
+        )
+        == []
+    )
+
+
+class DeleteSession(RecordingSession):
+    """Session for delete_bookmark: a post lookup, then the locked bookmark ids."""
+
+    def __init__(self, locked_ids):
+        super().__init__()
+        self.locked_ids = locked_ids
+        self.committed = False
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = SimpleNamespace(id=uuid4())
+        result.scalars.return_value.all.return_value = (
+            self.locked_ids if len(self.statements) == 2 else []
+        )
+        return result
+
+    async def commit(self):
+        self.committed = True
+
+
+def _counter_writes(db):
+    return [
+        stmt
+        for stmt in db.statements
+        if getattr(stmt, "table", None) is not None
+        and stmt.table.name == "bookmark_counters"
+    ]
+
+
+def test_second_delete_of_the_same_bookmark_leaves_counters_alone(monkeypatch):
+    monkeypatch.setattr(bookmark_module, "outbox_service", MagicMock(enqueue=AsyncMock()))
+    monkeypatch.setattr(bookmark_module, "bump_data_version", AsyncMock())
+    service = BookmarkService()
+    user_id = str(uuid4())
+
+    first = DeleteSession([uuid4()])
+    assert asyncio.run(service.delete_bookmark(first, user_id, "111")) is True
+    # a concurrent delete blocks on the row lock, then sees the row gone
+    second = DeleteSession([])
+    assert asyncio.run(service.delete_bookmark(second, user_id, "111")) is False
+
+    lock = first.statements[1]
+    assert lock._for_update_arg is not None
+    assert len(_counter_writes(first)) == 3
+    assert first.committed
+    assert _counter_writes(second) == []
+    assert len(second.statements) == 2
+    assert not second.committed
+    bookmark_module.outbox_service.enqueue.assert_awaited_once()
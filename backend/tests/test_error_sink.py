@@ -0,0 +1,176 @@
+"""
+ErrorLogHandler: fingerprint dedupe in the buffer and the batched upsert.
+"""
+import logging
+import sys
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.utils import error_sink
+from src.utils.error_sink import ErrorLogHandler, fingerprint
+
+
+class FakeEngine:
+    def __init__(self):
+        self.executed = []
+
+    @contextmanager
+    def begin(self):
+        yield self
+
+    def execute(self, stmt, rows):
+        self.executed.append((stmt, rows))
+
+
+@pytest.fixture
+def handler(monkeypatch):
+    handler = ErrorLogHandler("api")
+    engine = FakeEngine()
+    # no flusher thread: the tests flush by hand
+    monkeypatch.setattr(handler, "_ensure_flusher", lambda: None)
+    monkeypatch.setattr(handler, "_get_engine", lambda: engine)
+    handler.engine = engine
+    return handler
+
+
+def _record(msg, *args, name="src.v1.service.bookmark", level=logging.ERROR,
+            exc_info=None, created=None):
+    record = logging.LogRecord(name, level, __file__, 1, msg, args, exc_info)
+    if created is not None:
+        record.created = created
+    return record
+
+
+def test_fingerprint_masks_numbers_and_ids():
+    first = fingerprint(
+        "ERROR", "x", "bookmark 6f1c1c6e-2b55-4c8e-9d0a-3f2d7f0e5a11 failed after 3", ""
+    )
+    second = fingerprint(
+        "ERROR", "x", "bookmark 0a1b2c3d-0000-4c8e-9d0a-ffffffffffff failed after 12", ""
+    )
+
+    assert first == second
+    assert fingerprint("ERROR", "x", "at 0x7f3a", "") == fingerprint(
+        "ERROR", "x", "at 0xdead", ""
+    )
+
+
+def test_fingerprint_keeps_level_logger_and_exception_apart():
+    base = fingerprint("ERROR", "x", "boom", "ValueError")
+
+    assert base != fingerprint("WARN", "x", "boom", "ValueError")
+    assert base != fingerprint("ERROR", "y", "boom", "ValueError")
+    assert base != fingerprint("ERROR", "x", "boom", "KeyError")
+    assert base != fingerprint("ERROR", "x", "bang", "ValueError")
+
+
+def test_repeats_fold_into_one_entry(handler):
+    handler.emit(_record("sync failed for user %s", 1, created=100))
+    handler.emit(_record("sync failed for user %s", 2, created=160))
+    handler.emit(_record("sync failed for user %s", 3, created=220))
+
+    (entry,) = handler._buffer.values()
+    assert entry["count"] == 3
+    assert entry["first_seen"].timestamp() == 100
+    assert entry["timestamp"].timestamp() == 220
+    # the latest occurrence's text is kept
+    assert entry["message"] == "sync failed for user 3"
+    assert entry["source"] == "api:src.v1.service.bookmark"
+    assert entry["level"] == "ERROR"
+
+
+def test_exception_type_and_trace_are_captured(handler):
+    try:
+        raise ValueError("bad value 7")
+    except ValueError:
+        exc_info = sys.exc_info()
+    handler.emit(_record("failed", exc_info=exc_info))
+    handler.emit(_record("failed"))
+
+    assert len(handler._buffer) == 2
+    traced = [entry for entry in handler._buffer.values() if entry["trace"]]
+    assert len(traced) == 1
+    assert "ValueError: bad value 7" in traced[0]["trace"]
+
+
+def test_warnings_are_captured_below_that_is_not(handler):
+    root = logging.getLogger("test_error_sink")
+    root.addHandler(handler)
+    try:
+        root.warning("slow response")
+        root.info("fine")
+    finally:
+        root.removeHandler(handler)
+
+    (entry,) = handler._buffer.values()
+    assert entry["level"] == "WARN"
+
+
+def test_ignored_loggers(handler):
+    handler.emit(_record("pool timeout", name="sqlalchemy.pool.impl.QueuePool"))
+    handler.emit(_record("flush failed", name=error_sink.__name__))
+
+    assert handler._buffer == {}
+
+
+def test_structlog_event_dict_uses_the_event_only(handler):
+    handler.emit(_record({"event": "x_api.error", "user_id": "u1"}))
+    handler.emit(_record({"event": "x_api.error", "user_id": "u2"}))
+
+    (entry,) = handler._buffer.values()
+    assert entry["message"] == "x_api.error"
+    assert entry["count"] == 2
+
+
+def test_buffer_limit_drops_new_fingerprints(handler, monkeypatch, capsys):
+    monkeypatch.setattr(error_sink, "ERROR_LOG_BUFFER_LIMIT", 2)
+    handler.emit(_record("first"))
+    handler.emit(_record("second"))
+    handler.emit(_record("third"))
+    handler.emit(_record("first"))
+
+    assert len(handler._buffer) == 2
+    assert handler._dropped == 1
+    assert [entry["count"] for entry in handler._buffer.values()] == [2, 1]
+
+    handler.flush()
+
+    assert handler._dropped == 0
+    assert "1 records dropped" in capsys.readouterr().err
+
+
+def test_flush_writes_one_batched_upsert(handler):
+    handler.emit(_record("first"))
+    handler.emit(_record("first"))
+    handler.emit(_record("second"))
+
+    handler.flush()
+
+    ((stmt, rows),) = handler.engine.executed
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert sql.startswith("INSERT INTO error_logs")
+    assert "ON CONFLICT (fingerprint) DO UPDATE" in sql
+    assert "count = (error_logs.count + excluded.count)" in sql
+    assert sorted((row["message"], row["count"]) for row in rows) == [
+        ("first", 2),
+        ("second", 1),
+    ]
+    assert handler._buffer == {}
+
+    handler.flush()
+    assert len(handler.engine.executed) == 1
+
+
+def test_flush_failure_goes_to_stderr(handler, monkeypatch, capsys):
+    def broken_engine():
+        raise ConnectionError("db down")
+
+    monkeypatch.setattr(handler, "_get_engine", broken_engine)
+    handler.emit(_record("first"))
+
+    handler.flush()
+
+    assert "1 entries lost: db down" in capsys.readouterr().err
+    assert handler._buffer == {}
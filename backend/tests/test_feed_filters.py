@@ -0,0 +1,63 @@
+"""
+Feed filter clauses: tag_mode any/all semi-joins and folder filtering.
+"""
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from src.v1.service.bookmark import _feed_conditions
+
+
+def _sql(clause):
+    return str(clause.compile(dialect=postgresql.dialect()))
+
+
+def _params(clause):
+    return clause.compile(dialect=postgresql.dialect()).params
+
+
+def test_tag_mode_all_requires_every_tag():
+    tags = [uuid4(), uuid4(), uuid4()]
+
+    (clause,) = _feed_conditions(tag_uuids=tags, tag_mode="all")
+    sql = _sql(clause)
+
+    assert "bookmarks.id IN (SELECT bookmarks_tags.bookmark_id" in sql
+    assert "GROUP BY bookmarks_tags.bookmark_id" in sql
+    assert "HAVING count(*) = %(count_1)s" in sql
+    assert _params(clause)["count_1"] == 3
+
+
+def test_tag_mode_any_is_a_single_exists():
+    tags = [uuid4(), uuid4()]
+
+    (clause,) = _feed_conditions(tag_uuids=tags, tag_mode="any")
+    sql = _sql(clause)
+
+    assert sql.startswith("EXISTS (SELECT")
+    assert "bookmarks_tags.bookmark_id = bookmarks.id" in sql
+    assert "GROUP BY" not in sql
+
+
+def test_tag_mode_all_with_one_tag_is_the_same_as_any():
+    tag = uuid4()
+
+    (all_clause,) = _feed_conditions(tag_uuids=[tag], tag_mode="all")
+    (any_clause,) = _feed_conditions(tag_uuids=[tag], tag_mode="any")
+
+    assert _sql(all_clause) == _sql(any_clause)
+
+
+def test_folder_and_tags_combine_as_separate_semi_joins():
+    conditions = _feed_conditions(
+        folder_uuid=uuid4(), tag_uuids=[uuid4(), uuid4()], tag_mode="all"
+    )
+
+    assert len(conditions) == 2
+    assert "bookmarks_folders.folder_id" in _sql(conditions[0])
+    assert "HAVING count(*)" in _sql(conditions[1])
+
+
+def test_no_filters_add_no_clauses():
+    assert _feed_conditions() == []
+    assert _feed_conditions(tag_uuids=[], tag_mode="all") == []
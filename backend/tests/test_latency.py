@@ -0,0 +1,160 @@
+"""
+Latency histograms: bucketing, percentiles, and the Redis round trip.
+"""
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.utils import latency
+from src.utils.latency import LATENCY_BUCKETS_MS
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def hincrby(self, key, field, amount):
+        self.calls.append(("hincrby", key, field, amount))
+
+    def expire(self, key, ttl):
+        self.calls.append(("expire", key, ttl))
+
+    def hgetall(self, key):
+        self.calls.append(("hgetall", key))
+
+    async def execute(self):
+        results = []
+        for call in self.calls:
+            if call[0] == "hincrby":
+                _, key, field, amount = call
+                fields = self.redis.hashes.setdefault(key, {})
+                fields[field] = str(int(fields.get(field, 0)) + amount)
+                results.append(int(fields[field]))
+            elif call[0] == "hgetall":
+                results.append(dict(self.redis.hashes.get(call[1], {})))
+            else:
+                results.append(True)
+        return results
+
+
+class FakeRedis:
+    def __init__(self):
+        self.hashes = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeRedis()
+
+    async def get_redis():
+        return fake
+
+    monkeypatch.setattr(latency, "get_redis", get_redis)
+    monkeypatch.setattr(latency, "_get_duration_histogram", MagicMock)
+    latency._pending.clear()
+    yield fake
+    latency._pending.clear()
+
+
+def _counts(**by_bucket):
+    counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    for bucket, count in by_bucket.items():
+        counts[int(bucket.lstrip("b"))] = count
+    return counts
+
+
+def test_buckets_are_log_spaced():
+    assert LATENCY_BUCKETS_MS[0] == 1
+    assert LATENCY_BUCKETS_MS[4] == 2
+    assert LATENCY_BUCKETS_MS[40] == 1024
+    ratios = {
+        round(upper / lower, 2)
+        for lower, upper in zip(LATENCY_BUCKETS_MS, LATENCY_BUCKETS_MS[1:])
+    }
+    assert ratios <= {1.18, 1.19, 1.2}
+
+
+def test_percentiles_are_bucket_upper_bounds():
+    # 90 fast requests in the 2ms bucket, 9 at ~32ms, 1 at ~1s
+    counts = _counts(b4=90, b20=9, b40=1)
+
+    summary = latency._summary(counts)
+
+    assert summary == {
+        "count": 100,
+        "p50_ms": LATENCY_BUCKETS_MS[4],
+        "p95_ms": LATENCY_BUCKETS_MS[20],
+        "p99_ms": LATENCY_BUCKETS_MS[20],
+    }
+    assert latency._percentile(counts, 100, 1.0) == LATENCY_BUCKETS_MS[40]
+
+
+def test_overflow_reports_the_largest_bound():
+    counts = _counts(**{f"b{len(LATENCY_BUCKETS_MS)}": 3})
+
+    assert latency._summary(counts)["p50_ms"] == LATENCY_BUCKETS_MS[-1]
+
+
+def test_record_latency_counts_into_the_covering_bucket(redis):
+    latency.record_latency("GET /folders", "2xx", 2.0)
+    latency.record_latency("GET /folders", "2xx", 2.1)
+    latency.record_latency("GET /folders", "2xx", 10 ** 6)
+
+    counts = latency._pending[("GET /folders", "2xx")]
+    # the bound is inclusive: exactly 2ms lands in the 2ms bucket
+    assert counts[4] == 1
+    assert counts[5] == 1
+    assert counts[-1] == 1
+
+
+def test_flushed_counts_read_back_across_workers(redis):
+    for duration in [1.0] * 19 + [500.0]:
+        latency.record_latency("GET /folders", "2xx", duration)
+    latency.record_latency("POST /bookmarks", "5xx", 30.0)
+    asyncio.run(latency.flush_latencies())
+    assert not latency._pending
+
+    # a second worker flushing into the same minute adds to the counts
+    latency.record_latency("GET /folders", "2xx", 1.0)
+    asyncio.run(latency.flush_latencies())
+
+    routes = asyncio.run(latency.get_route_latencies())
+
+    assert [(item["route"], item["status_class"]) for item in routes] == [
+        ("GET /folders", "2xx"),
+        ("POST /bookmarks", "5xx"),
+    ]
+    folders = routes[0]
+    assert folders["count"] == 21
+    assert folders["p50_ms"] == 1
+    assert folders["p99_ms"] == LATENCY_BUCKETS_MS[36]  # 512ms covers 500ms
+    # 20 of the 22 requests took 1ms; the p95 rank falls on the 30ms one
+    assert asyncio.run(latency.get_overall_p95()) == LATENCY_BUCKETS_MS[20]
+
+
+def test_overall_p95_without_traffic(redis):
+    assert asyncio.run(latency.get_overall_p95()) == 0
+    assert asyncio.run(latency.get_route_latencies()) == []
+
+
+def test_flush_failure_is_logged_not_raised(redis, monkeypatch):
+    async def broken():
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(latency, "get_redis", broken)
+    latency.record_latency("GET /folders", "2xx", 1.0)
+
+    asyncio.run(latency.flush_latencies())
+
+    assert not latency._pending
@@ -0,0 +1,119 @@
+"""
+Hot-path log controls: event sampling, payload capping, and parsing of
+LOG_SAMPLE_RATES.
+"""
+import logging
+
+import pytest
+import structlog
+
+from src.utils import log
+from src.utils.log import LOG_MAX_VALUE_CHARS, cap_payloads, sample_events
+
+
+@pytest.fixture
+def rates(monkeypatch):
+    rates = {"cache.hit": 0.1}
+    monkeypatch.setattr(log, "LOG_SAMPLE_RATES", rates)
+    return rates
+
+
+def _roll(monkeypatch, value):
+    monkeypatch.setattr(log.random, "random", lambda: value)
+
+
+def test_sampled_event_is_dropped_above_the_rate(rates, monkeypatch):
+    _roll(monkeypatch, 0.1)
+
+    with pytest.raises(structlog.DropEvent):
+        sample_events(None, "debug", {"event": "cache.hit"})
+
+
+def test_kept_event_records_its_sample_rate(rates, monkeypatch):
+    _roll(monkeypatch, 0.05)
+
+    event = sample_events(None, "debug", {"event": "cache.hit", "key": "k"})
+
+    assert event == {"event": "cache.hit", "key": "k", "sample_rate": 0.1}
+
+
+@pytest.mark.parametrize("method", ["warning", "error", "exception", "critical"])
+def test_warnings_and_up_are_never_sampled(rates, monkeypatch, method):
+    _roll(monkeypatch, 0.99)
+
+    event = sample_events(None, method, {"event": "cache.hit"})
+
+    assert event == {"event": "cache.hit"}
+
+
+def test_unlisted_events_pass_untouched(rates, monkeypatch):
+    _roll(monkeypatch, 0.99)
+
+    assert sample_events(None, "info", {"event": "user.created"}) == {
+        "event": "user.created"
+    }
+
+
+def test_containers_are_rendered_bounded():
+    payload = {"data": [{"id": str(i), "text": "x" * 500} for i in range(50)]}
+
+    event = cap_payloads(None, "debug", {"event": "x_api.response", "payload": payload})
+
+    rendered = event["payload"]
+    assert rendered.startswith("{'data': [{'id': '0', 'text': 'xxx")
+    assert rendered.endswith(" chars)")
+    assert len(rendered) <= LOG_MAX_VALUE_CHARS + len("...(+9999 chars)")
+    assert event["event"] == "x_api.response"
+
+
+def test_small_containers_render_whole():
+    event = cap_payloads(None, "debug", {"event": "e", "ids": [1, 2, 3]})
+
+    assert event["ids"] == "[1, 2, 3]"
+
+
+def test_long_strings_are_cut_with_the_overflow_noted():
+    value = "a" * (LOG_MAX_VALUE_CHARS + 25)
+
+    event = cap_payloads(None, "info", {"event": "e", "body": value, "short": "ok"})
+
+    assert event["body"] == "a" * LOG_MAX_VALUE_CHARS + "...(+25 chars)"
+    assert event["short"] == "ok"
+
+
+def test_event_name_is_never_cut():
+    event = "e" * (LOG_MAX_VALUE_CHARS + 1)
+
+    assert cap_payloads(None, "info", {"event": event}) == {"event": event}
+
+
+def test_sample_rate_overrides_are_parsed(monkeypatch):
+    monkeypatch.setattr(
+        log.config, "LOG_SAMPLE_RATES", " cache.hit = 0.5 ,x_api.response=0, "
+    )
+
+    rates = log._sample_rates()
+
+    assert rates["cache.hit"] == 0.5
+    assert rates["x_api.response"] == 0
+    assert rates["cache.miss"] == log.DEFAULT_LOG_SAMPLE_RATES["cache.miss"]
+
+
+def test_malformed_sample_rates_are_skipped_and_clamped(monkeypatch, caplog):
+    monkeypatch.setattr(
+        log.config, "LOG_SAMPLE_RATES", "cache.hit=abc,=0.5,noise,slow=2,fast=-1"
+    )
+
+    with caplog.at_level(logging.WARNING, logger=log.__name__):
+        rates = log._sample_rates()
+
+    assert rates["cache.hit"] == log.DEFAULT_LOG_SAMPLE_RATES["cache.hit"]
+    assert "" not in rates
+    assert "noise" not in rates
+    assert rates["slow"] == 1.0
+    assert rates["fast"] == 0.0
+    assert [record.getMessage() for record in caplog.records] == [
+        "Ignoring malformed LOG_SAMPLE_RATES entry: 'cache.hit=abc'",
+        "Ignoring malformed LOG_SAMPLE_RATES entry: '=0.5'",
+        "Ignoring malformed LOG_SAMPLE_RATES entry: 'noise'",
+    ]
@@ -0,0 +1,154 @@
+"""
+drain_x_outbox_task: what happens to an outbox entry for each X outcome.
+
+The X SDK client, token lookup, session and outbox service are replaced;
+TwitterService's own payload checks run for real.
+"""
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.celery import task as task_module
+from src.v1.service import twitter as twitter_module
+from src.v1.service.outbox import (
+    OP_CREATE_BOOKMARK,
+    OP_DELETE_BOOKMARK,
+    OUTBOX_RATE_LIMIT_BACKOFF,
+)
+
+USER_ID = uuid4()
+
+
+def _entry(operation=OP_CREATE_BOOKMARK, tweet_id="111", attempts=0):
+    return SimpleNamespace(
+        id=uuid4(),
+        user_id=USER_ID,
+        operation=operation,
+        tweet_id=tweet_id,
+        attempts=attempts,
+    )
+
+
+def _x_error(status):
+    return {"title": "Error", "status": status, "detail": f"HTTP {status}"}
+
+
+@pytest.fixture
+def drain(monkeypatch):
+    db = object()
+
+    @asynccontextmanager
+    async def fake_session():
+        yield db
+
+    outbox = MagicMock()
+    outbox.complete = AsyncMock()
+    outbox.record_failure = AsyncMock()
+    outbox.defer = AsyncMock()
+    x_users = MagicMock()
+    front_sync = MagicMock()
+
+    monkeypatch.setattr(task_module, "get_async_db_session", fake_session)
+    monkeypatch.setattr(task_module, "outbox_service", outbox)
+    monkeypatch.setattr(
+        task_module,
+        "get_valid_tokens",
+        AsyncMock(return_value={"access_token": "token", "x_id": "42"}),
+    )
+    monkeypatch.setattr(task_module.twitter_service, "client", MagicMock(users=x_users))
+    monkeypatch.setattr(twitter_module, "record_x_call", AsyncMock())
+    # the drain runs on its own thread, where the shared_task proxies can
+    # resolve to another app's task objects, so the names themselves are replaced
+    drain_task = task_module.drain_x_outbox_task
+    monkeypatch.setattr(
+        task_module, "front_sync_bookmark_task", MagicMock(delay=front_sync)
+    )
+    monkeypatch.setattr(task_module, "drain_x_outbox_task", MagicMock())
+
+    def run(*entries):
+        outbox.claim_batch = AsyncMock(return_value=list(entries))
+        return drain_task.run()
+
+    return SimpleNamespace(
+        run=run, db=db, outbox=outbox, x_users=x_users, front_sync=front_sync
+    )
+
+
+def test_successful_writes_complete_and_sync(drain):
+    create, delete = _entry(), _entry(OP_DELETE_BOOKMARK, "222")
+    drain.x_users.create_bookmark.return_value = {"data": {"bookmarked": True}}
+    drain.x_users.delete_bookmark.return_value = {"data": {"bookmarked": False}}
+
+    result = drain.run(create, delete)
+
+    assert result == {"processed": 2, "done": 2}
+    assert [call.args[1] for call in drain.outbox.complete.await_args_list] == [
+        create.id,
+        delete.id,
+    ]
+    drain.outbox.record_failure.assert_not_awaited()
+    drain.front_sync.assert_called_once_with(str(USER_ID))
+
+
+def test_rate_limit_defers_the_rest_of_the_users_entries(drain):
+    first, second = _entry(), _entry(tweet_id="222")
+    drain.x_users.create_bookmark.return_value = _x_error(429)
+
+    result = drain.run(first, second)
+
+    assert result["done"] == 0
+    drain.outbox.defer.assert_awaited_once_with(
+        drain.db, [first.id, second.id], OUTBOX_RATE_LIMIT_BACKOFF
+    )
+    # a single call: the rest of the batch is not sent into the rate limit
+    assert drain.x_users.create_bookmark.call_count == 1
+    drain.outbox.complete.assert_not_awaited()
+    drain.outbox.record_failure.assert_not_awaited()
+    drain.front_sync.assert_not_called()
+
+
+@pytest.mark.parametrize("status", [400, 401, 403, 404])
+def test_client_errors_fail_the_entry_permanently(drain, status):
+    entry = _entry(attempts=2)
+    drain.x_users.create_bookmark.return_value = _x_error(status)
+
+    result = drain.run(entry)
+
+    assert result["done"] == 0
+    drain.outbox.complete.assert_not_awaited()
+    args, kwargs = drain.outbox.record_failure.await_args
+    assert args[1:3] == (entry.id, 2)
+    assert str(status) in args[3]
+    assert kwargs == {"permanent": True}
+    drain.front_sync.assert_not_called()
+
+
+def test_server_errors_are_retried_with_backoff(drain):
+    entry = _entry(OP_DELETE_BOOKMARK)
+    drain.x_users.delete_bookmark.return_value = _x_error(503)
+
+    drain.run(entry)
+
+    drain.outbox.complete.assert_not_awaited()
+    assert drain.outbox.record_failure.await_args.kwargs == {"permanent": False}
+    # the drain disables tenacity's in-process retries
+    assert drain.x_users.delete_bookmark.call_count == 1
+
+
+def test_missing_tokens_fail_every_entry_of_the_user(drain, monkeypatch):
+    monkeypatch.setattr(task_module, "get_valid_tokens", AsyncMock(return_value=None))
+    first, second = _entry(), _entry(tweet_id="222")
+
+    drain.run(first, second)
+
+    assert [
+        call.args[1] for call in drain.outbox.record_failure.await_args_list
+    ] == [first.id, second.id]
+    drain.x_users.create_bookmark.assert_not_called()
+
+
+def test_empty_outbox(drain):
+    assert drain.run() == {"processed": 0}
@@ -0,0 +1,96 @@
+import { authStore } from '@/store/auth'
+
+const BASE_URL = import.meta.env.VITE_API_BASE_URL ?? '/api/v1'
+
+// Reconnect delay grows from 1s to 30s while the stream keeps failing
+const MIN_RETRY_MS = 1000
+const MAX_RETRY_MS = 30000
+
+export interface LibraryEvent {
+  event: string
+  data: Record<string, unknown>
+}
+
+let connected = false
+
+// True while GET /client/events is open, so callers can skip polling
+export function isEventStreamOpen() {
+  return connected
+}
+
+function parseFrame(frame: string): (LibraryEvent & { id?: string }) | null {
+  let event = 'message'
+  let id: string | undefined
+  const data: string[] = []
+  for (const line of frame.split('\n')) {
+    if (line.startsWith(':')) continue // keep-alive comment
+    const sep = line.indexOf(':')
+    const field = sep === -1 ? line : line.slice(0, sep)
+    const value = sep === -1 ? '' : line.slice(sep + 1).replace(/^ /, '')
+    if (field === 'event') event = value
+    else if (field === 'id') id = value
+    else if (field === 'data') data.push(value)
+  }
+  if (!data.length) return null
+  try {
+    return { event, id, data: JSON.parse(data.join('\n')) }
+  } catch {
+    return null
+  }
+}
+
+/**
+ * Listen to the user's library events (ready, data_changed, sync_completed,
+ * sync_failed). EventSource cannot send the Authorization header, so the
+ * stream is read with fetch. Reconnects with backoff, resuming from the last
+ * event id, until `signal` aborts.
+ */
+export async function listenToLibraryEvents(
+  onEvent: (event: LibraryEvent) => void,
+  signal: AbortSignal,
+) {
+  let lastEventId: string | undefined
+  let retryMs = MIN_RETRY_MS
+
+  while (!signal.aborted) {
+    try {
+      const headers: Record<string, string> = { Accept: 'text/event-stream' }
+      const token = authStore.getAccessToken()
+      if (token) headers.Authorization = `Bearer ${token}`
+      if (lastEventId) headers['Last-Event-ID'] = lastEventId
+
+      const res = await fetch(`${BASE_URL}/client/events`, { headers, signal })
+      if (!res.ok || !res.body) throw new Error(`event stream: HTTP ${res.status}`)
+
+      connected = true
+      retryMs = MIN_RETRY_MS
+      const reader = res.body.pipeThrough(new TextDecoderStream()).getReader()
+      let buffer = ''
+      for (;;) {
+        const { value, done } = await reader.read()
+        if (done) break
+        buffer += value.replace(/\r\n/g, '\n')
+        let end = buffer.indexOf('\n\n')
+        while (end !== -1) {
+          const parsed = parseFrame(buffer.slice(0, end))
+          buffer = buffer.slice(end + 2)
+          if (parsed) {
+            if (parsed.id) lastEventId = parsed.id
+            onEvent({ event: parsed.event, data: parsed.data })
+          }
+          end = buffer.indexOf('\n\n')
+        }
+      }
+    } catch {
+      // fall through to the reconnect below (also reached on abort)
+    } finally {
+      connected = false
+    }
+
+    if (signal.aborted) return
+    // An expired access token is refreshed by the axios client on the next
+    // API call; the retry then picks up the new token from authStore.
+    await new Promise(resolve => setTimeout(resolve, retryMs))
+    retryMs = Math.min(retryMs * 2, MAX_RETRY_MS)
+  }
+}
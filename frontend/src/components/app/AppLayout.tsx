@@ -1,8 +1,12 @@
 import { Outlet } from 'react-router-dom'
 import { SidebarProvider, SidebarInset } from '@/components/ui/sidebar'
 import AppSidebar from './AppSidebar'
+import { useLibraryEvents } from '@/features/bookmarks/hooks'
+
+// libraryEvents: refetch on server-sent library changes (user dashboard only)
+export default function AppLayout({ libraryEvents = false }: { libraryEvents?: boolean }) {
+  useLibraryEvents(libraryEvents)
 
-export default function AppLayout() {
   return (
     <SidebarProvider defaultOpen={true}>
       <AppSidebar />
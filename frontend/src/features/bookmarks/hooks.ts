@@ -1,5 +1,7 @@
+import { useEffect } from 'react'
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query'
 import client from '@/api/client'
+import { isEventStreamOpen, listenToLibraryEvents } from '@/api/events'
 import type {
   Bookmark,
   Folder,
@@ -765,6 +767,29 @@ export function useSyncStatus() {
   })
 }
 
+// ── Library events (SSE) ──────────────────────────────────────────
+// Refetches when the server reports a change, instead of polling.
+// Mounted once by AppLayout for the signed-in user's dashboard.
+export function useLibraryEvents(enabled = true) {
+  const qc = useQueryClient()
+
+  useEffect(() => {
+    if (!enabled) return
+    const controller = new AbortController()
+    listenToLibraryEvents(({ event }) => {
+      if (event === 'data_changed') {
+        qc.invalidateQueries({ queryKey: bookmarkKeys.all })
+        qc.invalidateQueries({ queryKey: bookmarkKeys.folders })
+        qc.invalidateQueries({ queryKey: bookmarkKeys.tags })
+      } else if (event === 'sync_completed' || event === 'sync_failed') {
+        qc.invalidateQueries({ queryKey: ['sync-status'] })
+        qc.invalidateQueries({ queryKey: bookmarkKeys.lists() })
+      }
+    }, controller.signal)
+    return () => controller.abort()
+  }, [qc, enabled])
+}
+
 // ── Manual Sync ───────────────────────────────────────────────────
 export function useManualSync() {
   const qc = useQueryClient()
@@ -775,8 +800,10 @@ export function useManualSync() {
       return res.data
     },
     onSuccess: (data) => {
+      // With the event stream open, sync_completed triggers the refetch
+      // (useLibraryEvents); poll sync-status only as a fallback.
       const lastSyncBefore = data.last_sync_time
-      if (!lastSyncBefore) {
+      if (!lastSyncBefore || isEventStreamOpen()) {
         return
       }
 
@@ -33,7 +33,7 @@ export default function Router() {
           path="/dashboard"
           element={
             <ProtectedRoute>
-              <AppLayout />
+              <AppLayout libraryEvents />
             </ProtectedRoute>
           }
         >